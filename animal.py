@@ -8,9 +8,22 @@ This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
 from abc import ABC, abstractmethod
-import uuid
+import ids
 
 import helper
+from codes import Environment, SPECIES
+from locks import ANIMAL_LOCKS
+
+
+# Fields checked when creating an Animal, in constructor order
+ANIMAL_SCHEMA = helper.Schema(
+    helper.Field("name"),
+    helper.Field("species"),
+    helper.Field("age", "int", minimum=0, maximum=250, label="Age"),
+    helper.Field("diet"),
+    helper.Field("environment", "code", Environment),
+    helper.Field("is_healthy", "bool"),
+)
 
 
 class Animal(ABC):
@@ -21,34 +34,44 @@ class Animal(ABC):
     and basic behaviours like eating and sleeping.
     """
 
+    # Fixed attribute slots instead of a per-instance __dict__ (saves memory
+    # when the zoo holds many animals). Double-underscore names are mangled
+    # to _Animal__name etc., matching the private attributes below.
+    __slots__ = (
+        "_id", "__name", "__species", "__species_code", "__age", "__diet", "__environment",
+        "__is_healthy", "_table", "__weakref__",
+    )
+
     def __init__(self, name, species, age, diet, environment, is_healthy):
         """
         Create a new Animal after validating the input values.
         Raises ValueError if any value is invalid.
         """
         # Each animal gets a unique ID so it can be tracked in the system.
-        self._id = uuid.uuid4()
-
-        # Validate inputs before assigning them.
-        if (
-            helper.validate_string(name, "name")
-            and helper.validate_string(species, "species")
-            and helper.validate_age(age)
-            and helper.validate_string(diet, "diet")
-            and helper.validate_environment(environment, "environment")
-            and helper.validate_bool(is_healthy, "is_healthy")
-        ):
-            # Use stripped versions of string values to avoid extra spaces.
-            self.__name = name.strip()
-            self.__species = species.strip()
-            self.__age = age
-            self.__diet = diet.strip()
-            self.__environment = environment.strip()
-            self.__is_healthy = is_healthy
-        else:
+        self._id = ids.new_id()
+
+        # Validate and normalise all inputs in one pass (strings come back stripped).
+        values, errors = ANIMAL_SCHEMA.check(name, species, age, diet, environment, is_healthy)
+        if errors:
             # If any validation failed, do not create a half-valid object.
+            helper.report_errors(errors)
             raise ValueError("Invalid attribute values provided when creating Animal.")
 
+        (
+            self.__name,
+            self.__species,
+            self.__age,
+            self.__diet,
+            self.__environment,
+            self.__is_healthy,
+        ) = values
+
+        # Interned species code, so species comparisons are integer equality
+        self.__species_code = SPECIES.code(self.__species)
+
+        # AnimalTable holding a columnar copy of this animal, if any
+        self._table = None
+
     def eat(self):
         """Return a message describing the animal eating."""
         return f"{self.__name} is eating {self.__diet}."
@@ -59,7 +82,7 @@ class Animal(ABC):
 
     def heal(self):
         """Mark the animal as healthy again."""
-        self.__is_healthy = True
+        self.is_healthy = True
 
     @abstractmethod
     def make_sound(self):
@@ -96,8 +119,16 @@ class Animal(ABC):
 
     @property
     def environment(self):
+        return self.__environment.label
+
+    @property
+    def environment_code(self) -> Environment:
         return self.__environment
 
+    @property
+    def species_code(self) -> int:
+        return self.__species_code
+
     @is_healthy.setter
     def is_healthy(self, value):
         """
@@ -107,7 +138,12 @@ class Animal(ABC):
         """
         if not isinstance(value, bool):
             raise TypeError("is_healthy must be a boolean value.")
-        self.__is_healthy = value
+        # Locked so the flag and the table row cannot be left disagreeing
+        # when several threads update the same animal
+        with ANIMAL_LOCKS.for_key(self._id):
+            self.__is_healthy = value
+            if self._table is not None:
+                self._table._healthy_changed(self, value)
 
     def __str__(self):
         """
@@ -119,6 +155,6 @@ class Animal(ABC):
             f"Animal species: {self.__species}\n"
             f"Animal age: {self.__age}\n"
             f"Animal diet: {self.__diet}\n"
-            f"Animal environment: {self.__environment}\n"
+            f"Animal environment: {self.__environment.label}\n"
             f"Animal is healthy: {self.__is_healthy}\n"
         )
\ No newline at end of file
@@ -0,0 +1,217 @@
+'''
+File: animal_table.py
+Description: Defines the AnimalTable class, an optional NumPy column store for census queries.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+from codes import Environment, SPECIES
+
+
+def _numpy():
+    """Import NumPy on first use, since it is an optional dependency."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("AnimalTable needs NumPy. Install it with 'pip install numpy'.") from e
+    return numpy
+
+
+class _Symbols:
+    """Maps strings to small integer codes and back (e.g. diets)."""
+
+    def __init__(self):
+        self.codes: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def code(self, name: str) -> int:
+        """Return the code for a name, adding it if it is new."""
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+class AnimalTable:
+    """
+    Columnar copy of the zoo's animals for fast census-style queries.
+
+    Age, health flag and the encoded environment, species and diet of every
+    animal are kept in NumPy arrays, one row per animal, so filters and
+    aggregates run as array operations instead of reading properties one
+    object at a time. The Animal objects stay the source of truth: each
+    bound animal reports health changes back to its row, and query results
+    are returned as the Animal objects themselves.
+
+    Rows are kept dense: removing an animal moves the last row into the gap,
+    so results come back in table order rather than insertion order.
+    """
+
+    def __init__(self, animals=(), capacity: int = 1024):
+        np = _numpy()
+        self.__np = np
+        capacity = max(1, capacity)
+        self.__size = 0
+        self.__age = np.empty(capacity, dtype=np.int16)
+        self.__healthy = np.empty(capacity, dtype=np.bool_)
+        self.__environment = np.empty(capacity, dtype=np.int8)
+        self.__species = np.empty(capacity, dtype=np.int32)
+        self.__diet = np.empty(capacity, dtype=np.int32)
+
+        # Row number -> Animal, and animal id -> row number
+        self.__animals: list = []
+        self.__rows: dict = {}
+
+        # Environment and species reuse the animals' own codes
+        self.__diets = _Symbols()
+
+        self.extend(animals)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __contains__(self, animal) -> bool:
+        return self.__rows.get(getattr(animal, "id", None)) is not None
+
+    # Keeping the table in step with the zoo
+
+    def __grow(self) -> None:
+        np = self.__np
+        capacity = len(self.__age) * 2
+        for name in ("age", "healthy", "environment", "species", "diet"):
+            attr = f"_AnimalTable__{name}"
+            old = getattr(self, attr)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self.__size] = old[: self.__size]
+            setattr(self, attr, new)
+
+    def add(self, animal) -> None:
+        """Add a row for an animal and bind the animal to it."""
+        if animal.id in self.__rows:
+            return
+        if animal._table is not None and animal._table is not self:
+            raise ValueError(f"{animal.name} already belongs to another AnimalTable.")
+        if self.__size == len(self.__age):
+            self.__grow()
+
+        row = self.__size
+        self.__age[row] = animal.age
+        self.__healthy[row] = animal.is_healthy
+        self.__environment[row] = animal.environment_code
+        self.__species[row] = animal.species_code
+        self.__diet[row] = self.__diets.code(animal.diet.lower())
+        self.__animals.append(animal)
+        self.__rows[animal.id] = row
+        self.__size += 1
+        animal._table = self
+
+    def extend(self, animals) -> None:
+        """Add rows for many animals, filling the columns in one array write each."""
+        new = []
+        seen = set()
+        for animal in animals:
+            if animal.id in self.__rows or animal.id in seen:
+                continue
+            if animal._table is not None and animal._table is not self:
+                raise ValueError(f"{animal.name} already belongs to another AnimalTable.")
+            seen.add(animal.id)
+            new.append(animal)
+        if not new:
+            return
+
+        while self.__size + len(new) > len(self.__age):
+            self.__grow()
+
+        np = self.__np
+        diet_code = self.__diets.code
+        start, stop = self.__size, self.__size + len(new)
+        self.__age[start:stop] = np.fromiter((a.age for a in new), dtype=np.int16, count=len(new))
+        self.__healthy[start:stop] = np.fromiter((a.is_healthy for a in new), dtype=np.bool_, count=len(new))
+        self.__environment[start:stop] = np.fromiter(
+            (a.environment_code for a in new), dtype=np.int8, count=len(new)
+        )
+        self.__species[start:stop] = np.fromiter(
+            (a.species_code for a in new), dtype=np.int32, count=len(new)
+        )
+        self.__diet[start:stop] = np.fromiter(
+            (diet_code(a.diet.lower()) for a in new), dtype=np.int32, count=len(new)
+        )
+        for row, animal in enumerate(new, start):
+            self.__rows[animal.id] = row
+            animal._table = self
+        self.__animals.extend(new)
+        self.__size = stop
+
+    def discard(self, animal) -> None:
+        """Remove an animal's row, if it has one, and unbind the animal."""
+        row = self.__rows.pop(animal.id, None)
+        if row is None:
+            return
+        last = self.__size - 1
+        if row != last:
+            # Move the last row into the gap to keep the columns dense
+            for column in (self.__age, self.__healthy, self.__environment, self.__species, self.__diet):
+                column[row] = column[last]
+            moved = self.__animals[last]
+            self.__animals[row] = moved
+            self.__rows[moved.id] = row
+        self.__animals.pop()
+        self.__size = last
+        animal._table = None
+
+    def _healthy_changed(self, animal, value: bool) -> None:
+        """Called by a bound Animal when its health flag changes."""
+        row = self.__rows.get(animal.id)
+        if row is not None:
+            self.__healthy[row] = value
+
+    # Queries
+
+    def mask(self, environment=None, species=None, healthy=None, min_age=None, max_age=None):
+        """Return a boolean NumPy array selecting the rows that match every given filter."""
+        np = self.__np
+        n = self.__size
+        mask = np.ones(n, dtype=np.bool_)
+        if environment is not None:
+            code = Environment.lookup(environment)
+            if code is None:
+                return np.zeros(n, dtype=np.bool_)
+            mask &= self.__environment[:n] == code
+        if species is not None:
+            code = SPECIES.lookup(species)
+            if code is None:
+                return np.zeros(n, dtype=np.bool_)
+            mask &= self.__species[:n] == code
+        if healthy is not None:
+            mask &= self.__healthy[:n] == bool(healthy)
+        if min_age is not None:
+            mask &= self.__age[:n] >= min_age
+        if max_age is not None:
+            mask &= self.__age[:n] <= max_age
+        return mask
+
+    def filter(self, **filters) -> list:
+        """Return the animals matching the filters (see mask())."""
+        animals = self.__animals
+        return [animals[i] for i in self.__np.flatnonzero(self.mask(**filters))]
+
+    def count(self, **filters) -> int:
+        """Return how many animals match the filters (see mask())."""
+        return int(self.__np.count_nonzero(self.mask(**filters)))
+
+    def mean_age_by_species(self, **filters) -> dict[str, float]:
+        """Return the mean age per (lower-case) species among the matching animals."""
+        np = self.__np
+        mask = self.mask(**filters)
+        n_species = len(SPECIES)
+        species = self.__species[: self.__size][mask]
+        totals = np.bincount(species, weights=self.__age[: self.__size][mask], minlength=n_species)
+        counts = np.bincount(species, minlength=n_species)
+        return {
+            SPECIES.name(code).lower(): float(totals[code] / counts[code])
+            for code in range(n_species)
+            if counts[code]
+        }
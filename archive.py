@@ -0,0 +1,76 @@
+'''
+File: archive.py
+Description: Cold storage for the health records of animals that have left the zoo.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import json
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+
+# Plain-data copy of a HealthRecord. It holds no reference to the Animal or
+# the Veterinarian, so archiving a record lets both be garbage collected.
+ArchivedRecord = namedtuple(
+    "ArchivedRecord",
+    (
+        "record_id", "animal_id", "animal_name", "species", "issue", "severity",
+        "date_reported", "reported_on", "notes", "active",
+    ),
+)
+
+
+def archive_record(record) -> ArchivedRecord:
+    """Make an ArchivedRecord from a HealthRecord. Notes become (ISO timestamp, text) pairs."""
+    animal = record.animal
+    return ArchivedRecord(
+        record.id, animal.id, animal.name, animal.species, record.issue, record.severity,
+        record.date_reported, record.reported_on,
+        tuple((entry.timestamp.isoformat(), entry.text) for entry in record.iter_notes()),
+        record.active,
+    )
+
+
+class RecordArchive(ABC):
+    """Base class for record archives. store() receives the records of one released animal."""
+
+    @abstractmethod
+    def store(self, records) -> None:
+        """Keep the given records."""
+
+
+class MemoryArchive(RecordArchive):
+    """Keep archived records in memory as compact tuples, grouped by animal id."""
+
+    def __init__(self):
+        self.__by_animal: dict[object, list[ArchivedRecord]] = {}
+
+    def store(self, records) -> None:
+        for record in records:
+            archived = archive_record(record)
+            self.__by_animal.setdefault(archived.animal_id, []).append(archived)
+
+    def records_for(self, animal_id) -> list[ArchivedRecord]:
+        """Return the archived records of an animal, oldest first as they were stored."""
+        return list(self.__by_animal.get(animal_id, ()))
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self.__by_animal.values())
+
+
+class JsonLinesArchive(RecordArchive):
+    """Append one JSON object per archived record to an open text file."""
+
+    def __init__(self, file):
+        self.file = file
+
+    def store(self, records) -> None:
+        for record in records:
+            data = archive_record(record)._asdict()
+            # ids may be UUIDs or ints; keep them readable either way
+            data["record_id"] = str(data["record_id"])
+            data["animal_id"] = str(data["animal_id"])
+            self.file.write(json.dumps(data) + "\n")
@@ -0,0 +1,61 @@
+'''
+File: bench_bulk_ingest.py
+Description: Benchmark for Zoo.add_animals, checking that bulk ingestion scales linearly.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+
+Run from the repository root:
+    python -m benchmarks.bench_bulk_ingest [--sizes 1000 10000 100000 1000000]
+'''
+
+import argparse
+import sys
+import time
+
+from mammal import Mammal
+from zoo import Zoo
+
+
+def make_animals(n: int) -> list[Mammal]:
+    """Build n valid animals (not timed)."""
+    return [Mammal(f"Lion {i}", "Lion", i % 30, "Meat", "savannah", True) for i in range(n)]
+
+
+def time_add_animals(n: int) -> float:
+    """Return the seconds taken by one Zoo.add_animals call with n animals."""
+    animals = make_animals(n)
+    zoo = Zoo("Benchmark Zoo")
+    start = time.perf_counter()
+    result = zoo.add_animals(animals)
+    elapsed = time.perf_counter() - start
+    assert len(result.added) == n
+    return elapsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument(
+        "--max-ratio", type=float, default=3.0,
+        help="fail if per-animal cost at the largest size exceeds the smallest by this factor",
+    )
+    args = parser.parse_args(argv)
+
+    per_item = []
+    for n in args.sizes:
+        elapsed = time_add_animals(n)
+        per_item.append(elapsed / n)
+        print(f"{n:>10} animals: {elapsed:8.3f}s  ({elapsed / n * 1e6:6.2f} us/animal)", file=sys.stderr)
+
+    ratio = per_item[-1] / per_item[0]
+    print(f"per-animal cost ratio (largest/smallest): {ratio:.2f}", file=sys.stderr)
+    if ratio > args.max_ratio:
+        print(f"FAIL: bulk ingestion is not scaling linearly (ratio > {args.max_ratio})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+'''
+File: bench_census.py
+Description: Benchmark comparing census queries with and without the NumPy animal table.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+
+Run from the repository root (needs NumPy):
+    python -m benchmarks.bench_census [--rows 1000000]
+
+Use --rows 10000000 for the full-size run; building that many Animal
+objects takes a while and several GB of memory.
+'''
+
+import argparse
+import random
+import sys
+import time
+
+import helper
+from events import NullSink
+from mammal import Mammal
+from zoo import Zoo
+
+SPECIES = ["Lion", "Zebra", "Giraffe", "Elephant", "Hippo", "Gorilla", "Penguin", "Seal"]
+
+
+def build_zoo(rows: int, seed: int = 1) -> Zoo:
+    """Build a silent zoo with rows random animals."""
+    rng = random.Random(seed)
+    zoo = Zoo("Census Zoo", sink=NullSink())
+    zoo.add_animals(
+        Mammal(
+            f"Animal {i}", rng.choice(SPECIES), rng.randint(0, 40), "Food",
+            rng.choice(helper.VALID_ENVIRONMENTS), rng.random() < 0.9,
+        )
+        for i in range(rows)
+    )
+    return zoo
+
+
+def run_queries(zoo: Zoo) -> float:
+    """Run the sample census queries once. Return the seconds taken."""
+    start = time.perf_counter()
+    zoo.count_animals(environment="savannah", healthy=False, min_age=10)
+    zoo.find_animals(species="lion", healthy=False)
+    zoo.mean_age_by_species()
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Census query benchmark.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    zoo = build_zoo(args.rows)
+    print(f"built {args.rows} animals in {time.perf_counter() - start:.1f}s")
+
+    loop = run_queries(zoo)
+    print(f"object loop:  {loop * 1000:9.1f} ms")
+
+    start = time.perf_counter()
+    zoo.enable_animal_table()
+    print(f"table build:  {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    table = run_queries(zoo)
+    print(f"animal table: {table * 1000:9.1f} ms  ({loop / table:.0f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
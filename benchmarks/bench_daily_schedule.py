@@ -0,0 +1,71 @@
+'''
+File: bench_daily_schedule.py
+Description: Benchmark comparing the per-object daily schedule with the batch one.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+
+Run from the repository root:
+    python -m benchmarks.bench_daily_schedule [--enclosures 20000] [--animals-per-enclosure 10]
+'''
+
+import argparse
+import sys
+import time
+
+from enclosure import Enclosure
+import events
+from mammal import Mammal
+from zoo import Zoo
+from zookeeper import Zookeeper
+
+
+def build_zoo(enclosures: int, per_enclosure: int, keepers: int) -> Zoo:
+    """Build a silent zoo; each zookeeper shares a slice of the enclosures (not timed)."""
+    zoo = Zoo("Schedule Zoo")
+    built = []
+    for i in range(enclosures):
+        enclosure = Enclosure(per_enclosure * 100, "savannah")
+        for j in range(per_enclosure):
+            enclosure.add_animal(Mammal(f"Lion {i}-{j}", "Lion", 5, "Meat", "savannah", True))
+        built.append(enclosure)
+    zoo.add_enclosures(built)
+    for k in range(keepers):
+        keeper = Zookeeper(f"Keeper {k}")
+        keeper.assign_enclosures(built[k::keepers])
+        zoo.add_staff(keeper)
+    return zoo
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Per-object vs batch daily schedule.")
+    parser.add_argument("--enclosures", type=int, default=20_000)
+    parser.add_argument("--animals-per-enclosure", type=int, default=10)
+    parser.add_argument("--keepers", type=int, default=50)
+    parser.add_argument("--days", type=int, default=5)
+    args = parser.parse_args(argv)
+    events.set_default_sink(events.BufferedSink(maxlen=100))
+
+    zoo = build_zoo(args.enclosures, args.animals_per_enclosure, args.keepers)
+    start = time.perf_counter()
+    for _ in range(args.days):
+        zoo.schedule_daily_feeding()
+        zoo.schedule_daily_cleaning()
+    per_object = (time.perf_counter() - start) / args.days
+
+    for use_numpy in (False, None):
+        zoo = build_zoo(args.enclosures, args.animals_per_enclosure, args.keepers)
+        start = time.perf_counter()
+        for _ in range(args.days):
+            zoo.run_batch_daily_schedule(use_numpy=use_numpy)
+        batch = (time.perf_counter() - start) / args.days
+        label = "batch (pure Python)" if use_numpy is False else "batch (NumPy if installed)"
+        print(f"{label:<28}{batch * 1000:8.1f} ms/day", file=sys.stderr)
+
+    print(f"{'per-object':<28}{per_object * 1000:8.1f} ms/day", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+'''
+File: bench_import.py
+Description: Startup benchmark that enforces an import-time budget for the zoo modules.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+
+Run from the repository root:
+    python -m benchmarks.bench_import [--budget-ms 60] [--runs 7]
+
+Each run imports the modules in a fresh interpreter, so nothing is cached
+in sys.modules. The run also fails if importing prints anything, since
+imports must not have side effects.
+'''
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules a worker imports on a cold start
+MODULES = ["zoo", "mammal", "bird", "reptile"]
+
+_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "{imports}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "sys.stderr.write(repr(elapsed))\n"
+)
+
+
+def measure_once(modules: list[str]) -> tuple[float, str]:
+    """Import the modules in a new interpreter. Return (seconds, captured stdout)."""
+    code = _PROBE.format(imports="\n".join(f"import {m}" for m in modules))
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+    )
+    return float(proc.stderr.strip().splitlines()[-1]), proc.stdout
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time budget check.")
+    parser.add_argument("--budget-ms", type=float, default=60.0)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    timings = []
+    for _ in range(args.runs):
+        elapsed, out = measure_once(MODULES)
+        if out:
+            print(f"FAIL: importing {MODULES} printed output:\n{out}", file=sys.stderr)
+            return 1
+        timings.append(elapsed * 1000)
+
+    median = statistics.median(timings)
+    print(f"import {', '.join(MODULES)}: median {median:.1f} ms "
+          f"(min {min(timings):.1f} ms, budget {args.budget_ms:.1f} ms)")
+    if median > args.budget_ms:
+        print("FAIL: import-time budget exceeded", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+'''
+File: bench_memory.py
+Description: Memory footprint benchmark for the core domain objects and a populated Zoo.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory [--sizes 1000 100000 1000000]
+    python -m benchmarks.bench_memory --update-baseline
+
+For each zoo size every case runs in a fresh Python process, so the peak
+RSS reported is that case's own. Bytes per object come from tracemalloc
+and are compared with benchmarks/memory_baseline.json: the run fails if any
+case grows by more than --threshold (10% by default). Peak RSS depends on
+the interpreter and the host, so it is reported but not checked.
+'''
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+BASELINE = os.path.join(os.path.dirname(__file__), "memory_baseline.json")
+
+# Zoo shape used for every size: roughly what a real zoo looks like
+ANIMALS_PER_ENCLOSURE = 20
+ANIMALS_PER_VET = 500
+RECORDS_PER_ANIMAL = 0.3
+
+CASES = ("Animal", "Enclosure", "HealthRecord", "Zoo")
+
+SPECIES = [
+    ("Lion", "savannah"), ("Zebra", "savannah"), ("Gorilla", "jungle"), ("Penguin", "arctic"),
+    ("Camel", "desert"), ("Seal", "aquatic"), ("Bear", "forest"), ("Goat", "mountain"),
+]
+
+
+def make_animals(n: int, rng: random.Random) -> list:
+    """Build n animals, a mix of mammals, birds and reptiles."""
+    from bird import Bird
+    from mammal import Mammal
+    from reptile import Reptile
+
+    animals = []
+    for i in range(n):
+        species, environment = SPECIES[i % len(SPECIES)]
+        age = rng.randint(0, 40)
+        healthy = rng.random() < 0.9
+        kind = i % 3
+        if kind == 0:
+            animals.append(Mammal(f"Animal {i}", species, age, "Meat", environment, healthy))
+        elif kind == 1:
+            animals.append(Bird(f"Animal {i}", species, age, "Seeds", environment, healthy))
+        else:
+            animals.append(Reptile(f"Animal {i}", species, age, "Insects", environment, healthy))
+    return animals
+
+
+def make_enclosures(animals: list) -> list:
+    """House the animals in enclosures of one species each."""
+    from enclosure import Enclosure
+
+    by_species: dict[str, list] = {}
+    for animal in animals:
+        by_species.setdefault(animal.species, []).append(animal)
+
+    enclosures = []
+    for group in by_species.values():
+        for start in range(0, len(group), ANIMALS_PER_ENCLOSURE):
+            chunk = group[start:start + ANIMALS_PER_ENCLOSURE]
+            # 100 square metres per animal
+            enclosure = Enclosure(ANIMALS_PER_ENCLOSURE * 100, chunk[0].environment)
+            for animal in chunk:
+                enclosure.add_animal(animal)
+            enclosures.append(enclosure)
+    return enclosures
+
+
+def make_vets(animals: list) -> list:
+    """Assign the animals to vets, ANIMALS_PER_VET each."""
+    from veterinarian import Veterinarian
+
+    vets = []
+    for start in range(0, len(animals), ANIMALS_PER_VET):
+        vet = Veterinarian(f"Vet {start // ANIMALS_PER_VET}")
+        vet.assign_animals(animals[start:start + ANIMALS_PER_VET])
+        vets.append(vet)
+    return vets
+
+
+def make_records(vets: list, animals: list, rng: random.Random) -> list:
+    """Give about RECORDS_PER_ANIMAL records to each animal, kept by its vet."""
+    from health_record import HealthRecord
+
+    records = []
+    for i in rng.sample(range(len(animals)), int(len(animals) * RECORDS_PER_ANIMAL)):
+        record = HealthRecord(
+            animals[i], "illness", rng.choice(("low", "medium", "high")),
+            f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/2025", "Observed and treated.",
+            rng.random() < 0.5,
+        )
+        vets[i // ANIMALS_PER_VET].add_record(record)
+        records.append(record)
+    return records
+
+
+def measure(case: str, size: int) -> dict:
+    """Build one case in this process. Return bytes per object and peak RSS."""
+    import events
+    events.set_default_sink(events.NullSink())
+    rng = random.Random(size)
+
+    # Warm up: import every module and fill the interning tables before
+    # tracing, so only the objects themselves are counted
+    warm = make_animals(len(SPECIES) * 3, random.Random(0))
+    make_records(make_vets(warm), warm, random.Random(0))
+    import zoo as _zoo_module  # noqa: F401
+
+    # Objects the case needs but does not own are built before tracing starts
+    animals = None if case in ("Animal", "Zoo") else make_animals(size, rng)
+    vets = make_vets(animals) if case == "HealthRecord" else None
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    if case == "Animal":
+        kept = make_animals(size, rng)
+        count = size
+    elif case == "Enclosure":
+        kept = make_enclosures(animals)
+        count = len(kept)
+    elif case == "HealthRecord":
+        kept = make_records(vets, animals, rng)
+        count = len(kept)
+    else:
+        from zoo import Zoo
+        memory_zoo = Zoo("Memory Zoo")
+        animals = make_animals(size, rng)
+        memory_zoo.add_animals(animals)
+        memory_zoo.add_enclosures(make_enclosures(animals))
+        vets = make_vets(animals)
+        make_records(vets, animals, rng)
+        memory_zoo.add_staff_many(vets)
+        del animals, vets
+        kept = memory_zoo
+        # A zoo is measured per animal it holds
+        count = size
+    elapsed = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_bytes = peak if sys.platform == "darwin" else peak * 1024
+    del kept
+    return {
+        "case": case,
+        "size": size,
+        "objects": count,
+        "bytes_per_object": round(allocated / count, 1),
+        "peak_rss_mb": round(peak_bytes / 2 ** 20, 1),
+        "seconds": round(elapsed, 2),
+    }
+
+
+def run_case(case: str, size: int) -> dict:
+    """Run measure() in a child process so peak RSS belongs to this case alone."""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_memory", "--child", case, str(size)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """Return one message per case whose bytes per object grew beyond the threshold."""
+    failures = []
+    for result in results:
+        key = f"{result['case']}/{result['size']}"
+        expected = baseline.get(key)
+        if expected is None:
+            continue
+        limit = expected * (1 + threshold)
+        if result["bytes_per_object"] > limit:
+            failures.append(
+                f"{key}: {result['bytes_per_object']:.1f} bytes/object, "
+                f"baseline {expected:.1f} (limit {limit:.1f})"
+            )
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Memory footprint of domain objects.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed growth over the baseline bytes/object (0.10 = 10%%)")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="record this run as the new baseline instead of checking it")
+    parser.add_argument("--child", nargs=2, metavar=("CASE", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        case, size = args.child
+        print(json.dumps(measure(case, int(size))))
+        return 0
+
+    results = []
+    print(f"{'case':<14}{'size':>10}{'objects':>10}{'bytes/obj':>12}{'peak RSS':>12}", file=sys.stderr)
+    for size in args.sizes:
+        for case in args.cases:
+            result = run_case(case, size)
+            results.append(result)
+            print(
+                f"{case:<14}{size:>10}{result['objects']:>10}"
+                f"{result['bytes_per_object']:>12.1f}{result['peak_rss_mb']:>10.1f}MB",
+                file=sys.stderr,
+            )
+
+    measured = {f"{r['case']}/{r['size']}": r["bytes_per_object"] for r in results}
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(measured)
+        with open(args.baseline, "w") as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline recorded; run with --update-baseline first", file=sys.stderr)
+        return 0
+    with open(args.baseline) as f:
+        failures = compare(results, json.load(f), args.threshold)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+'''
+File: bench_simulation.py
+Description: Benchmark for long multi-day simulations of a large zoo.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+
+Run from the repository root:
+    python -m benchmarks.bench_simulation [--animals 10000] [--days 10000]
+
+Every zookeeper cleans its own slice of the enclosures and a few
+enclosures are shared by three zookeepers, so their animals fall sick
+after every treatment: the worst case for fast-forwarding, since the zoo
+never settles. A second run without treatment shows the settled case.
+'''
+
+import argparse
+import random
+import sys
+import time
+
+from enclosure import Enclosure
+import events
+from mammal import Mammal
+from simulation import Simulation
+from veterinarian import Veterinarian
+from zoo import Zoo
+from zookeeper import Zookeeper
+
+ANIMALS_PER_ENCLOSURE = 20
+ANIMALS_PER_VET = 500
+ENCLOSURES_PER_KEEPER = 10
+
+
+def build_zoo(animals: int, shared: float, seed: int = 0) -> Zoo:
+    """Build a silent zoo with vets for every animal (not timed)."""
+    rng = random.Random(seed)
+    zoo = Zoo("Simulation Zoo")
+    lions = [
+        Mammal(f"Lion {i}", "Lion", rng.randint(0, 20), "Meat", "savannah", rng.random() < 0.95)
+        for i in range(animals)
+    ]
+    zoo.add_animals(lions)
+
+    enclosures = []
+    for start in range(0, animals, ANIMALS_PER_ENCLOSURE):
+        enclosure = Enclosure(ANIMALS_PER_ENCLOSURE * 100, "savannah")
+        for lion in lions[start:start + ANIMALS_PER_ENCLOSURE]:
+            enclosure.add_animal(lion)
+        enclosures.append(enclosure)
+    zoo.add_enclosures(enclosures)
+
+    keepers = [Zookeeper(f"Keeper {k}") for k in range(max(3, len(enclosures) // ENCLOSURES_PER_KEEPER))]
+    for i, enclosure in enumerate(enclosures):
+        keepers[i % len(keepers)].assign_enclosure(enclosure)
+    for enclosure in rng.sample(enclosures, int(len(enclosures) * shared)):
+        for keeper in rng.sample([k for k in keepers if enclosure not in k.assigned_enclosure_view], 2):
+            keeper.assign_enclosure(enclosure)
+    zoo.add_staff_many(keepers)
+
+    vets = []
+    for start in range(0, animals, ANIMALS_PER_VET):
+        vet = Veterinarian(f"Vet {start // ANIMALS_PER_VET}")
+        vet.assign_animals(lions[start:start + ANIMALS_PER_VET])
+        vets.append(vet)
+    zoo.add_staff_many(vets)
+    return zoo
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Multi-day simulation speed.")
+    parser.add_argument("--animals", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=10_000)
+    parser.add_argument("--shared", type=float, default=0.02,
+                        help="fraction of enclosures shared by three zookeepers")
+    args = parser.parse_args(argv)
+    events.set_default_sink(events.NullSink())
+
+    for label, treatment_days in (("treated every 3 days", 3), ("untreated", None)):
+        zoo = build_zoo(args.animals, args.shared)
+        simulation = Simulation(zoo, treatment_days=treatment_days)
+        start = time.perf_counter()
+        series = simulation.run(args.days)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<22}{args.days} days of {args.animals} animals in {elapsed:6.2f} s "
+            f"({series.skipped_days} days fast-forwarded, {max(series.column('sick_animals'))} sick at most)",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+'''
+File: bench_slots_memory.py
+Description: Memory benchmark showing the bytes saved per object by the slotted classes.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+
+Run from the repository root:
+    python -m benchmarks.bench_slots_memory [--count 100000]
+
+For each class the benchmark builds many instances and measures the
+memory they allocate with tracemalloc. It then builds the same number of
+plain objects holding the same attribute names in a __dict__ (the layout
+the classes used before __slots__) and reports the difference. Field
+values are shared between both runs so only the object layout is compared.
+'''
+
+import argparse
+import sys
+import tracemalloc
+
+from bird import Bird
+from health_record import HealthRecord
+from mammal import Mammal
+from reptile import Reptile
+
+
+def _dict_layout_factory(name: str, attrs: dict):
+    """
+    Return a function making plain objects that hold attrs in their __dict__.
+
+    Each call creates a new class, so instances of one class share dict keys
+    just like instances of the original un-slotted class did.
+    """
+    def __init__(self):
+        for attr, value in attrs.items():
+            setattr(self, attr, value)
+
+    cls = type(f"{name}WithDict", (), {"__init__": __init__})
+    return cls
+
+
+def _slot_values(obj) -> dict:
+    """Collect the slot attributes of a slotted object by their mangled names."""
+    values = {}
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name == "__weakref__":
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{cls.__name__.lstrip('_')}{name}"
+            values[name] = getattr(obj, name)
+    return values
+
+
+def _measure(build, count: int) -> float:
+    """Return the bytes allocated per object by calling build() count times."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [build() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    # The list holding the objects is not part of the object cost
+    allocated -= sys.getsizeof(objects)
+    return allocated / count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Bytes per object with and without __slots__.")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    lion = Mammal("Simba", "Lion", 5, "Meat", "savannah", True)
+    samples = {
+        "Mammal": lion,
+        "Bird": Bird("Kiwi", "Parrot", 2, "Seeds", "jungle", True),
+        "Reptile": Reptile("Croc", "Crocodile", 6, "Meat", "jungle", True),
+        "HealthRecord": HealthRecord(lion, "illness", "low", "01/01/2025", "Rest.", True),
+    }
+
+    print(f"{'class':<14}{'slotted':>10}{'__dict__':>10}{'saved':>10}  (bytes/object)")
+    for name, sample in samples.items():
+        slotted = _measure(_clone_factory(sample), args.count)
+        dict_based = _measure(_dict_layout_factory(name, _slot_values(sample)), args.count)
+        print(f"{name:<14}{slotted:>10.0f}{dict_based:>10.0f}{dict_based - slotted:>10.0f}")
+    return 0
+
+
+def _clone_factory(sample):
+    """Return a function making copies of a slotted object without re-running validation."""
+    cls = type(sample)
+    attrs = _slot_values(sample)
+
+    def clone():
+        obj = cls.__new__(cls)
+        for name, value in attrs.items():
+            setattr(obj, name, value)
+        return obj
+
+    return clone
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,8 @@ from animal import Animal
 class Bird(Animal):
     """Represents a bird in the zoo system."""
 
+    __slots__ = ("__can_fly",)
+
     def __init__(self, name, species, age, diet, environment, is_healthy, can_fly=True):
         """Create a Bird with an optional flying ability."""
         # Initialise shared animal attributes
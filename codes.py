@@ -0,0 +1,113 @@
+'''
+File: codes.py
+Description: Integer codes for the fixed vocabularies (environment, severity, issue) and species.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+from enum import IntEnum
+
+
+class _Vocabulary(IntEnum):
+    """
+    Base for the small fixed vocabularies.
+
+    Members are ints, so comparing two codes is plain integer equality and
+    they fit in small integer arrays. Text is only converted at the API
+    boundary through lookup() and label.
+    """
+
+    @property
+    def label(self) -> str:
+        """The text used in the rest of the system, e.g. 'behavioral concerns'."""
+        return self.name.lower().replace("_", " ")
+
+    @classmethod
+    def lookup(cls, value):
+        """Return the member for some text (case and surrounding spaces ignored), or None."""
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, str):
+            return None
+        return cls._by_label().get(value.strip().lower())
+
+    @classmethod
+    def _by_label(cls) -> dict:
+        # Built once per class on first use
+        table = cls.__dict__.get("_labels")
+        if table is None:
+            table = {m.label: m for m in cls}
+            setattr(cls, "_labels", table)
+        return table
+
+    @classmethod
+    def labels(cls) -> list[str]:
+        """All labels in code order."""
+        return [m.label for m in cls]
+
+    def __str__(self):
+        return self.label
+
+
+class Environment(_Vocabulary):
+    AQUATIC = 0
+    SAVANNAH = 1
+    JUNGLE = 2
+    ARCTIC = 3
+    DESERT = 4
+    FOREST = 5
+    MOUNTAIN = 6
+    GRASSLAND = 7
+
+
+class Severity(_Vocabulary):
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+
+class Issue(_Vocabulary):
+    INJURIES = 0
+    ILLNESS = 1
+    BEHAVIORAL_CONCERNS = 2
+
+
+class SymbolTable:
+    """
+    Interns open-ended names such as species as small integer codes.
+
+    Names are matched case-insensitively; the first spelling seen is kept
+    as the display name for the code.
+    """
+
+    def __init__(self):
+        self.__codes: dict[str, int] = {}
+        self.__names: list[str] = []
+
+    def code(self, name: str) -> int:
+        """Return the code for a name, adding it if it is new."""
+        key = name.strip().lower()
+        code = self.__codes.get(key)
+        if code is None:
+            code = self.__codes[key] = len(self.__names)
+            self.__names.append(name.strip())
+        return code
+
+    def lookup(self, name) -> int | None:
+        """Return the code for a name without adding it, or None if unknown."""
+        if not isinstance(name, str):
+            return None
+        return self.__codes.get(name.strip().lower())
+
+    def name(self, code: int) -> str:
+        """Return the display name for a code."""
+        return self.__names[code]
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+
+# Species codes shared by every animal and enclosure in the process
+SPECIES = SymbolTable()
@@ -0,0 +1,173 @@
+'''
+File: decisions.py
+Description: Decision policies and sources for the veterinarians' health checks.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+# A policy is called as policy(vet, animal) for each sick animal and returns
+# a decision: None to open no record, or a dict of HealthRecord fields.
+# "issue" and "severity" are required; "date_reported" defaults to today and
+# "treatment_notes" to DEFAULT_NOTES. A source, used by the asynchronous
+# health checks, is a policy that may return an awaitable of its decision.
+
+from datetime import date
+
+import helper
+from codes import Environment, SPECIES
+from health_record import HEALTH_RECORD_SCHEMA
+from locks import CONSOLE_LOCK
+
+DEFAULT_NOTES = "Recorded during health check."
+
+
+def record_fields(decision) -> dict | None:
+    """Return the HealthRecord fields for a decision, or None if no record is wanted."""
+    if decision is None or decision is False:
+        return None
+    if not isinstance(decision, dict):
+        raise TypeError("A decision must be None or a dict of health record fields.")
+    missing = [key for key in ("issue", "severity") if key not in decision]
+    if missing:
+        raise ValueError(f"Decision is missing: {', '.join(missing)}.")
+    return {
+        "issue": decision["issue"],
+        "severity": decision["severity"],
+        "date_reported": decision.get("date_reported", date.today().strftime("%d/%m/%Y")),
+        "treatment_notes": decision.get("treatment_notes", DEFAULT_NOTES),
+    }
+
+
+def check_decision(decision) -> None:
+    """Raise ValueError if the decision would not make a valid HealthRecord."""
+    fields = record_fields(decision)
+    if fields is None:
+        return
+    _, errors = HEALTH_RECORD_SCHEMA.check(
+        fields["issue"], fields["severity"], fields["date_reported"], fields["treatment_notes"], True
+    )
+    if errors:
+        helper.report_errors(errors)
+        raise ValueError(f"Invalid decision: {'; '.join(str(e) for e in errors)}.")
+
+
+class FixedDecisions:
+    """
+    Give the same decision for every animal, e.g. for unattended runs and tests.
+    Works both as a policy and as a source.
+    """
+
+    def __init__(self, decision=None):
+        check_decision(decision)  # fail early on a malformed decision
+        self.__decision = decision
+
+    def __call__(self, vet, animal):
+        return self.__decision
+
+
+class RuleTable:
+    """
+    A policy made of rules tried in order; the first rule matching the
+    animal gives the decision, and default is used when none matches.
+
+        policy = RuleTable()
+        policy.add({"issue": "illness", "severity": "high"}, species="Lion", min_age=15)
+        policy.add({"issue": "illness", "severity": "low"}, environment="savannah")
+        vet.health_check(policy)
+
+    Conditions use the same names as Zoo.find_animals. when, if given, is
+    a function of the animal for anything the other conditions cannot say.
+    Decisions are checked when added, so a bad rule fails at once rather
+    than part-way through a health check.
+    """
+
+    def __init__(self, default=None):
+        check_decision(default)
+        self.__default = default
+        self.__rules: list[tuple] = []
+
+    def add(
+        self, decision, environment=None, species=None, min_age=None, max_age=None, when=None
+    ) -> "RuleTable":
+        """Append a rule. Return the table so rules can be chained."""
+        check_decision(decision)
+        # Compare codes rather than strings, as the zoo's census does
+        if environment is not None:
+            code = Environment.lookup(environment)
+            if code is None:
+                raise ValueError(f"Unknown environment '{environment}'.")
+            environment = code
+        if species is not None:
+            if not isinstance(species, str) or not species.strip():
+                raise ValueError("'species' must be a non-empty string.")
+            species = SPECIES.code(species)
+        if when is not None and not callable(when):
+            raise TypeError("'when' must be callable.")
+        self.__rules.append((environment, species, min_age, max_age, when, decision))
+        return self
+
+    def __call__(self, vet, animal):
+        for environment, species, min_age, max_age, when, decision in self.__rules:
+            if (
+                (environment is None or animal.environment_code == environment)
+                and (species is None or animal.species_code == species)
+                and (min_age is None or animal.age >= min_age)
+                and (max_age is None or animal.age <= max_age)
+                and (when is None or when(animal))
+            ):
+                return decision
+        return self.__default
+
+    def __len__(self) -> int:
+        return len(self.__rules)
+
+
+class ConsoleDecisions:
+    """
+    Ask the operator at the console, the same questions health_check asks.
+
+    input() runs on a worker thread so the event loop keeps serving other
+    veterinarians while one question waits. Questions are asked one at a
+    time, sharing locks.CONSOLE_LOCK with the threaded health checks, so
+    their prompts do not interleave. A question that times out
+    still holds the console until it is answered, so this source is best
+    used without a timeout.
+    """
+
+    def __init__(self):
+        # Created on first use, inside the running event loop
+        self.__lock = None
+
+    async def __call__(self, vet, animal):
+        import asyncio
+
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+        async with self.__lock:
+            return await asyncio.to_thread(self.__ask, vet, animal)
+
+    @staticmethod
+    def __ask(vet, animal):
+        with CONSOLE_LOCK:
+            return ConsoleDecisions.__prompt(vet, animal)
+
+    @staticmethod
+    def __prompt(vet, animal):
+        print(
+            f"[{vet.name}] {animal.name} ({animal.species}) is not healthy. "
+            "Do you want to create a record? (y/n)..."
+        )
+        choice = input().strip().lower()
+        while choice not in ("y", "n"):
+            print("'choice' must be 'y' or 'n'.")
+            choice = input().strip().lower()
+        if choice == "n":
+            return None
+        return {
+            "issue": input("Enter issue (injuries/illness/behavioral concerns): ").strip(),
+            "severity": input("Enter severity (low/medium/high): ").strip(),
+            "date_reported": input("Enter date (dd/mm/yyyy): ").strip(),
+            "treatment_notes": input("Enter treatment notes: ").strip(),
+        }
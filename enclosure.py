@@ -7,7 +7,13 @@ Username: maily015
 This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
+import threading
+
+import ids
 from animal import Animal
+from registry import Registry, SequenceView
+from codes import Environment
+import events
 import helper
 
 
@@ -19,31 +25,59 @@ class Enclosure:
         if not isinstance(size, int) or size <= 0:
             raise ValueError("size must be a positive integer.")
 
-        # Validate and normalise environment (e.g., 'aquatic', 'savannah')
-        self.__environment = helper.validate_environment(environment)
+        # Unique ID so the zoo can index enclosures like animals and staff
+        self._id = ids.new_id()
+
+        # Validate and normalise environment (e.g., 'aquatic', 'savannah'), stored as its code
+        self.__environment = Environment.lookup(helper.validate_environment(environment))
         self.__size = size
 
         # Clean level ranges from 0 to 5 (start fully clean)
         self.__clean_level = 5
 
-        # Animals currently in this enclosure
-        self.__list_animal: list[Animal] = []
+        # Animals currently in this enclosure, keyed by id for O(1) removal
+        self.__list_animal: Registry = Registry()
+        self.__animals_view = SequenceView(self.__list_animal)
 
         # Species restriction: once the first animal is added, only that species allowed
         self.__enclosure_species: str | None = None
+        self.__species_code: int | None = None
 
         # Capacity based on size (e.g., 100 sqm = 1 animal, 300 sqm = 3)
         self.__capacity = max(1, size // 100)
 
+        # Event sink of the owning zoo; None means the default sink
+        self._sink = None
+
+        # Callbacks told about occupancy changes, e.g. the owning zoo's indexes.
+        # Each is called as callback(enclosure, animal, added).
+        self._observers: list = []
+
+        # Guards occupancy and clean level when staff work runs on several
+        # threads. Re-entrant because observers may call back into the enclosure.
+        self._lock = threading.RLock()
+
     #property
+    @property
+    def id(self):
+        return self._id
+
     @property
     def species(self) -> str | None:
         return self.__enclosure_species
 
     @property
-    def animals(self) -> list[Animal]:
-        # Return a copy to protect the internal list
-        return list(self.__list_animal)
+    def animals(self) -> SequenceView:
+        # Read-only live view; nothing is copied
+        return self.__animals_view
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def free_slots(self) -> int:
+        return self.__capacity - len(self.__list_animal)
 
     @property
     def clean_level(self) -> int:
@@ -51,9 +85,35 @@ class Enclosure:
 
     @property
     def environment(self) -> str:
-        return self.__environment.lower()
+        return self.__environment.label
+
+    @property
+    def environment_code(self) -> Environment:
+        return self.__environment
+
+    @property
+    def species_code(self) -> int | None:
+        return self.__species_code
 
     # helpers
+    def _events(self) -> events.EventSink:
+        """Sink for this enclosure's events: its zoo's sink, or the default one."""
+        return self._sink if self._sink is not None else events.default_sink()
+
+    def _subscribe(self, callback) -> None:
+        """Register a callback for animals being added to or removed from here."""
+        if callback not in self._observers:
+            self._observers.append(callback)
+
+    def _unsubscribe(self, callback) -> None:
+        """Stop notifying a previously registered callback."""
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+    def _notify(self, animal, added: bool) -> None:
+        for callback in self._observers:
+            callback(self, animal, added)
+
     def _is_full(self) -> bool:
         """Internal check if enclosure has reached its capacity."""
         return len(self.__list_animal) >= self.__capacity
@@ -62,12 +122,10 @@ class Enclosure:
         """
         Check if an animal can be housed here based on environment and species.
         """
-        same_environment = animal.environment.lower() == self.__environment.lower()
-        same_species = (
-            self.__enclosure_species is None
-            or animal.species.lower() == self.__enclosure_species.lower()
+        # Both checks compare interned integer codes
+        return animal.environment_code == self.__environment and (
+            self.__species_code is None or animal.species_code == self.__species_code
         )
-        return same_environment and same_species
 
     # ---- Core API ----
     def add_animal(self, animal) -> bool:
@@ -81,20 +139,33 @@ class Enclosure:
         if not isinstance(animal, Animal):
             raise TypeError(f"{animal} must be an Animal class.")
 
+        with self._lock:
+            return self.__add_animal(animal)
+
+    def __add_animal(self, animal) -> bool:
+        if animal in self.__list_animal:
+            self._events().emit("enclosure_duplicate", "{} is already in the enclosure.", animal.name)
+            return False
+
         if self._is_full():
-            print("Enclosure already full.")
+            self._events().emit("enclosure_full", "Enclosure already full.")
             return False
 
         if not self.is_compatible(animal):
-            print("Enclosure not compatible (species or environment mismatch).")
+            self._events().emit(
+                "enclosure_incompatible", "Enclosure not compatible (species or environment mismatch)."
+            )
             return False
 
+        # Raises before any change if a different animal has the same id
+        self.__list_animal.add(animal)
         # First animal determines the species allowed in this enclosure
         if self.__enclosure_species is None:
             self.__enclosure_species = animal.species
+            self.__species_code = animal.species_code
 
-        self.__list_animal.append(animal)
-        print(f"Added {animal.name} to the enclosure.")
+        self._notify(animal, True)
+        self._events().emit("enclosure_animal_added", "Added {} to the enclosure.", animal.name)
         return True
 
     def remove_animal(self, animal):
@@ -102,20 +173,27 @@ class Enclosure:
         if not isinstance(animal, Animal):
             raise TypeError("'animal' must be an Animal class.")
 
-        if animal in self.__list_animal:
-            self.__list_animal.remove(animal)
-
-            # If enclosure becomes empty, clear species restriction
-            if not self.__list_animal:
-                self.__enclosure_species = None
-            return True
+        with self._lock:
+            if self.__list_animal.discard(animal):
+                # If enclosure becomes empty, clear species restriction
+                if not self.__list_animal:
+                    self.__enclosure_species = None
+                    self.__species_code = None
+                self._notify(animal, False)
+                return True
 
         return False
 
     def clean_enclosure(self):
         """Restore the enclosure to maximum cleanliness."""
-        self.__clean_level = 5
-        print("Enclosure cleaned.")
+        with self._lock:
+            self.__clean_level = 5
+        self._events().emit("enclosure_cleaned", "Enclosure cleaned.")
+
+    def _set_clean_level(self, level: int) -> None:
+        """Set the clean level directly. Used by the batch scheduler; emits no events."""
+        with self._lock:
+            self.__clean_level = level
 
     def decrease_cleanliness(self):
         """
@@ -123,13 +201,17 @@ class Enclosure:
 
         If cleanliness drops to 2 or below, all animals become unhealthy.
         """
-        self.__clean_level -= 1
-        print("Enclosure getting dirty.")
-
-        if self.__clean_level <= 2:
-            for animal in self.__list_animal:
-                animal.is_healthy = False
-                print(f"{animal.name} has become sick due to dirty enclosure.")
+        sink = self._events()
+        with self._lock:
+            self.__clean_level -= 1
+            if sink.enabled:
+                sink.emit("enclosure_dirty", "Enclosure getting dirty.")
+
+            if self.__clean_level <= 2:
+                for animal in self.__list_animal:
+                    animal.is_healthy = False
+                    if sink.enabled:
+                        sink.emit("animal_sick", "{} has become sick due to dirty enclosure.", animal.name)
 
     def animal_names(self) -> list[str]:
         """Return a list of names of all animals in this enclosure."""
@@ -148,7 +230,7 @@ class Enclosure:
         """Formatted string representation of this enclosure."""
         return (
             f"--- ENCLOSURE INFORMATION ---\n"
-            f"Enclosure type: {self.__environment}\n"
+            f"Enclosure type: {self.__environment.label}\n"
             f"Size: {self.__size}\n"
             f"Capacity: {self.__capacity}\n"
             f"Enclosure species: {self.__enclosure_species}\n"
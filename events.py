@@ -0,0 +1,118 @@
+'''
+File: events.py
+Description: Event sinks used instead of print() to report what the zoo system is doing.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+from abc import ABC, abstractmethod
+from collections import deque
+
+
+class Event:
+    """A single structured event: a name plus a message template and its arguments."""
+
+    __slots__ = ("name", "template", "args")
+
+    def __init__(self, name: str, template: str, args: tuple = ()):
+        self.name = name
+        self.template = template
+        self.args = args
+
+    @property
+    def message(self) -> str:
+        """The formatted message. Only built when somebody asks for it."""
+        return self.template.format(*self.args) if self.args else self.template
+
+    def __repr__(self):
+        return f"Event({self.name!r}, {self.message!r})"
+
+
+class EventSink(ABC):
+    """
+    Base class for event sinks.
+
+    Callers pass a template and its arguments rather than a finished string,
+    and can check ``enabled`` before doing any work, so a silent sink costs
+    almost nothing on hot paths.
+    """
+
+    enabled = True
+
+    @abstractmethod
+    def emit(self, name: str, template: str, *args) -> None:
+        """Receive one event."""
+
+
+class ConsoleSink(EventSink):
+    """Print each event message to standard output (the default behaviour)."""
+
+    def emit(self, name, template, *args):
+        print(template.format(*args) if args else template)
+
+
+class NullSink(EventSink):
+    """Discard every event."""
+
+    enabled = False
+
+    def emit(self, name, template, *args):
+        pass
+
+
+class BufferedSink(EventSink):
+    """Keep events in memory, optionally only the most recent ``maxlen`` of them."""
+
+    def __init__(self, maxlen: int | None = None):
+        self.events: deque[Event] = deque(maxlen=maxlen)
+
+    def emit(self, name, template, *args):
+        self.events.append(Event(name, template, args))
+
+    def messages(self) -> list[str]:
+        """Return the formatted messages of all buffered events."""
+        return [e.message for e in self.events]
+
+    def clear(self) -> None:
+        self.events.clear()
+
+
+class FileSink(EventSink):
+    """Write one line per event to an open text file."""
+
+    def __init__(self, file):
+        self.file = file
+
+    def emit(self, name, template, *args):
+        message = template.format(*args) if args else template
+        self.file.write(message.rstrip("\n") + "\n")
+
+
+class QueueSink(EventSink):
+    """Put Event objects on a queue (e.g. queue.Queue) for another consumer."""
+
+    def __init__(self, queue):
+        self.queue = queue
+
+    def emit(self, name, template, *args):
+        self.queue.put(Event(name, template, args))
+
+
+# Sink used by objects that do not belong to a zoo, and by the helper validators
+_default_sink: EventSink = ConsoleSink()
+
+
+def default_sink() -> EventSink:
+    """Return the process-wide default sink."""
+    return _default_sink
+
+
+def set_default_sink(sink: EventSink) -> EventSink:
+    """Replace the process-wide default sink. Returns the previous one."""
+    global _default_sink
+    if not isinstance(sink, EventSink):
+        raise TypeError("sink must be an EventSink instance.")
+    previous, _default_sink = _default_sink, sink
+    return previous
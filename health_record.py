@@ -7,9 +7,27 @@ Username: maily015
 This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
-import uuid
+from collections import namedtuple
+from datetime import date, datetime
+
+import ids
 import helper
 from animal import Animal
+from codes import Issue, Severity
+
+
+# Fields checked when creating a HealthRecord, in constructor order
+HEALTH_RECORD_SCHEMA = helper.Schema(
+    helper.Field("issue", "code", Issue),
+    helper.Field("severity", "code", Severity),
+    helper.Field("date_reported", "day"),
+    helper.Field("treatment_notes"),
+    helper.Field("active", "bool"),
+)
+
+
+# One entry in a record's notes log: when it was written and what it says
+NoteEntry = namedtuple("NoteEntry", ("timestamp", "text"))
 
 
 class HealthRecordClosedError(Exception):
@@ -20,6 +38,12 @@ class HealthRecordClosedError(Exception):
 class HealthRecord:
     """Represents a single health record entry for an animal."""
 
+    # Fixed attribute slots instead of a per-instance __dict__
+    __slots__ = (
+        "_id", "__animal", "__issue", "__severity", "__date_reported", "__reported_on",
+        "__notes", "__notes_text", "__active", "_owners", "__weakref__",
+    )
+
     def __init__(
         self,
         animal,
@@ -30,28 +54,51 @@ class HealthRecord:
         active: bool
     ):
         """Create a new health record for a given animal."""
-        self._id = uuid.uuid4()
+        self._id = ids.new_id()
 
         # Ensure we are always linked to a valid Animal instance
         if not isinstance(animal, Animal):
             raise TypeError("HealthRecord must be associated with an Animal instance.")
 
-        # Validate all provided fields before assigning them
-        if not (
-            helper.validate_issue(issue, "issue")
-            and helper.validate_level(severity, "severity")
-            and helper.validate_date(date_reported, "date_reported")
-            and helper.validate_bool(active, "active")
-            and helper.validate_string(treatment_notes, "treatment_notes")
-        ):
+        # Validate and normalise all provided fields in one pass
+        values, errors = HEALTH_RECORD_SCHEMA.check(
+            issue, severity, date_reported, treatment_notes, active
+        )
+        if errors:
+            helper.report_errors(errors)
             raise ValueError("Invalid input provided when creating HealthRecord.")
-
+        self.__fill(animal, values, date_reported)
+
+    @classmethod
+    def _from_checked(cls, animal, values: list, date_reported: str) -> "HealthRecord":
+        """
+        Build a record from values already normalised by HEALTH_RECORD_SCHEMA,
+        e.g. one row of a batch validated with check_many, without checking again.
+        """
+        record = cls.__new__(cls)
+        record._id = ids.new_id()
+        record.__fill(animal, values, date_reported)
+        return record
+
+    def __fill(self, animal, values: list, date_reported: str) -> None:
         self.__animal = animal
-        self.__issue = issue.strip()
-        self.__severity = severity.lower().strip()
+        (
+            self.__issue,
+            self.__severity,
+            self.__reported_on,
+            notes,
+            self.__active,
+        ) = values
+        # The date is parsed once into a day number; keep the text as given
         self.__date_reported = date_reported.strip()
-        self.__treatment_notes = treatment_notes.strip()
-        self.__active = active
+
+        # Notes are an append-only log; the joined text is built on demand
+        self.__notes: list[NoteEntry] = [NoteEntry(datetime.now(), notes)]
+        self.__notes_text: str | None = notes
+
+        # Veterinarians storing this record, told when it is closed: None,
+        # one veterinarian, or a tuple when several keep the same record
+        self._owners = None
 
     @property
     def id(self):
@@ -63,10 +110,18 @@ class HealthRecord:
 
     @property
     def issue(self):
-        return self.__issue
+        return self.__issue.label
 
     @property
     def severity(self):
+        return self.__severity.label
+
+    @property
+    def issue_code(self) -> Issue:
+        return self.__issue
+
+    @property
+    def severity_code(self) -> Severity:
         return self.__severity
 
     @property
@@ -74,33 +129,71 @@ class HealthRecord:
         return self.__active
 
     @property
-    def date_reported(self):
+    def date_reported(self) -> str:
         return self.__date_reported
 
     @property
-    def treatment_notes(self):
-        return self.__treatment_notes
+    def reported_on(self) -> int:
+        """Day number of date_reported (date.toordinal()), for sorting and range queries."""
+        return self.__reported_on
+
+    @property
+    def reported_date(self) -> date:
+        return date.fromordinal(self.__reported_on)
+
+    @property
+    def treatment_notes(self) -> str:
+        """All note entries, one per line, oldest first."""
+        if self.__notes_text is None:
+            self.__notes_text = "\n".join(entry.text for entry in self.__notes)
+        return self.__notes_text
+
+    def iter_notes(self):
+        """Yield the NoteEntry items in the order they were added."""
+        return iter(self.__notes)
 
     def close_record(self):
         """Mark this record as closed. Further changes will not be allowed."""
         if not self.__active:
             raise HealthRecordClosedError(
-                f"Health record '{self.__issue}' is already closed."
+                f"Health record '{self.__issue.label}' is already closed."
             )
         self.__active = False
+        for owner in self._owner_list():
+            owner._notify(self, "closed")
+
+    def _owner_list(self) -> tuple:
+        """The veterinarians storing this record, first added first."""
+        owners = self._owners
+        if owners is None:
+            return ()
+        return owners if isinstance(owners, tuple) else (owners,)
+
+    def _add_owner(self, vet) -> bool:
+        """Record that a veterinarian stores this record. Return False if it already did."""
+        owners = self._owner_list()
+        if vet in owners:
+            return False
+        self._owners = (*owners, vet) if owners else vet
+        return True
+
+    def _remove_owner(self, vet) -> None:
+        owners = tuple(o for o in self._owner_list() if o is not vet)
+        self._owners = owners if len(owners) > 1 else (owners[0] if owners else None)
 
     def add_notes(self, notes: str):
         """Append additional notes if the record is still active."""
         if not self.__active:
             raise HealthRecordClosedError(
-                f"Cannot add notes. Health record '{self.__issue}' is already closed."
+                f"Cannot add notes. Health record '{self.__issue.label}' is already closed."
             )
 
         if not helper.validate_string(notes, "notes"):
             raise ValueError("Notes must be a non-empty string.")
 
-        # Append new notes on a new line to keep a running history
-        self.__treatment_notes += f"\n{notes.strip()}"
+        # Appending is O(1); the joined text is rebuilt on the next read
+        self.__notes.append(NoteEntry(datetime.now(), notes.strip()))
+        self.__notes_text = None
 
     def __str__(self):
         """Return a formatted string representation of the health record."""
@@ -109,8 +202,8 @@ class HealthRecord:
             f"--- HEALTH RECORD ---\n"
             f"Animal name: {self.__animal.name}\n"
             f"Status: {status}\n"
-            f"Issue: {self.__issue}\n"
-            f"Severity: {self.__severity}\n"
+            f"Issue: {self.__issue.label}\n"
+            f"Severity: {self.__severity.label}\n"
             f"Date Reported: {self.__date_reported}\n"
-            f"Treatment Notes:\n{self.__treatment_notes}\n"
+            f"Treatment Notes:\n{self.treatment_notes}\n"
         )
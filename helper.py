@@ -7,7 +7,15 @@ Username: maily015
 This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
-from datetime import datetime
+from datetime import date, datetime
+
+import events
+from codes import Environment, Issue, Severity
+
+
+def _report(message, *args):
+    """Send a validation failure to the default event sink."""
+    events.default_sink().emit("validation_error", message, *args)
 
 
 def validate_string(value, field_name):
@@ -26,15 +34,19 @@ def validate_string(value, field_name):
         return True
 
     except (TypeError, ValueError) as e:
-        print(f"Validation Error: {e}")
+        _report("Validation Error: {}", e)
         return False
 
 
+# Severity levels allowed for health records
+VALID_LEVELS = Severity.labels()
+
+
 def validate_level(value, field_name):
     """
     Validate severity level (low, medium, high).
     """
-    allowed = ["low", "medium", "high"]
+    allowed = VALID_LEVELS
 
     try:
         # First check if it's a valid string
@@ -45,13 +57,13 @@ def validate_level(value, field_name):
         level = value.strip().lower()
 
         # Check if it is one of the allowed choices
-        if level not in allowed:
+        if Severity.lookup(level) is None:
             raise ValueError(f"{field_name} must be one of {allowed}")
 
         return True
 
     except (TypeError, ValueError) as e:
-        print(f"Validation Error: {e}")
+        _report("Validation Error: {}", e)
         return False
 
 
@@ -69,11 +81,11 @@ def validate_date(value, field_name):
         return True
 
     except ValueError:
-        print(f"Validation Error: {field_name} must be in format DD/MM/YYYY (e.g., 25/12/2024).")
+        _report("Validation Error: {} must be in format DD/MM/YYYY (e.g., 25/12/2024).", field_name)
         return False
 
     except TypeError:
-        print(f"Validation Error: {field_name} must be a string representing a date.")
+        _report("Validation Error: {} must be a string representing a date.", field_name)
         return False
 
 
@@ -88,7 +100,7 @@ def validate_bool(value, field_name):
         return True
 
     except TypeError as e:
-        print(f"Validation Error: {e}")
+        _report("Validation Error: {}", e)
         return False
 
 
@@ -112,15 +124,12 @@ def validate_age(value):
         return True
 
     except (TypeError, ValueError) as e:
-        print(f"Validation Error: {e}")
+        _report("Validation Error: {}", e)
         return False
 
 
 # List of environments allowed for animal classes
-VALID_ENVIRONMENTS = [
-    "aquatic", "savannah", "jungle", "arctic",
-    "desert", "forest", "mountain", "grassland"
-]
+VALID_ENVIRONMENTS = Environment.labels()
 
 
 def validate_environment(value, field_name="environment"):
@@ -131,15 +140,14 @@ def validate_environment(value, field_name="environment"):
     if not isinstance(value, str):
         raise TypeError(f"{field_name} must be a string.")
 
-    env = value.strip().lower()
-
     # Check if environment exists in the predefined list
-    if env not in VALID_ENVIRONMENTS:
+    env = Environment.lookup(value)
+    if env is None:
         raise ValueError(f"{field_name} must be one of {VALID_ENVIRONMENTS}")
 
-    return env
+    return env.label
 
-VALID_ISSUES = ["injuries", "illness", "behavioral concerns"]
+VALID_ISSUES = Issue.labels()
 
 def validate_issue(value, field_name="issue"):
     """
@@ -149,10 +157,232 @@ def validate_issue(value, field_name="issue"):
     if not isinstance(value, str):
         raise TypeError(f"{field_name} must be a string.")
 
-    iss = value.strip().lower()
-
-    # Check if environment exists in the predefined list
-    if iss not in VALID_ISSUES:
+    # Check if the issue exists in the predefined list
+    iss = Issue.lookup(value)
+    if iss is None:
         raise ValueError(f"{field_name} must be one of {VALID_ISSUES}")
 
-    return iss
\ No newline at end of file
+    return iss.label
+
+# Schema-based validation
+#
+# The validate_* functions above check one value at a time and print as they
+# go. A Schema checks and normalises a whole record in one pass, with set
+# lookups for choice fields, and returns any problems as FieldError data.
+
+
+class FieldError:
+    """One validation problem: which field failed, why, and (for batches) which row."""
+
+    __slots__ = ("field", "message", "row")
+
+    def __init__(self, field: str, message: str, row: int | None = None):
+        self.field = field
+        self.message = message
+        self.row = row
+
+    def __str__(self):
+        return self.message if self.row is None else f"row {self.row}: {self.message}"
+
+    def __repr__(self):
+        return f"FieldError({self.field!r}, {self.message!r}, row={self.row!r})"
+
+
+class Field:
+    """
+    Description of one schema field.
+
+    kind is one of "string", "choice", "code", "int", "bool", "date" or "day".
+    Strings are stripped, choices are stripped and lower-cased, codes are
+    converted to a member of the vocabulary enum given as choices (see
+    codes.py), dates (DD/MM/YYYY) are normalised to a stripped string, and
+    days are DD/MM/YYYY dates converted to their day number (date.toordinal()).
+    """
+
+    KINDS = ("string", "choice", "code", "int", "bool", "date", "day")
+
+    def __init__(self, name: str, kind: str = "string", choices=None, minimum=None, maximum=None, label=None):
+        if kind not in self.KINDS:
+            raise ValueError(f"kind must be one of {list(self.KINDS)}")
+        if kind in ("choice", "code") and not choices:
+            raise ValueError(f"{kind} fields need choices.")
+        self.name = name
+        self.kind = kind
+        # A list of strings, or the enum class for "code" fields
+        self.choices = choices if kind == "code" else (list(choices) if choices else None)
+        self.minimum = minimum
+        self.maximum = maximum
+        # Name used in error messages
+        self.label = label or name
+
+    def compile(self):
+        """Return a function mapping a raw value to (normalised value, error message or None)."""
+        label = self.label
+
+        if self.kind == "string":
+            def check(value):
+                if not isinstance(value, str):
+                    return None, f"{label} must be a string."
+                value = value.strip()
+                if not value:
+                    return None, f"{label} cannot be empty."
+                return value, None
+
+        elif self.kind == "choice":
+            allowed = frozenset(self.choices)
+            choices = self.choices
+
+            def check(value):
+                if not isinstance(value, str):
+                    return None, f"{label} must be a string."
+                value = value.strip().lower()
+                if value not in allowed:
+                    return None, f"{label} must be one of {choices}"
+                return value, None
+
+        elif self.kind == "code":
+            lookup = self.choices.lookup
+            choices = self.choices.labels()
+
+            def check(value):
+                if not isinstance(value, str):
+                    return None, f"{label} must be a string."
+                code = lookup(value)
+                if code is None:
+                    return None, f"{label} must be one of {choices}"
+                return code, None
+
+        elif self.kind == "int":
+            minimum, maximum = self.minimum, self.maximum
+
+            def check(value):
+                if not isinstance(value, int):
+                    return None, f"{label} must be an integer."
+                if minimum is not None and value < minimum:
+                    return None, f"{label} cannot be less than {minimum}."
+                if maximum is not None and value > maximum:
+                    return None, f"{label} cannot be more than {maximum}."
+                return value, None
+
+        elif self.kind == "bool":
+            def check(value):
+                if not isinstance(value, bool):
+                    return None, f"{label} must be a boolean."
+                return value, None
+
+        else:
+            as_day = self.kind == "day"
+
+            def check(value):
+                if not isinstance(value, str):
+                    return None, f"{label} must be a string representing a date."
+                value = value.strip()
+                parsed = _parse_date(value)
+                if parsed is None:
+                    return None, f"{label} must be in format DD/MM/YYYY (e.g., 25/12/2024)."
+                return (parsed.toordinal() if as_day else value), None
+
+        return check
+
+
+def _parse_date(value: str):
+    """Parse DD/MM/YYYY without strptime. Return a date, or None if invalid."""
+    parts = value.split("/")
+    if len(parts) != 3:
+        return None
+    day, month, year = parts
+    if not (
+        0 < len(day) <= 2 and day.isdigit()
+        and 0 < len(month) <= 2 and month.isdigit()
+        and len(year) == 4 and year.isdigit()
+    ):
+        return None
+    day, month, year = int(day), int(month), int(year)
+    if not 1 <= month <= 12 or not 1 <= day <= _days_in_month(year, month):
+        return None
+    return date(year, month, day)
+
+
+def day_number(value) -> int | None:
+    """
+    Return the day number (date.toordinal()) of a DD/MM/YYYY string or a date.
+
+    Returns None if the value is not a valid date. Nothing is printed.
+    """
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, str):
+        parsed = _parse_date(value.strip())
+        if parsed is not None:
+            return parsed.toordinal()
+    return None
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 2:
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        return 29 if leap else 28
+    return 30 if month in (4, 6, 9, 11) else 31
+
+
+class Schema:
+    """
+    Compiled list of fields for one class.
+
+    check() validates and normalises one record given as positional values
+    in field order. check_many() does the same for many rows, e.g. a bulk
+    import, keeping the valid rows and collecting the errors of the others.
+    Nothing is printed; use report_errors() to send errors to the event sink.
+
+    Each field is compiled once into a check function (see Field.compile),
+    and a record is checked by running those functions in field order.
+    """
+
+    def __init__(self, *fields: Field):
+        self.fields = fields
+        self.names = tuple(f.name for f in fields)
+        self.__checks = tuple(zip(self.names, (f.compile() for f in fields)))
+
+    def check(self, *values) -> tuple[list, list[FieldError]]:
+        """Return (normalised values, errors). The values are only usable if errors is empty."""
+        if len(values) != len(self.__checks):
+            raise TypeError(f"Expected {len(self.__checks)} values, got {len(values)}.")
+        result = []
+        errors = []
+        for (name, check), value in zip(self.__checks, values):
+            value, error = check(value)
+            if error is not None:
+                errors.append(FieldError(name, error))
+            result.append(value)
+        return result, errors
+
+    def check_many(self, rows) -> tuple[list[list], list[FieldError]]:
+        """
+        Validate many rows in one pass.
+
+        Returns (valid rows as normalised value lists, errors). Each error
+        records the index of the row it came from.
+        """
+        valid = []
+        errors = []
+        for index, row in enumerate(rows):
+            values, row_errors = self.check(*row)
+            if not row_errors:
+                valid.append(values)
+                continue
+            for error in row_errors:
+                error.row = index
+            errors.extend(row_errors)
+        return valid, errors
+
+    def as_dict(self, values) -> dict:
+        """Pair normalised values with their field names."""
+        return dict(zip(self.names, values))
+
+
+def report_errors(errors) -> None:
+    """Send FieldErrors to the default event sink, like the validate_* functions do."""
+    sink = events.default_sink()
+    if sink.enabled:
+        for error in errors:
+            sink.emit("validation_error", "Validation Error: {}", error)
@@ -0,0 +1,131 @@
+'''
+File: ids.py
+Description: Pluggable ID generators used when creating animals, staff, enclosures and health records.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+
+
+class IdGenerator(ABC):
+    """
+    Base class for ID generators.
+
+    Calling a generator returns a new hashable ID. IDs only need to be unique
+    within one zoo, since every lookup goes through that zoo's registries.
+    """
+
+    @abstractmethod
+    def __call__(self):
+        """Return a new ID."""
+
+
+class UUID4Generator(IdGenerator):
+    """Random uuid.UUID values (the original behaviour and the default)."""
+
+    def __call__(self):
+        import uuid
+        return uuid.uuid4()
+
+
+class SequentialIdGenerator(IdGenerator):
+    """Plain ints counting up from ``start``. The cheapest option by far."""
+
+    MAX = 2 ** 64 - 1
+
+    def __init__(self, start: int = 1):
+        if not isinstance(start, int) or not 0 <= start <= self.MAX:
+            raise ValueError("start must be an integer between 0 and 2**64 - 1.")
+        self.__counter = count(start)
+
+    def __call__(self) -> int:
+        # next() on itertools.count is atomic, so this is safe across threads
+        value = next(self.__counter)
+        if value > self.MAX:
+            raise OverflowError("SequentialIdGenerator ran out of 64-bit IDs.")
+        return value
+
+
+class UUID7Generator(IdGenerator):
+    """
+    Time-ordered UUIDs in the UUIDv7 layout.
+
+    The top 48 bits are the Unix time in milliseconds and the 12 bits after
+    the version act as a counter, so IDs made by one generator always sort
+    in creation order. The random tail comes from a PRNG seeded once from
+    os.urandom rather than a system call per ID.
+    """
+
+    def __init__(self):
+        self.__random = random.Random(os.urandom(16))
+        self.__lock = threading.Lock()
+        self.__last_ms = -1
+        self.__sequence = 0
+
+    def __call__(self):
+        import uuid
+        with self.__lock:
+            ms = time.time_ns() // 1_000_000
+            if ms > self.__last_ms:
+                self.__last_ms = ms
+                self.__sequence = 0
+            else:
+                # Same (or earlier) millisecond: bump the counter, borrowing
+                # the next millisecond when it overflows
+                self.__sequence += 1
+                if self.__sequence > 0xFFF:
+                    self.__last_ms += 1
+                    self.__sequence = 0
+            ms, sequence = self.__last_ms, self.__sequence
+            tail = self.__random.getrandbits(62)
+        value = (ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | sequence << 64 | 0b10 << 62 | tail
+        return uuid.UUID(int=value)
+
+
+# Generator used when no zoo scope is active
+_default_generator: IdGenerator = UUID4Generator()
+
+# Generator chosen by the innermost use_generator() block, if any
+_active: ContextVar = ContextVar("id_generator", default=None)
+
+
+def default_generator() -> IdGenerator:
+    """Return the process-wide default generator."""
+    return _default_generator
+
+
+def set_default_generator(generator: IdGenerator) -> IdGenerator:
+    """Replace the process-wide default generator. Returns the previous one."""
+    global _default_generator
+    if not callable(generator):
+        raise TypeError("generator must be callable.")
+    previous, _default_generator = _default_generator, generator
+    return previous
+
+
+@contextmanager
+def use_generator(generator: IdGenerator):
+    """Make objects created inside the block take their IDs from ``generator``."""
+    if not callable(generator):
+        raise TypeError("generator must be callable.")
+    token = _active.set(generator)
+    try:
+        yield generator
+    finally:
+        _active.reset(token)
+
+
+def new_id():
+    """Return a new ID from the active generator."""
+    generator = _active.get()
+    return (generator or _default_generator)()
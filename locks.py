@@ -0,0 +1,41 @@
+'''
+File: locks.py
+Description: Striped locks shared by the animals, used when staff work runs on several threads.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import threading
+
+
+class StripedLock:
+    """
+    A fixed pool of locks shared by many objects.
+
+    Giving every animal its own lock would cost memory for each of
+    possibly millions of objects. Instead an object's id picks one of
+    ``stripes`` locks, so two updates to the same object always serialise
+    while updates to different objects rarely contend.
+    """
+
+    def __init__(self, stripes: int = 64):
+        if not isinstance(stripes, int) or stripes < 1:
+            raise ValueError("stripes must be a positive integer.")
+        self.__locks = tuple(threading.RLock() for _ in range(stripes))
+
+    def for_key(self, key):
+        """Return the lock guarding the given key (e.g. an object id)."""
+        return self.__locks[hash(key) % len(self.__locks)]
+
+    def __len__(self) -> int:
+        return len(self.__locks)
+
+
+# Locks guarding Animal state, picked by animal id
+ANIMAL_LOCKS = StripedLock()
+
+# Held while the operator is asked a question at the console, so questions
+# from staff working on several threads do not interleave
+CONSOLE_LOCK = threading.RLock()
@@ -13,6 +13,8 @@ from animal import Animal
 class Mammal(Animal):
     """Represents a mammal in the zoo system."""
 
+    __slots__ = ("__is_nocturnal",)
+
     def __init__(self, name, species, age, diet, environment, is_healthy, is_nocturnal=False):
         """Create a Mammal with an optional nocturnal trait."""
         # Initialise all shared animal attributes
@@ -0,0 +1,98 @@
+'''
+File: placement.py
+Description: Defines the PlacementIndex used by the Zoo to find room for new animals.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import heapq
+from itertools import count
+
+
+class PlacementIndex:
+    """
+    Tracks enclosures with free slots, grouped by environment and locked species.
+
+    Each (environment, species) group is a min-heap ordered by free slots,
+    so the fullest enclosure that still has room is chosen first and empty
+    enclosures are kept for new species. Empty enclosures live under the
+    species key None. Heap entries are never updated in place: when an
+    enclosure changes a new entry is pushed and older ones become stale.
+    Stale entries are skipped lazily, and a heap is rebuilt once more than
+    half of it is stale, so memory stays proportional to the enclosures
+    tracked. Every update and query is O(log n) amortised.
+    """
+
+    def __init__(self):
+        self.__heaps: dict[tuple, list] = {}
+        # Number of stale entries in each heap
+        self.__stale: dict[tuple, int] = {}
+        # Latest (group key, entry number, free slots) for each tracked enclosure id
+        self.__current: dict = {}
+        self.__counter = count()
+
+    def update(self, enclosure) -> None:
+        """Start tracking an enclosure, or refresh it after its occupancy changed."""
+        key = (enclosure.environment_code, enclosure.species_code)
+        free = enclosure.free_slots
+        previous = self.__current.get(enclosure.id)
+        if previous is not None and previous[0] == key and previous[2] == free:
+            return  # nothing the index orders by has changed
+
+        number = next(self.__counter)
+        self.__current[enclosure.id] = (key, number, free)
+        if previous is not None:
+            self.__retire(previous)
+        if free > 0:
+            heapq.heappush(self.__heaps.setdefault(key, []), (free, number, enclosure))
+
+    def discard(self, enclosure) -> None:
+        """Stop tracking an enclosure. Its heap entry becomes stale."""
+        previous = self.__current.pop(enclosure.id, None)
+        if previous is not None:
+            self.__retire(previous)
+
+    def __retire(self, entry) -> None:
+        """Count an entry as stale, rebuilding its heap when most of it is stale."""
+        key, _, free = entry
+        if free <= 0:
+            return  # never pushed
+        heap = self.__heaps[key]
+        stale = self.__stale.get(key, 0) + 1
+        if stale * 2 > len(heap):
+            current = self.__current
+            heap[:] = [e for e in heap if current.get(e[2].id, (None, None))[:2] == (key, e[1])]
+            heapq.heapify(heap)
+            stale = 0
+        self.__stale[key] = stale
+
+    def _peek(self, key):
+        heap = self.__heaps.get(key)
+        while heap:
+            _, number, enclosure = heap[0]
+            if self.__current.get(enclosure.id, (None, None))[:2] == (key, number):
+                return enclosure
+            heapq.heappop(heap)
+            self.__stale[key] -= 1
+        return None
+
+    def find(self, animal):
+        """
+        Return an enclosure with room that is compatible with the animal, or None.
+
+        Enclosures already holding the same species are preferred over empty ones.
+        """
+        environment = animal.environment_code
+        enclosure = self._peek((environment, animal.species_code))
+        if enclosure is None:
+            enclosure = self._peek((environment, None))
+        return enclosure
+
+    def _heap_sizes(self) -> dict:
+        """Number of heap entries per group, stale ones included."""
+        return {key: len(heap) for key, heap in self.__heaps.items()}
+
+    def __len__(self) -> int:
+        return len(self.__current)
@@ -0,0 +1,268 @@
+'''
+File: registry.py
+Description: Defines the Registry, SequenceView and NameIndex collections used by the Zoo.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+from bisect import bisect_left
+
+
+class Registry:
+    """
+    Insertion-ordered collection of objects keyed by their ``id``.
+
+    Adding, removing, membership checks and lookup by id are all O(1),
+    while iteration keeps the order in which items were added.
+    """
+
+    def __init__(self, items=()):
+        # Python dicts keep insertion order, so the dict doubles as an ordered set
+        self.__items: dict = {}
+        # Tuple of the items for indexing, rebuilt after the next change
+        self.__snapshot: tuple | None = None
+        # Bumped on every change so callers can cache things derived from the items
+        self.__version = 0
+        for item in items:
+            self.add(item)
+
+    def add(self, item) -> bool:
+        """
+        Add an item. Return True if added, False if it was already present.
+        Raises ValueError if a different object already has the same id.
+        """
+        key = item.id
+        existing = self.__items.get(key)
+        if existing is item:
+            return False
+        if existing is not None:
+            raise ValueError(f"A different object with id {key} is already registered.")
+        self.__items[key] = item
+        self.__changed()
+        return True
+
+    def remove(self, item) -> None:
+        """Remove an item. Raises KeyError if it is not in the registry."""
+        if item not in self:
+            raise KeyError(item.id)
+        del self.__items[item.id]
+        self.__changed()
+
+    def discard(self, item) -> bool:
+        """Remove an item if present. Return True if removed, False otherwise."""
+        if item not in self:
+            return False
+        del self.__items[item.id]
+        self.__changed()
+        return True
+
+    def get(self, key, default=None):
+        """Return the item stored under the given id, or default if not found."""
+        return self.__items.get(key, default)
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self.__items.clear()
+        self.__changed()
+
+    def __changed(self) -> None:
+        self.__snapshot = None
+        self.__version += 1
+
+    @property
+    def version(self) -> int:
+        """A number that changes whenever items are added or removed."""
+        return self.__version
+
+    def snapshot(self) -> tuple:
+        """Return the items as a tuple. Cached until the registry next changes."""
+        if self.__snapshot is None:
+            self.__snapshot = tuple(self.__items.values())
+        return self.__snapshot
+
+    def __contains__(self, item) -> bool:
+        # Compare identity so a different object with a clashing id never matches
+        key = getattr(item, "id", None)
+        return key is not None and self.__items.get(key) is item
+
+    def __iter__(self):
+        return iter(self.__items.values())
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __bool__(self) -> bool:
+        return bool(self.__items)
+
+    def __getitem__(self, index):
+        return self.snapshot()[index]
+
+    def __repr__(self) -> str:
+        return f"Registry({list(self.__items.values())!r})"
+
+
+class SequenceView:
+    """
+    Read-only, live view of a list or Registry.
+
+    Nothing is copied: length, iteration and membership go straight to the
+    underlying collection (membership is O(1) for a Registry). The view
+    compares equal to any list or tuple with the same items. Take list(view)
+    first if the collection may change while you iterate over it.
+    """
+
+    __slots__ = ("__items",)
+
+    def __init__(self, items):
+        self.__items = items
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __bool__(self) -> bool:
+        return len(self.__items) > 0
+
+    def __iter__(self):
+        return iter(self.__items)
+
+    def __contains__(self, item) -> bool:
+        return item in self.__items
+
+    def __getitem__(self, index):
+        return self.__items[index]
+
+    def index(self, item) -> int:
+        for i, value in enumerate(self.__items):
+            if value is item or value == item:
+                return i
+        raise ValueError(f"{item!r} is not in view")
+
+    def __eq__(self, other):
+        if isinstance(other, (SequenceView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"SequenceView({list(self.__items)!r})"
+
+
+class NameIndex:
+    """
+    Case-insensitive index from an object's ``name`` to the objects carrying it.
+
+    Exact lookups are a single dict access. A sorted list of the distinct
+    names supports prefix (autocomplete) queries with a binary search, so
+    only the matching names are visited. New names are merged into the
+    sorted list lazily on the next prefix query, which keeps bulk adds
+    linear instead of paying for an ordered insert each time.
+    """
+
+    def __init__(self):
+        # Each name maps to its one item, or to a Registry once the name repeats.
+        # Most names are unique, so most entries cost no container at all.
+        self.__buckets: dict[str, object] = {}
+        # Distinct case-folded names, sorted for prefix search. Names added
+        # since the last query wait in __pending; removed names stay in the
+        # list (skipped while searching) until the next merge.
+        self.__keys: list[str] = []
+        self.__pending: set[str] = set()
+        self.__stale = 0
+
+    @staticmethod
+    def normalise(name) -> str:
+        """Return the key used for a name (stripped and case-folded)."""
+        return (name or "").strip().casefold()
+
+    @staticmethod
+    def __members(bucket) -> tuple | Registry:
+        return bucket if isinstance(bucket, Registry) else (bucket,)
+
+    def add(self, item) -> None:
+        """Index an item under its current name."""
+        key = self.normalise(item.name)
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            self.__buckets[key] = item
+            self.__pending.add(key)
+        elif isinstance(bucket, Registry):
+            bucket.add(item)
+        elif bucket is not item:
+            self.__buckets[key] = Registry((bucket, item))
+
+    def discard(self, item) -> None:
+        """Stop indexing an item. Does nothing if it was not indexed."""
+        key = self.normalise(item.name)
+        bucket = self.__buckets.get(key)
+        if isinstance(bucket, Registry):
+            if bucket.discard(item) and len(bucket) == 1:
+                # Back to a single item: drop the container
+                self.__buckets[key] = next(iter(bucket))
+            return
+        if bucket is None or bucket is not item:
+            return
+        del self.__buckets[key]
+        if key in self.__pending:
+            self.__pending.discard(key)
+        else:
+            self.__stale += 1
+
+    def _sorted_keys(self) -> list[str]:
+        """Merge pending names into the sorted list and drop removed ones if needed."""
+        keys = self.__keys
+        if self.__pending:
+            keys.extend(self.__pending)
+            keys.sort()
+            self.__pending.clear()
+        if self.__stale * 2 > len(keys):
+            self.__compact()
+        return self.__keys
+
+    def __compact(self) -> None:
+        buckets = self.__buckets
+        self.__keys = sorted(k for k in set(self.__keys) if k in buckets)
+        self.__stale = 0
+
+    def find(self, name) -> list:
+        """Return all items whose name matches (case-insensitive)."""
+        bucket = self.__buckets.get(self.normalise(name))
+        return list(self.__members(bucket)) if bucket is not None else []
+
+    def first(self, name):
+        """Return the first item added with a matching name, or None."""
+        bucket = self.__buckets.get(self.normalise(name))
+        return next(iter(self.__members(bucket))) if bucket is not None else None
+
+    def prefix(self, prefix, limit: int = 10) -> list:
+        """
+        Return up to ``limit`` items whose name starts with ``prefix``.
+
+        Results are ordered alphabetically by name, then by insertion order.
+        """
+        if limit <= 0:
+            return []
+        prefix = self.normalise(prefix)
+        keys = self._sorted_keys()
+        buckets = self.__buckets
+        results = []
+        previous = None
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            key = keys[i]
+            if not key.startswith(prefix):
+                break
+            # Skip names removed since the last merge, and repeats of a
+            # name that was removed and then added again
+            if key == previous or key not in buckets:
+                continue
+            previous = key
+            for item in self.__members(buckets[key]):
+                results.append(item)
+                if len(results) == limit:
+                    return results
+        return results
+
+    def __len__(self) -> int:
+        return len(self.__buckets)
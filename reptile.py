@@ -13,6 +13,8 @@ from animal import Animal
 class Reptile(Animal):
     """Represents a reptile in the zoo system."""
 
+    __slots__ = ("__is_venomous",)
+
     def __init__(self, name, species, age, diet, environment, is_healthy, is_venomous=False):
         """Create a Reptile with an optional venomous trait."""
         # Initialise shared animal attributes
@@ -0,0 +1,174 @@
+'''
+File: scheduler.py
+Description: Batch and concurrent ways of running the staff's daily rounds.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import contextvars
+
+import events
+
+# Clean level restored by cleaning, and the level at or below which animals get sick
+CLEAN_LEVEL = 5
+SICK_LEVEL = 2
+
+
+def _numpy():
+    """Return NumPy if it is installed, else None (the pure-Python path is used)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class BatchDay:
+    """
+    Feeding and cleaning for many enclosures at once.
+
+    Zookeeper.perform_task feeds (and cleans) each assigned enclosure one
+    call at a time, so an enclosure shared by k zookeepers loses k clean
+    levels during feeding. This class counts those visits up front and
+    applies the round as array operations over the clean levels: one
+    subtraction for feeding and one comparison to find the enclosures that
+    made their animals sick. Only those animals are touched. The end
+    state matches running perform_task("feed") and then
+    perform_task("clean") for every zookeeper in order.
+
+    NumPy is used when it is installed; otherwise the same steps run as
+    plain list operations.
+    """
+
+    def __init__(self, zookeepers, use_numpy: bool | None = None):
+        zookeepers = list(zookeepers)
+        # Assignment versions seen when the plan was built (see is_current)
+        self.__keepers = zookeepers
+        self.__versions = [k._assigned_enclosure.version for k in zookeepers]
+
+        # perform_task would raise part-way through; raise before changing anything
+        for keeper in zookeepers:
+            if not keeper.assigned_enclosure_view:
+                raise RuntimeError("No enclosures assigned to this zookeeper.")
+
+        np = _numpy() if use_numpy is not False else None
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True needs NumPy. Install it with 'pip install numpy'.")
+        self.__np = np
+
+        # Each distinct enclosure once, with the number of zookeepers visiting it
+        self.__enclosures: list = []
+        positions: dict = {}
+        visits: list[int] = []
+        for keeper in zookeepers:
+            for enclosure in keeper.assigned_enclosure_view:
+                i = positions.get(enclosure.id)
+                if i is None:
+                    i = positions[enclosure.id] = len(self.__enclosures)
+                    self.__enclosures.append(enclosure)
+                    visits.append(0)
+                visits[i] += 1
+        self.__visits = np.array(visits, dtype=np.int64) if np is not None else visits
+
+    @property
+    def enclosures(self) -> list:
+        return list(self.__enclosures)
+
+    @property
+    def uses_numpy(self) -> bool:
+        return self.__np is not None
+
+    def is_current(self, zookeepers) -> bool:
+        """True if built for these zookeepers, in this order, with unchanged assignments."""
+        zookeepers = list(zookeepers)
+        return (
+            len(zookeepers) == len(self.__keepers)
+            and all(a is b for a, b in zip(zookeepers, self.__keepers))
+            and all(k._assigned_enclosure.version == v for k, v in zip(zookeepers, self.__versions))
+        )
+
+    def feed(self, collect: list | None = None) -> int:
+        """
+        Run the feeding round: every visit lowers the clean level by one.
+
+        Animals in enclosures that end at SICK_LEVEL or below become sick;
+        if collect is given, each of them is appended to it. Return how
+        many animals became sick.
+        """
+        np = self.__np
+        levels = [e.clean_level for e in self.__enclosures]
+        if np is not None:
+            new_levels = np.array(levels, dtype=np.int64) - self.__visits
+            dirty = np.flatnonzero(new_levels <= SICK_LEVEL).tolist()
+            new_levels = new_levels.tolist()
+        else:
+            new_levels = [level - k for level, k in zip(levels, self.__visits)]
+            dirty = [i for i, level in enumerate(new_levels) if level <= SICK_LEVEL]
+
+        for enclosure, level in zip(self.__enclosures, new_levels):
+            enclosure._set_clean_level(level)
+
+        sick = 0
+        for i in dirty:
+            for animal in self.__enclosures[i].animals:
+                if animal.is_healthy:
+                    animal.is_healthy = False
+                    sick += 1
+                    if collect is not None:
+                        collect.append(animal)
+        return sick
+
+    def clean(self) -> None:
+        """Run the cleaning round: every visited enclosure goes back to CLEAN_LEVEL."""
+        for enclosure in self.__enclosures:
+            enclosure._set_clean_level(CLEAN_LEVEL)
+
+    def run(self, sink: events.EventSink | None = None) -> int:
+        """Feed and then clean. Return how many animals became sick."""
+        sink = sink if sink is not None else events.default_sink()
+        sick = self.feed()
+        if sink.enabled:
+            sink.emit(
+                "batch_feeding_done", "Fed {} enclosures; {} animals became sick.",
+                len(self.__enclosures), sick,
+            )
+        self.clean()
+        if sink.enabled:
+            sink.emit("batch_cleaning_done", "Cleaned {} enclosures.", len(self.__enclosures))
+        return sick
+
+
+def _call(staff, task) -> tuple:
+    """The function and argument that run one (staff member, task) pair."""
+    return (staff.perform_task, task) if isinstance(task, str) else (task, staff)
+
+
+def run_concurrently(phases, max_workers: int | None = None) -> None:
+    """
+    Run staff tasks on a thread pool, one phase at a time.
+
+    phases is a list of phases, each a list of (staff member, task) pairs.
+    A task is a name passed to perform_task, or a function called with
+    the staff member. All tasks of a phase are submitted together and
+    the next phase only starts once every one of them has finished, which
+    acts as a barrier between phases. Each task runs in a copy of the
+    caller's context, so settings such as the active id generator carry over.
+    If tasks fail, the error of the earliest failing pair is raised after
+    its phase completes and the remaining phases are skipped.
+    """
+    # Imported here: concurrent.futures pulls in logging, which is slow to import
+    from concurrent.futures import ThreadPoolExecutor, wait
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for phase in phases:
+            futures = [
+                pool.submit(contextvars.copy_context().run, *_call(staff, task))
+                for staff, task in phase
+            ]
+            wait(futures)
+            for future in futures:
+                error = future.exception()
+                if error is not None:
+                    raise error
@@ -0,0 +1,297 @@
+'''
+File: simulation.py
+Description: Multi-day simulation of a zoo's daily rounds, for forecasting cleanliness and health.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import heapq
+from collections import namedtuple
+from datetime import date, timedelta
+from itertools import count
+
+import decisions
+import events
+from scheduler import BatchDay, SICK_LEVEL
+from zookeeper import Zookeeper
+
+# Opens a low-severity illness record for every new case
+DEFAULT_POLICY = decisions.RuleTable(default={"issue": "illness", "severity": "low"})
+
+# Aggregates for one simulated day. Clean levels are taken after feeding,
+# the lowest point of the day, since cleaning brings them back every day.
+DayStats = namedtuple(
+    "DayStats",
+    ("day", "mean_clean_level", "dirty_enclosures", "sick_animals", "new_cases", "in_treatment"),
+)
+
+
+class TimeSeries:
+    """Daily aggregates of a simulation, stored column by column."""
+
+    def __init__(self, start: date):
+        self.start = start
+        self.__columns = {name: [] for name in DayStats._fields}
+        # Days filled in by fast-forwarding rather than simulated one by one
+        self.skipped_days = 0
+
+    def _append(self, row: DayStats, repeat: int = 1) -> None:
+        """Add a row, or the same aggregates for repeat consecutive days starting at row.day."""
+        columns = iter(self.__columns.values())
+        next(columns).extend(range(row.day, row.day + repeat))
+        for column, value in zip(columns, row[1:]):
+            column.extend([value] * repeat)
+
+    def column(self, name: str) -> list:
+        """Return a copy of one column, e.g. column("sick_animals")."""
+        if name not in self.__columns:
+            raise KeyError(f"Unknown column '{name}'. Options: {', '.join(DayStats._fields)}.")
+        return list(self.__columns[name])
+
+    def date_of(self, day: int) -> date:
+        """Return the calendar date of a simulated day (day 1 is the start date)."""
+        return self.start + timedelta(days=day - 1)
+
+    def __len__(self) -> int:
+        return len(self.__columns["day"])
+
+    def __getitem__(self, index: int) -> DayStats:
+        return DayStats(*(column[index] for column in self.__columns.values()))
+
+    def __iter__(self):
+        return map(DayStats._make, zip(*self.__columns.values()))
+
+
+class Simulation:
+    """
+    Advance a zoo day by day with its current staff assignments, recording a TimeSeries.
+    Each day runs the queued events, the zookeepers' rounds, then the vets' intake of new cases.
+    """
+
+    def __init__(
+        self,
+        zoo,
+        policy=DEFAULT_POLICY,
+        treatment_days: int | None = 3,
+        keep_records: bool = False,
+        start: date | None = None,
+        use_numpy: bool | None = None,
+        sink: events.EventSink | None = None,
+    ):
+        if treatment_days is not None and (not isinstance(treatment_days, int) or treatment_days < 1):
+            raise ValueError("treatment_days must be a positive integer or None.")
+        if policy is not None and not callable(policy):
+            raise TypeError("policy must be callable.")
+        self.__zoo = zoo
+        # policy=None treats nobody
+        self.__policy = policy
+        # Days until a case is healed by a queued event; None never heals
+        self.__treatment_days = treatment_days
+        # By default cases are only counted, since a long forecast would
+        # otherwise fill the zoo with hypothetical records. With True each
+        # case opens a real HealthRecord, dated on its simulated day and
+        # closed when the treatment ends. Either way the simulation changes
+        # the clean levels and health of the zoo it runs on.
+        self.__keep_records = keep_records
+        self.__use_numpy = use_numpy
+        # Where the zoo's events go while running
+        self.__sink = sink if sink is not None else events.NullSink()
+
+        # Queue of (day, order, kind, payload); order keeps same-day events first-in first-out
+        self.__queue: list = []
+        self.__order = count()
+        self.__day = 0
+        self.__series = TimeSeries(start if start is not None else date.today())
+
+        # Animals in treatment, keyed by id
+        self.__treating: dict = {}
+        self.__plan: BatchDay | None = None
+        # Set until the plan and running totals are first built (see __refresh)
+        self.__stale = True
+        # True once a day has run in full from cleaned enclosures with this plan
+        self.__settled = False
+        self.__sick = 0
+        self.__watched: list = []
+        self.__dirty: list = []
+        self.__others_sum = 0
+        self.__others_dirty = 0
+        self.__levels = (0.0, 0)
+
+    @property
+    def day(self) -> int:
+        """Number of days simulated so far."""
+        return self.__day
+
+    @property
+    def series(self) -> TimeSeries:
+        return self.__series
+
+    def schedule(self, day: int, action) -> None:
+        """
+        Call action(zoo) at the start of a future simulated day, e.g. to
+        change assignments or bring in animals. Day 1 is the first day.
+        """
+        if not callable(action):
+            raise TypeError("action must be callable.")
+        if not isinstance(day, int) or day <= self.__day:
+            raise ValueError(f"day must be an integer after day {self.__day}.")
+        heapq.heappush(self.__queue, (day, next(self.__order), "action", action))
+
+    def run(self, days: int) -> TimeSeries:
+        """Simulate the next number of days. Return the whole series so far."""
+        if not isinstance(days, int) or days < 0:
+            raise ValueError("days must be a non-negative integer.")
+        zoo = self.__zoo
+        end = self.__day + days
+        # New records take their ids from the zoo's generator
+        with zoo.events_to(self.__sink), zoo.id_scope():
+            while self.__day < end:
+                self.__day += 1
+                day = self.__day
+                fired = self.__fire_events(day)
+                changed = self.__stale or fired or not self.__plan_is_current()
+
+                candidates = []
+                if changed:
+                    # Sick animals not yet in treatment are new to the veterinarians
+                    candidates = [a for a in zoo.find_animals(healthy=False) if a.id not in self.__treating]
+                    self.__refresh()
+
+                # Cleaning leaves every visited enclosure at the same level, so
+                # once the plan has run a full day from there, later days repeat
+                # its feeding and cleaning exactly. The day after a change starts
+                # from freshly cleaned enclosures and is run in full too; from
+                # then on only the animals in the enclosures that got dirty are checked.
+                steady = self.__settled
+                new_sick: list = []
+                if not steady:
+                    if self.__plan is not None:
+                        self.__plan.feed(new_sick)
+                        self.__levels = self.__measure()
+                        self.__dirty = [e for e in self.__plan.enclosures if e.clean_level <= SICK_LEVEL]
+                        self.__plan.clean()
+                    self.__settled = not changed
+                else:
+                    # Same visits, same dirty enclosures: only their animals can change
+                    for enclosure in self.__dirty:
+                        for animal in enclosure.animals:
+                            if animal.is_healthy:
+                                animal.is_healthy = False
+                                new_sick.append(animal)
+                self.__sick += len(new_sick)
+                admitted = self.__admit(candidates + new_sick, day)
+
+                mean, dirty = self.__levels
+                row = DayStats(day, mean, dirty, self.__sick, len(new_sick), len(self.__treating))
+                self.__series._append(row)
+
+                # Nothing changed today, so nothing changes until the next event:
+                # skip ahead, repeating today's aggregates (fast-forward)
+                if steady and not new_sick and not admitted:
+                    next_event = self.__queue[0][0] if self.__queue else end + 1
+                    repeat = min(end, next_event - 1) - day
+                    if repeat > 0:
+                        self.__series._append(row._replace(day=day + 1), repeat)
+                        self.__series.skipped_days += repeat
+                        self.__day += repeat
+        return self.__series
+
+    def __fire_events(self, day: int) -> bool:
+        """Run the events due today. Return True if an action ran."""
+        fired = False
+        while self.__queue and self.__queue[0][0] <= day:
+            _, _, kind, payload = heapq.heappop(self.__queue)
+            if kind == "action":
+                payload(self.__zoo)
+                fired = True
+            else:
+                self.__finish_treatment(*payload)
+        return fired
+
+    def __finish_treatment(self, vet, cases) -> None:
+        """Heal the animals of one day's intake and close the records opened for them."""
+        for animal, record in cases:
+            self.__treating.pop(animal.id, None)
+            # Only the case's own record is closed; heal_animal would rescan
+            # every earlier record of the animal on each treatment
+            if record is not None and record.active:
+                record.add_notes("Animal treated and condition resolved.")
+                record.close_record()
+            if not animal.is_healthy and animal in vet.assigned_animal_view:
+                animal.heal()
+                self.__sick -= 1
+
+    def __plan_is_current(self) -> bool:
+        return self.__plan is None or self.__plan.is_current(self.__keepers())
+
+    def __keepers(self) -> list:
+        # Zookeepers with nothing assigned have no rounds to do
+        return [
+            s for s in self.__zoo.staff
+            if isinstance(s, Zookeeper) and s.assigned_enclosure_view
+        ]
+
+    def __refresh(self) -> None:
+        """Rebuild the plan and the running totals from the zoo as it is now."""
+        zoo = self.__zoo
+        keepers = self.__keepers()
+        self.__plan = BatchDay(keepers, self.__use_numpy) if keepers else None
+        planned = {e.id for e in self.__plan.enclosures} if self.__plan is not None else set()
+        self.__watched = [e for e in zoo.enclosures if e.id in planned]
+        others = [e.clean_level for e in zoo.enclosures if e.id not in planned]
+        self.__others_sum = sum(others)
+        self.__others_dirty = sum(1 for level in others if level <= SICK_LEVEL)
+        self.__dirty = []
+        self.__settled = False
+        self.__sick = zoo.count_animals(healthy=False)
+        self.__levels = self.__measure()
+        self.__stale = False
+
+    def __measure(self) -> tuple[float, int]:
+        """Mean clean level and number of dirty enclosures, over the zoo's enclosures."""
+        total = len(self.__zoo.enclosures)
+        if not total:
+            return 0.0, 0
+        levels = [e.clean_level for e in self.__watched]
+        dirty = self.__others_dirty + sum(1 for level in levels if level <= SICK_LEVEL)
+        return (self.__others_sum + sum(levels)) / total, dirty
+
+    def __admit(self, animals: list, day: int) -> int:
+        """Let the veterinarians take on new cases. Return how many were taken."""
+        if self.__policy is None or not animals:
+            return 0
+        # A sick animal with a veterinarian is shown to the policy, and the
+        # first of its veterinarians (in zoo.vets_for order) takes the case
+        cases: dict = {}
+        for animal in animals:
+            if animal.id in self.__treating:
+                continue
+            vets = self.__zoo.vets_for(animal)
+            if not vets:
+                continue
+            vet = vets[0]
+            decision = self.__policy(vet, animal)
+            if decision:
+                cases.setdefault(vet, []).append((animal, decision))
+
+        admitted = 0
+        for vet, pairs in cases.items():
+            if self.__keep_records:
+                date_text = self.__series.date_of(day).strftime("%d/%m/%Y")
+                records = vet.create_records(
+                    (animal, {**decision, "date_reported": date_text}) for animal, decision in pairs
+                )
+                taken = [(record.animal, record) for record in records]
+            else:
+                taken = [(animal, None) for animal, _ in pairs]
+            for animal, _ in taken:
+                self.__treating[animal.id] = animal
+            admitted += len(taken)
+            if self.__treatment_days is not None and taken:
+                heapq.heappush(
+                    self.__queue,
+                    (day + self.__treatment_days, next(self.__order), "treatment", (vet, taken)),
+                )
+        return admitted
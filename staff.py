@@ -8,33 +8,52 @@ This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
 from abc import ABC, abstractmethod
-import uuid
+import ids
 
 from animal import Animal
 from enclosure import Enclosure
+from registry import Registry, SequenceView
+import events
 import helper
 
 
+# Fields checked when creating a Staff member, in constructor order
+STAFF_SCHEMA = helper.Schema(
+    helper.Field("name", label="Staff name"),
+    helper.Field("role", label="Staff role"),
+)
+
+
 class Staff(ABC):
     """Abstract base class for staff members in the zoo."""
 
     def __init__(self, name: str, role: str):
         """Create a staff member with a name, role, and default active status."""
-        self._id = uuid.uuid4()
+        self._id = ids.new_id()
 
         # Validate name and role before assigning them
-        if helper.validate_string(name, "Staff name") and helper.validate_string(role, "Staff role"):
-            self.__name = name.strip()
-            self.__role = role.strip()
-        else:
+        values, errors = STAFF_SCHEMA.check(name, role)
+        if errors:
+            helper.report_errors(errors)
             raise ValueError("Invalid staff name or role provided.")
+        self.__name, self.__role = values
 
         # Staff start as active by default
         self.__active = True
 
-        # Lists used to track what this staff member is responsible for
-        self._assigned_enclosure: list[Enclosure] = []
-        self._assigned_animal: list[Animal] = []
+        # Event sink of the zoo employing this staff member; None means the default sink
+        self._sink = None
+
+        # What this staff member is responsible for, keyed by id so
+        # membership checks are O(1) while assignment order is kept
+        self._assigned_enclosure: Registry = Registry()
+        self._assigned_animal: Registry = Registry()
+        self.__enclosure_view = SequenceView(self._assigned_enclosure)
+        self.__animal_view = SequenceView(self._assigned_animal)
+
+    def _events(self) -> events.EventSink:
+        """Sink for this staff member's events: their zoo's sink, or the default one."""
+        return self._sink if self._sink is not None else events.default_sink()
 
     def assign_enclosure(self, enclosure) -> None:
         """
@@ -42,18 +61,37 @@ class Staff(ABC):
 
         Only active staff with role 'zookeeper' are allowed to take enclosures.
         """
+        self.assign_enclosures((enclosure,))
+
+    def assign_enclosures(self, enclosures) -> int:
+        """
+        Assign many enclosures at once. Return how many were newly assigned.
+
+        Every enclosure is checked before any is assigned, so a bad one
+        leaves the assignments unchanged.
+        """
         if not self.__active:
             raise RuntimeError("Cannot assign enclosure: staff member is inactive.")
 
-        if not isinstance(enclosure, Enclosure):
-            raise TypeError("Assigned enclosure must be an Enclosure instance.")
+        enclosures = list(enclosures)
+        for enclosure in enclosures:
+            if not isinstance(enclosure, Enclosure):
+                raise TypeError("Assigned enclosure must be an Enclosure instance.")
 
         # Only zookeepers can be assigned to enclosures
         if self.__role.lower() != "zookeeper":
             raise PermissionError("Only staff with role 'zookeeper' can be assigned enclosures.")
 
-        if enclosure not in self._assigned_enclosure:
-            self._assigned_enclosure.append(enclosure)
+        added = [e for e in enclosures if self._assigned_enclosure.add(e)]
+        return len(added)
+
+    def unassign_enclosure(self, enclosure) -> bool:
+        """Remove an enclosure from this staff member. Return False if it was not assigned."""
+        return self.unassign_enclosures((enclosure,)) == 1
+
+    def unassign_enclosures(self, enclosures) -> int:
+        """Remove many enclosures. Return how many were actually assigned."""
+        return sum(1 for e in enclosures if self._assigned_enclosure.discard(e))
 
     def assign_animal(self, animal) -> None:
         """
@@ -61,18 +99,50 @@ class Staff(ABC):
 
         Only active staff with role 'veterinarian' are allowed to take animals.
         """
+        self.assign_animals((animal,))
+
+    def assign_animals(self, animals) -> int:
+        """
+        Assign many animals at once. Return how many were newly assigned.
+
+        Every animal is checked before any is assigned, so a bad one leaves
+        the assignments unchanged.
+        """
         if not self.__active:
             raise RuntimeError("Cannot assign animal: staff member is inactive.")
 
-        if not isinstance(animal, Animal):
-            raise TypeError("Assigned animal must be an Animal instance.")
+        animals = list(animals)
+        for animal in animals:
+            if not isinstance(animal, Animal):
+                raise TypeError("Assigned animal must be an Animal instance.")
 
         # Only veterinarians can be assigned animals
         if self.__role.lower() != "veterinarian":
             raise PermissionError("Only staff with role 'veterinarian' can be assigned animals.")
 
-        if animal not in self._assigned_animal:
-            self._assigned_animal.append(animal)
+        added = []
+        try:
+            added.extend(a for a in animals if self._assigned_animal.add(a))
+        finally:
+            # Report the animals added before an id clash stopped the loop
+            if added:
+                self._animals_changed(added, True)
+        return len(added)
+
+    def unassign_animal(self, animal) -> bool:
+        """Remove an animal from this staff member. Return False if it was not assigned."""
+        return self.unassign_animals((animal,)) == 1
+
+    def unassign_animals(self, animals) -> int:
+        """Remove many animals. Return how many were actually assigned."""
+        removed = [a for a in animals if self._assigned_animal.discard(a)]
+        if removed:
+            self._animals_changed(removed, False)
+        return len(removed)
+
+    def _animals_changed(self, animals: list, assigned: bool) -> None:
+        """Hook called after animals are assigned or unassigned. Does nothing here."""
+        pass
 
     def deactivate(self) -> None:
         """
@@ -83,7 +153,10 @@ class Staff(ABC):
         """
         self.__active = False
         self._assigned_enclosure.clear()
+        removed = list(self._assigned_animal)
         self._assigned_animal.clear()
+        if removed:
+            self._animals_changed(removed, False)
 
     @abstractmethod
     def perform_task(self, task: str):
@@ -119,16 +192,26 @@ class Staff(ABC):
         # Same idea: protect internal list from external modification
         return list(self._assigned_animal)
 
+    @property
+    def assigned_enclosure_view(self) -> SequenceView:
+        """Read-only live view of the assigned enclosures, without copying."""
+        return self.__enclosure_view
+
+    @property
+    def assigned_animal_view(self) -> SequenceView:
+        """Read-only live view of the assigned animals, without copying."""
+        return self.__animal_view
+
     # Helper display methods
 
     def display_enclosure(self) -> None:
         """Print environments of all enclosures assigned to this staff member."""
-        for enc in self.assigned_enclosure:
+        for enc in self._assigned_enclosure:
             print(enc.environment)
 
     def display_animal(self) -> None:
         """Print names of all animals assigned to this staff member."""
-        for animal in self.assigned_animal:
+        for animal in self._assigned_animal:
             print(animal.name)
 
     def __str__(self) -> str:
@@ -0,0 +1,46 @@
+'''
+File: conftest.py
+Description: Fixtures shared by the schedule and simulation tests.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import random
+
+import pytest
+
+from enclosure import Enclosure
+from events import NullSink
+from mammal import Mammal
+from zoo import Zoo
+from zookeeper import Zookeeper
+
+
+def _build_zoo(seed: int) -> Zoo:
+    """A zoo where some enclosures are shared by several zookeepers and some start dirty."""
+    rng = random.Random(seed)
+    zoo = Zoo("Batch Zoo", sink=NullSink())
+    built = []
+    for i in range(30):
+        enclosure = Enclosure(500, "savannah")
+        enclosure._sink = NullSink()
+        for j in range(rng.randint(0, 4)):
+            enclosure.add_animal(Mammal(f"Lion {i}-{j}", "Lion", 5, "Meat", "savannah", rng.random() < 0.8))
+        for _ in range(rng.randint(0, 3)):
+            enclosure.decrease_cleanliness()
+        built.append(enclosure)
+    zoo.add_enclosures(built)
+    zoo.add_animals(a for e in built for a in e.animals)
+    for k in range(6):
+        keeper = Zookeeper(f"Keeper {k}")
+        keeper.assign_enclosures(rng.sample(built, rng.randint(1, 12)))
+        zoo.add_staff(keeper)
+    return zoo
+
+
+@pytest.fixture
+def build_zoo():
+    """The seeded zoo builder, called as build_zoo(seed)."""
+    return _build_zoo
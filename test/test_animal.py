@@ -104,3 +104,16 @@ def test_animal_str_contains_core_fields():
     assert "Meat" in s
     assert "savannah" in s
     assert "True" in s
+
+
+def test_concrete_animals_have_no_instance_dict():
+    """Mammal, Bird and Reptile use __slots__, so no per-instance __dict__."""
+    from mammal import Mammal
+    from bird import Bird
+    from reptile import Reptile
+
+    for cls in (Mammal, Bird, Reptile):
+        a = cls("Simba", "Lion", 5, "Meat", "savannah", True)
+        assert not hasattr(a, "__dict__")
+        with pytest.raises(AttributeError):
+            a.nickname = "King"
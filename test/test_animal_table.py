@@ -0,0 +1,77 @@
+'''
+File: test_animal_table.py
+Description: Unit tests for the optional NumPy-backed AnimalTable.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from animal_table import AnimalTable
+from mammal import Mammal
+
+
+def make_animals():
+    return [
+        Mammal("Simba", "Lion", 12, "Meat", "savannah", False),
+        Mammal("Nala", "lion", 4, "Meat", "savannah", True),
+        Mammal("Zazu", "Hornbill", 11, "Insects", "savannah", False),
+        Mammal("Kala", "Gorilla", 20, "Fruit", "jungle", False),
+    ]
+
+
+def test_filter_and_count():
+    simba, nala, zazu, kala = animals = make_animals()
+    table = AnimalTable(animals, capacity=1)  # forces the columns to grow
+
+    assert len(table) == 4
+    assert table.filter(environment="Savannah", healthy=False, min_age=11) == [simba, zazu]
+    assert table.filter(species="LION") == [simba, nala]
+    assert table.count(max_age=11) == 2
+    assert table.filter(environment="arctic") == []
+    assert table.filter(species="Tiger") == []
+
+
+def test_mean_age_by_species():
+    table = AnimalTable(make_animals())
+
+    assert table.mean_age_by_species() == {"lion": 8.0, "hornbill": 11.0, "gorilla": 20.0}
+    assert table.mean_age_by_species(environment="jungle") == {"gorilla": 20.0}
+
+
+def test_health_changes_reach_the_table():
+    simba, nala, zazu, kala = animals = make_animals()
+    table = AnimalTable(animals)
+
+    simba.heal()
+    nala.is_healthy = False
+
+    assert table.filter(healthy=True) == [simba]
+
+
+def test_discard_keeps_rows_dense():
+    simba, nala, zazu, kala = animals = make_animals()
+    table = AnimalTable(animals)
+
+    table.discard(simba)
+    table.discard(simba)  # no-op the second time
+
+    assert len(table) == 3
+    assert simba not in table
+    assert sorted(a.name for a in table.filter()) == ["Kala", "Nala", "Zazu"]
+
+    # A discarded animal no longer writes to the table
+    simba.is_healthy = True
+    assert table.count(healthy=True) == 1
+
+
+def test_animal_can_only_belong_to_one_table():
+    simba = make_animals()[0]
+    AnimalTable([simba])
+
+    with pytest.raises(ValueError):
+        AnimalTable([simba])
@@ -0,0 +1,63 @@
+'''
+File: test_codes.py
+Description: Unit tests for the integer vocabularies and the species symbol table.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+from codes import Environment, Issue, Severity, SymbolTable
+from mammal import Mammal
+from enclosure import Enclosure
+from health_record import HealthRecord
+
+
+def test_vocabulary_lookup_and_label():
+    assert Environment.lookup(" Savannah ") is Environment.SAVANNAH
+    assert Environment.lookup("moon") is None
+    assert Environment.lookup(3) is None
+    assert Issue.BEHAVIORAL_CONCERNS.label == "behavioral concerns"
+    assert Issue.lookup("Behavioral Concerns") is Issue.BEHAVIORAL_CONCERNS
+    assert Severity.labels() == ["low", "medium", "high"]
+
+
+def test_vocabulary_members_are_ints():
+    assert Environment.AQUATIC == 0
+    assert Severity.HIGH > Severity.LOW
+
+
+def test_symbol_table_is_case_insensitive():
+    table = SymbolTable()
+    lion = table.code("Lion")
+
+    assert table.code(" lion ") == lion
+    assert table.code("Tiger") != lion
+    assert table.lookup("LION") == lion
+    assert table.lookup("Zebra") is None
+    assert table.name(lion) == "Lion"
+    assert len(table) == 2
+
+
+def test_objects_keep_string_api_and_expose_codes():
+    lion = Mammal("Simba", "Lion", 5, "Meat", "Savannah", True)
+    enclosure = Enclosure(10, "savannah")
+    enclosure.add_animal(lion)
+    record = HealthRecord(lion, "injuries", "HIGH", "01/01/2025", "Cut", True)
+
+    assert lion.environment == "savannah"
+    assert lion.environment_code is Environment.SAVANNAH
+    assert enclosure.environment_code is Environment.SAVANNAH
+    assert enclosure.species == "Lion"
+    assert enclosure.species_code == lion.species_code
+    assert record.severity == "high"
+    assert record.severity_code is Severity.HIGH
+    assert record.issue_code is Issue.INJURIES
+
+
+def test_enclosure_compatibility_uses_codes():
+    enclosure = Enclosure(10, "savannah")
+    enclosure.add_animal(Mammal("Simba", "Lion", 5, "Meat", "savannah", True))
+
+    assert enclosure.is_compatible(Mammal("Nala", "LION", 4, "Meat", "SAVANNAH", True))
+    assert not enclosure.is_compatible(Mammal("Zazu", "Hornbill", 4, "Seeds", "savannah", True))
@@ -0,0 +1,233 @@
+'''
+File: test_decisions.py
+Description: Unit tests for decision sources and the asynchronous health checks.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import asyncio
+
+import pytest
+
+from decisions import ConsoleDecisions, FixedDecisions, RuleTable, DEFAULT_NOTES, record_fields
+from bird import Bird
+from events import BufferedSink, NullSink
+from mammal import Mammal
+from veterinarian import Veterinarian
+
+ILLNESS = {"issue": "illness", "severity": "low", "date_reported": "01/02/2025"}
+
+
+def make_vet(*healthy) -> tuple[Veterinarian, list]:
+    vet = Veterinarian("Dr. A")
+    vet._sink = NullSink()
+    lions = [Mammal(f"Lion {i}", "Lion", 5, "Meat", "savannah", h) for i, h in enumerate(healthy)]
+    vet.assign_animals(lions)
+    return vet, lions
+
+
+def test_record_fields_fills_defaults():
+    fields = record_fields({"issue": "illness", "severity": "high"})
+    assert fields["treatment_notes"] == DEFAULT_NOTES
+    assert len(fields["date_reported"]) == 10
+    assert record_fields(None) is None
+
+
+def test_record_fields_rejects_bad_decisions():
+    with pytest.raises(ValueError):
+        record_fields({"issue": "illness"})
+    with pytest.raises(TypeError):
+        FixedDecisions("y")
+    with pytest.raises(ValueError):
+        FixedDecisions({"issue": "illness", "severity": "extreme"})
+
+
+# Policies
+
+def test_rule_table_uses_first_matching_rule():
+    old_lion = Mammal("Scar", "Lion", 20, "Meat", "savannah", False)
+    cub = Mammal("Simba", "Lion", 1, "Meat", "savannah", False)
+    parrot = Bird("Polly", "Parrot", 3, "Seeds", "jungle", False)
+    high = {"issue": "illness", "severity": "high"}
+    low = {"issue": "illness", "severity": "low"}
+
+    policy = RuleTable().add(high, species="lion", min_age=15).add(low, environment="Savannah")
+
+    assert len(policy) == 2
+    assert policy(None, old_lion) is high
+    assert policy(None, cub) is low
+    assert policy(None, parrot) is None
+
+
+def test_rule_table_when_and_default():
+    injured = {"issue": "injuries", "severity": "medium"}
+    policy = RuleTable(default=ILLNESS).add(injured, when=lambda a: a.name.startswith("Limping"))
+
+    assert policy(None, Mammal("Limping Leo", "Lion", 5, "Meat", "savannah", False)) is injured
+    assert policy(None, Mammal("Leo", "Lion", 5, "Meat", "savannah", False)) is ILLNESS
+
+
+def test_rule_table_rejects_bad_rules():
+    table = RuleTable()
+    with pytest.raises(ValueError):
+        table.add(ILLNESS, environment="moon")
+    with pytest.raises(ValueError):
+        table.add({"issue": "sneezing", "severity": "low"})
+    with pytest.raises(TypeError):
+        table.add(ILLNESS, when="always")
+    assert len(table) == 0
+
+
+def test_health_check_with_policy_runs_unattended(monkeypatch):
+    vet, lions = make_vet(False, True, False)
+    monkeypatch.setattr("builtins.input", lambda *args: pytest.fail("policy runs must not prompt"))
+
+    records = vet.health_check(RuleTable(default=ILLNESS))
+
+    assert [r.animal for r in records] == [lions[0], lions[2]]
+    assert all(r.active and r.treatment_notes == DEFAULT_NOTES for r in records)
+
+
+def test_generate_record_with_policy_may_decline():
+    vet, lions = make_vet(False, False)
+    policy = RuleTable().add(ILLNESS, when=lambda a: a is lions[0])
+
+    assert vet.generate_record(lions[0], policy=policy).issue == "illness"
+    assert vet.generate_record(lions[1], policy=policy) is None
+    assert vet.get_records(lions[1]) == []
+
+
+def test_fixed_decisions_works_as_a_policy(monkeypatch):
+    vet, lions = make_vet(True, False, False)
+    monkeypatch.setattr("builtins.input", lambda *args: pytest.fail("policy runs must not prompt"))
+
+    records = vet.health_check(FixedDecisions(ILLNESS))
+
+    assert [r.animal for r in records] == lions[1:]
+    assert vet.health_check(FixedDecisions()) == []
+
+
+def test_create_records_is_all_or_nothing():
+    vet, lions = make_vet(False, False, False)
+    bad = {"issue": "illness", "severity": "low", "date_reported": "31/02/2025"}
+
+    with pytest.raises(ValueError):
+        vet.create_records([(lions[0], ILLNESS), (lions[1], bad), (lions[2], ILLNESS)])
+    assert vet.records == []
+
+    records = vet.create_records([(lions[0], ILLNESS), (lions[1], None), (lions[2], ILLNESS)])
+    assert [r.animal for r in records] == [lions[0], lions[2]]
+    assert records[0].reported_on == records[1].reported_on
+
+
+def test_create_records_requires_assigned_animals():
+    vet, _ = make_vet(False)
+    stranger = Mammal("Nala", "Lion", 4, "Meat", "savannah", False)
+    with pytest.raises(ValueError):
+        vet.create_records([(stranger, ILLNESS)])
+
+
+# Asynchronous health checks
+
+
+def test_ahealth_check_records_only_sick_animals():
+    vet, lions = make_vet(True, False, False)
+
+    records = asyncio.run(vet.ahealth_check(FixedDecisions(ILLNESS)))
+
+    assert [r.animal for r in records] == lions[1:]
+    assert vet.get_records(lions[1]) == records[:1]
+    assert records[0].date_reported == "01/02/2025"
+
+
+def test_ahealth_check_accepts_plain_callables():
+    vet, lions = make_vet(False, False)
+
+    def source(v, animal):
+        return ILLNESS if animal is lions[0] else None
+
+    records = asyncio.run(vet.ahealth_check(source))
+    assert [r.animal for r in records] == [lions[0]]
+
+
+def test_ahealth_check_uses_default_after_timeout():
+    vet, lions = make_vet(False, False)
+    sink = BufferedSink()
+    vet._sink = sink
+
+    async def source(v, animal):
+        if animal is lions[0]:
+            await asyncio.sleep(10)
+        return None
+
+    records = asyncio.run(vet.ahealth_check(source, timeout=0.05, default=ILLNESS))
+
+    assert [r.animal for r in records] == [lions[0]]
+    assert "decision_timed_out" in [e.name for e in sink.events]
+
+
+def test_ahealth_check_asks_about_animals_concurrently():
+    vet, _ = make_vet(*[False] * 20)
+
+    asked = []
+    all_asked = asyncio.Event()
+
+    async def slow(v, animal):
+        asked.append(animal)
+        if len(asked) == 20:
+            all_asked.set()
+        # Only returns once every question is in flight at the same time
+        await asyncio.wait_for(all_asked.wait(), 5)
+        return None
+
+    asyncio.run(vet.ahealth_check(slow))
+    assert len(asked) == 20
+
+
+def test_ahealth_check_skips_animals_unassigned_while_waiting():
+    vet, lions = make_vet(False, False)
+
+    async def source(v, animal):
+        if animal is lions[0]:
+            v.unassign_animal(animal)
+        await asyncio.sleep(0)
+        return ILLNESS
+
+    records = asyncio.run(vet.ahealth_check(source))
+    assert [r.animal for r in records] == [lions[1]]
+
+
+def test_ahealth_check_skips_invalid_answers_and_reports_them():
+    vet, lions = make_vet(False, False, False)
+    sink = BufferedSink()
+    vet._sink = sink
+    answers = {
+        lions[0]: {"issue": "illness", "severity": "extreme"},
+        lions[1]: ILLNESS,
+        lions[2]: "y",
+    }
+
+    async def source(v, animal):
+        return answers[animal]
+
+    records = asyncio.run(vet.ahealth_check(source))
+
+    assert [r.animal for r in records] == [lions[1]]
+    assert [e.name for e in sink.events].count("decision_invalid") == 2
+    # Direct callers still get all-or-nothing
+    with pytest.raises(ValueError):
+        vet.create_records([(lions[0], answers[lions[0]]), (lions[2], ILLNESS)])
+
+
+def test_console_decisions_asks_like_health_check(monkeypatch, capsys):
+    vet, lions = make_vet(False, False)
+    answers = iter(["maybe", "y", "injuries", "high", "03/04/2025", "Bandaged.", "n"])
+    monkeypatch.setattr("builtins.input", lambda *args: next(answers))
+
+    records = asyncio.run(vet.ahealth_check(ConsoleDecisions()))
+
+    assert len(records) == 1
+    assert (records[0].issue, records[0].severity) == ("injuries", "high")
+    assert "'choice' must be 'y' or 'n'." in capsys.readouterr().out
@@ -57,6 +57,15 @@ def test_add_compatible_animal_success():
     assert enc.species == "Lion"
 
 
+def test_add_same_animal_twice_rejected():
+    enc = Enclosure(size=300, environment="savannah")
+    lion = make_lion()
+
+    assert enc.add_animal(lion) is True
+    assert enc.add_animal(lion) is False
+    assert enc.animals == [lion]
+
+
 def test_add_animal_wrong_type_raises():
     enc = Enclosure(size=200, environment="savannah")
 
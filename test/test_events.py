@@ -0,0 +1,79 @@
+'''
+File: test_events.py
+Description: Unit tests for the event sinks.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import io
+import queue
+
+import pytest
+
+import events
+import helper
+from events import BufferedSink, ConsoleSink, Event, FileSink, NullSink, QueueSink
+
+
+def test_event_formats_message_lazily():
+    event = Event("animal_added", "Added {} to {}.", ("Simba", "Timmy Zoo"))
+    assert event.message == "Added Simba to Timmy Zoo."
+    assert Event("enclosure_full", "Enclosure already full.").message == "Enclosure already full."
+
+
+def test_event_sink_base_needs_emit():
+    with pytest.raises(TypeError):
+        events.EventSink()
+
+
+def test_console_sink_prints(capsys):
+    ConsoleSink().emit("animal_added", "Added {}.", "Simba")
+    assert capsys.readouterr().out == "Added Simba.\n"
+
+
+def test_null_sink_is_disabled(capsys):
+    sink = NullSink()
+    sink.emit("animal_added", "Added {}.", "Simba")
+    assert sink.enabled is False
+    assert capsys.readouterr().out == ""
+
+
+def test_buffered_sink_keeps_recent_events():
+    sink = BufferedSink(maxlen=2)
+    for name in ("Simba", "Nala", "Scar"):
+        sink.emit("animal_added", "Added {}.", name)
+
+    assert [e.name for e in sink.events] == ["animal_added", "animal_added"]
+    assert sink.messages() == ["Added Nala.", "Added Scar."]
+
+    sink.clear()
+    assert sink.messages() == []
+
+
+def test_file_and_queue_sinks():
+    file = io.StringIO()
+    FileSink(file).emit("staff_added", "Added {}.\n", "Alice")
+    assert file.getvalue() == "Added Alice.\n"
+
+    q = queue.Queue()
+    QueueSink(q).emit("staff_added", "Added {}.", "Alice")
+    assert q.get_nowait().message == "Added Alice."
+
+
+def test_set_default_sink_routes_validation_errors(capsys):
+    sink = BufferedSink()
+    previous = events.set_default_sink(sink)
+    try:
+        assert helper.validate_string("", "name") is False
+    finally:
+        events.set_default_sink(previous)
+
+    assert sink.messages() == ["Validation Error: name cannot be empty."]
+    assert capsys.readouterr().out == ""
+
+
+def test_set_default_sink_rejects_other_types():
+    with pytest.raises(TypeError):
+        events.set_default_sink(print)
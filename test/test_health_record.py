@@ -7,6 +7,8 @@ Username: maily015
 This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
+from datetime import date
+
 import pytest
 from health_record import HealthRecord, HealthRecordClosedError
 from mammal import Mammal   # Uses your real Animal subclass
@@ -129,6 +131,14 @@ def test_close_record_twice_raises():
         rec.close_record()
 
 
+def test_health_record_date_parsed_once():
+    rec = HealthRecord(make_lion(), "injuries", "low", " 25/12/2025 ", "Test", True)
+
+    assert rec.date_reported == "25/12/2025"
+    assert rec.reported_date == date(2025, 12, 25)
+    assert rec.reported_on == date(2025, 12, 25).toordinal()
+
+
 # Adding notes
 
 def test_add_notes_success():
@@ -157,6 +167,22 @@ def test_add_notes_to_closed_record_raises():
         rec.add_notes("Trying to modify closed record")
 
 
+def test_add_notes_keeps_separate_timestamped_entries():
+    rec = HealthRecord(make_lion(), "injuries", "low", "01/02/2025", "Initial check.", True)
+
+    rec.add_notes("  Second check.  ")
+    rec.add_notes("Third check.")
+
+    entries = list(rec.iter_notes())
+    assert [e.text for e in entries] == ["Initial check.", "Second check.", "Third check."]
+    assert entries[0].timestamp <= entries[1].timestamp <= entries[2].timestamp
+    assert rec.treatment_notes == "Initial check.\nSecond check.\nThird check."
+
+    # The joined text is refreshed after later appends
+    rec.add_notes("Fourth check.")
+    assert rec.treatment_notes.endswith("\nFourth check.")
+
+
 # String output
 
 def test_health_record_str_output_contains_details():
@@ -170,3 +196,8 @@ def test_health_record_str_output_contains_details():
     assert "medium" in s
     assert "01/01/2025" in s
     assert "Test notes" in s
+
+
+def test_health_record_has_no_instance_dict():
+    rec = HealthRecord(make_lion(), "injuries", "low", "01/01/2025", "Test notes", True)
+    assert not hasattr(rec, "__dict__")
@@ -115,3 +115,80 @@ def test_validate_issue_invalid_value():
 def test_validate_issue_wrong_type():
     with pytest.raises(TypeError):
         helper.validate_issue(123, "issue")
+
+
+# Schema-based validation
+
+def make_schema():
+    return helper.Schema(
+        helper.Field("name"),
+        helper.Field("age", "int", minimum=0, maximum=250, label="Age"),
+        helper.Field("environment", "choice", helper.VALID_ENVIRONMENTS),
+        helper.Field("is_healthy", "bool"),
+        helper.Field("date", "date"),
+    )
+
+
+def test_schema_check_normalises_values(capsys):
+    values, errors = make_schema().check(" Simba ", 5, " Savannah ", True, " 29/02/2024 ")
+
+    assert errors == []
+    assert values == ["Simba", 5, "savannah", True, "29/02/2024"]
+    # The schema never prints
+    assert capsys.readouterr().out == ""
+
+
+def test_schema_check_collects_every_error():
+    values, errors = make_schema().check("", -1, "ocean", "yes", "31/02/2024")
+
+    assert [e.field for e in errors] == ["name", "age", "environment", "is_healthy", "date"]
+    assert str(errors[0]) == "name cannot be empty."
+    assert errors[1].message == "Age cannot be less than 0."
+
+
+@pytest.mark.parametrize("date_str", ["2024-12-25", "25/12/24", "32/01/2024", "1/13/2024", "aa/bb/cccc"])
+def test_schema_rejects_bad_dates(date_str):
+    _, errors = make_schema().check("Simba", 5, "savannah", True, date_str)
+    assert [e.field for e in errors] == ["date"]
+
+
+def test_day_field_converts_to_day_number():
+    schema = helper.Schema(helper.Field("reported", "day"))
+
+    assert schema.check(" 02/01/0001 ") == ([2], [])
+    _, errors = schema.check("31/02/2024")
+    assert [e.field for e in errors] == ["reported"]
+    assert helper.day_number("02/01/0001") == 2
+    assert helper.day_number("bad") is None
+
+
+def test_schema_check_wrong_number_of_values():
+    with pytest.raises(TypeError):
+        make_schema().check("Simba", 5)
+
+
+def test_schema_check_many_splits_valid_rows_and_errors():
+    rows = [
+        ("Simba", 5, "savannah", True, "01/01/2025"),
+        ("Nala", "five", "savannah", True, "01/01/2025"),
+        ("Scar", 7, "jungle", False, "02/01/2025"),
+    ]
+    valid, errors = make_schema().check_many(rows)
+
+    assert [v[0] for v in valid] == ["Simba", "Scar"]
+    assert len(errors) == 1
+    assert errors[0].row == 1 and errors[0].field == "age"
+    assert str(errors[0]) == "row 1: Age must be an integer."
+
+
+def test_field_rejects_unknown_kind_and_missing_choices():
+    with pytest.raises(ValueError):
+        helper.Field("name", "text")
+    with pytest.raises(ValueError):
+        helper.Field("environment", "choice")
+
+
+def test_report_errors_uses_event_sink(capsys):
+    _, errors = make_schema().check("", 5, "savannah", True, "01/01/2025")
+    helper.report_errors(errors)
+    assert capsys.readouterr().out == "Validation Error: name cannot be empty.\n"
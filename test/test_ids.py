@@ -0,0 +1,68 @@
+'''
+File: test_ids.py
+Description: Unit tests for the pluggable ID generators.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import uuid
+
+import pytest
+
+import ids
+from mammal import Mammal
+
+
+def test_default_generator_gives_random_uuids():
+    a = Mammal("Simba", "Lion", 5, "Meat", "savannah", True)
+    b = Mammal("Nala", "Lion", 4, "Meat", "savannah", True)
+
+    assert isinstance(a.id, uuid.UUID)
+    assert a.id.version == 4
+    assert a.id != b.id
+
+
+def test_id_generator_base_needs_call():
+    with pytest.raises(TypeError):
+        ids.IdGenerator()
+
+
+def test_sequential_generator_counts_up():
+    gen = ids.SequentialIdGenerator(start=10)
+
+    assert [gen(), gen(), gen()] == [10, 11, 12]
+
+
+def test_sequential_generator_rejects_bad_start():
+    with pytest.raises(ValueError):
+        ids.SequentialIdGenerator(start=-1)
+    with pytest.raises(ValueError):
+        ids.SequentialIdGenerator(start=2 ** 64)
+
+
+def test_uuid7_generator_is_time_ordered():
+    gen = ids.UUID7Generator()
+    values = [gen() for _ in range(5000)]
+
+    assert all(v.version == 7 for v in values)
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_use_generator_scopes_new_ids():
+    gen = ids.SequentialIdGenerator()
+
+    with ids.use_generator(gen):
+        inside = Mammal("Simba", "Lion", 5, "Meat", "savannah", True)
+    outside = Mammal("Nala", "Lion", 4, "Meat", "savannah", True)
+
+    assert inside.id == 1
+    assert isinstance(outside.id, uuid.UUID)
+
+
+def test_use_generator_rejects_non_callable():
+    with pytest.raises(TypeError):
+        with ids.use_generator("not a generator"):
+            pass
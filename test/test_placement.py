@@ -0,0 +1,86 @@
+'''
+File: test_placement.py
+Description: Unit tests for the PlacementIndex class.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+from placement import PlacementIndex
+from enclosure import Enclosure
+from mammal import Mammal
+
+
+def make_lion(name="Simba"):
+    return Mammal(name, "Lion", 5, "Meat", "savannah", True)
+
+
+def test_find_returns_none_without_enclosures():
+    index = PlacementIndex()
+    assert index.find(make_lion()) is None
+
+
+def test_find_prefers_enclosure_with_same_species():
+    index = PlacementIndex()
+    empty = Enclosure(size=300, environment="savannah")
+    lions = Enclosure(size=300, environment="savannah")
+    lions.add_animal(make_lion("Nala"))
+    index.update(empty)
+    index.update(lions)
+
+    assert index.find(make_lion()) is lions
+
+
+def test_find_skips_full_and_incompatible_enclosures():
+    index = PlacementIndex()
+    full = Enclosure(size=100, environment="savannah")
+    full.add_animal(make_lion("Nala"))
+    tigers = Enclosure(size=300, environment="savannah")
+    tigers.add_animal(Mammal("Sheru", "Tiger", 4, "Meat", "savannah", True))
+    aquatic = Enclosure(size=300, environment="aquatic")
+    for enc in (full, tigers, aquatic):
+        index.update(enc)
+
+    assert index.find(make_lion()) is None
+
+
+def test_update_and_discard_refresh_the_index():
+    index = PlacementIndex()
+    enc = Enclosure(size=100, environment="savannah")
+    index.update(enc)
+    assert index.find(make_lion()) is enc
+
+    enc.add_animal(make_lion("Nala"))
+    index.update(enc)
+    assert index.find(make_lion()) is None
+
+    enc.remove_animal(enc.animals[0])
+    index.update(enc)
+    assert index.find(make_lion()) is enc
+
+    index.discard(enc)
+    assert index.find(make_lion()) is None
+    assert len(index) == 0
+
+
+def test_churn_does_not_grow_the_heaps():
+    index = PlacementIndex()
+    enclosure = Enclosure(size=300, environment="savannah")
+    other = Enclosure(size=300, environment="savannah")
+    index.update(enclosure)
+    index.update(other)
+    lion = make_lion()
+
+    for _ in range(10_000):
+        enclosure.add_animal(lion)
+        index.update(enclosure)
+        index.update(enclosure)  # unchanged: no new entry
+        enclosure.remove_animal(lion)
+        index.update(enclosure)
+
+    assert all(size <= 4 for size in index._heap_sizes().values())
+    assert index.find(make_lion("Nala")) in (enclosure, other)
+
+    index.discard(enclosure)
+    assert index.find(make_lion("Nala")) is other
@@ -0,0 +1,196 @@
+'''
+File: test_registry.py
+Description: Unit tests for the Registry and NameIndex classes.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import pytest
+
+import ids
+
+from registry import Registry, NameIndex, SequenceView
+from mammal import Mammal
+
+
+def make_lion(name="Simba"):
+    return Mammal(name, "Lion", 5, "Meat", "savannah", True)
+
+
+def test_registry_add_and_contains():
+    reg = Registry()
+    lion = make_lion()
+
+    assert reg.add(lion) is True
+    assert lion in reg
+    assert len(reg) == 1
+
+    # Adding the same object again is ignored
+    assert reg.add(lion) is False
+    assert len(reg) == 1
+
+
+def test_registry_add_rejects_a_different_object_with_the_same_id():
+    reg = Registry()
+    with ids.use_generator(ids.SequentialIdGenerator()):
+        lion = make_lion()
+    with ids.use_generator(ids.SequentialIdGenerator()):
+        clash = make_lion("Nala")
+    reg.add(lion)
+
+    with pytest.raises(ValueError):
+        reg.add(clash)
+    assert list(reg) == [lion]
+
+
+def test_registry_keeps_insertion_order():
+    lions = [make_lion(name) for name in ("Simba", "Nala", "Mufasa")]
+    reg = Registry(lions)
+
+    assert list(reg) == lions
+
+    reg.remove(lions[1])
+    assert list(reg) == [lions[0], lions[2]]
+
+
+def test_registry_get_by_id():
+    lion = make_lion()
+    reg = Registry([lion])
+
+    assert reg.get(lion.id) is lion
+    assert reg.get("missing") is None
+
+
+def test_registry_remove_missing_raises():
+    reg = Registry()
+
+    with pytest.raises(KeyError):
+        reg.remove(make_lion())
+
+
+def test_registry_discard_and_clear():
+    lion = make_lion()
+    reg = Registry([lion])
+
+    assert reg.discard(lion) is True
+    assert reg.discard(lion) is False
+
+    reg.add(lion)
+    reg.clear()
+    assert not reg
+
+
+def test_registry_contains_ignores_unrelated_objects():
+    reg = Registry([make_lion()])
+
+    assert None not in reg
+    assert "Simba" not in reg
+
+
+# NameIndex
+
+def test_name_index_exact_lookup_is_case_insensitive():
+    index = NameIndex()
+    simba = make_lion("Simba")
+    other = make_lion("simba")
+    index.add(simba)
+    index.add(other)
+
+    assert index.find(" SIMBA ") == [simba, other]
+    assert index.first("simba") is simba
+    assert index.find("Nala") == []
+    assert index.first("Nala") is None
+
+
+def test_name_index_discard_removes_empty_names():
+    index = NameIndex()
+    simba = make_lion("Simba")
+    index.add(simba)
+
+    index.discard(simba)
+    index.discard(simba)  # second discard is a no-op
+
+    assert index.find("Simba") == []
+    assert index.prefix("S") == []
+    assert len(index) == 0
+
+
+def test_name_index_shared_name_grows_and_shrinks():
+    index = NameIndex()
+    first, second, third = make_lion("Simba"), make_lion("Simba"), make_lion("Simba")
+    index.add(first)
+    index.add(first)  # adding the same item again is a no-op
+    assert index.find("Simba") == [first]
+
+    index.add(second)
+    index.add(third)
+    index.discard(first)
+    assert index.find("Simba") == [second, third]
+
+    index.discard(third)
+    assert index.find("simba") == [second]
+    assert index.prefix("s") == [second]
+    index.discard(first)  # no longer indexed: a no-op
+    assert index.first("Simba") is second
+    assert len(index) == 1
+
+
+def test_name_index_prefix_sorted_and_limited():
+    index = NameIndex()
+    for name in ("Nala", "Simba", "Sarabi", "Scar", "Shenzi"):
+        index.add(make_lion(name))
+
+    names = [a.name for a in index.prefix("s")]
+    assert names == ["Sarabi", "Scar", "Shenzi", "Simba"]
+
+    assert [a.name for a in index.prefix("S", limit=2)] == ["Sarabi", "Scar"]
+    assert index.prefix("S", limit=0) == []
+    assert index.prefix("x") == []
+
+
+def test_name_index_prefix_after_remove_and_re_add():
+    index = NameIndex()
+    simba = make_lion("Simba")
+    scar = make_lion("Scar")
+    index.add(simba)
+    index.add(scar)
+    assert index.prefix("s") == [scar, simba]
+
+    index.discard(simba)
+    assert index.prefix("s") == [scar]
+
+    again = make_lion("SIMBA")
+    index.add(again)
+    assert index.prefix("s") == [scar, again]
+
+
+# SequenceView
+
+def test_sequence_view_is_live_and_read_only():
+    simba, nala = make_lion("Simba"), make_lion("Nala")
+    reg = Registry([simba])
+    view = SequenceView(reg)
+
+    assert view == [simba]
+    reg.add(nala)
+    assert view == (simba, nala)
+    assert view[1] is nala and view[-1] is nala
+    assert nala in view and len(view) == 2
+    assert view.index(nala) == 1
+    assert not hasattr(view, "append") and not hasattr(view, "clear")
+
+
+def test_registry_snapshot_is_cached_until_change():
+    simba = make_lion("Simba")
+    reg = Registry([simba])
+
+    first = reg.snapshot()
+    assert reg.snapshot() is first
+
+    version = reg.version
+    reg.add(make_lion("Nala"))
+    assert reg.version != version
+    assert reg.snapshot() is not first
+    assert len(reg.snapshot()) == 2
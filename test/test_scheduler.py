@@ -0,0 +1,267 @@
+'''
+File: test_scheduler.py
+Description: Unit tests for the batch daily schedule.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+import random
+import sys
+import threading
+import time
+
+import pytest
+
+from enclosure import Enclosure
+from events import BufferedSink, NullSink
+from mammal import Mammal
+from veterinarian import Veterinarian
+from scheduler import BatchDay, run_concurrently
+from zoo import Zoo
+from zookeeper import Zookeeper
+
+try:
+    import numpy  # noqa: F401
+    MODES = [False, True]
+except ImportError:
+    MODES = [False]
+
+
+def state(zoo: Zoo) -> list:
+    return [(e.clean_level, [a.is_healthy for a in e.animals]) for e in zoo.enclosures]
+
+
+@pytest.mark.parametrize("use_numpy", MODES)
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_day_matches_per_object_schedule(seed, use_numpy, build_zoo):
+    expected = build_zoo(seed)
+    expected.schedule_daily_feeding()
+    expected.schedule_daily_cleaning()
+
+    zoo = build_zoo(seed)
+    BatchDay([s for s in zoo.staff if isinstance(s, Zookeeper)], use_numpy).run(NullSink())
+
+    assert state(zoo) == state(expected)
+
+
+@pytest.mark.parametrize("use_numpy", MODES)
+def test_batch_feed_alone_matches_feeding_round(use_numpy, build_zoo):
+    expected = build_zoo(7)
+    expected.schedule_daily_feeding()
+
+    zoo = build_zoo(7)
+    BatchDay([s for s in zoo.staff if isinstance(s, Zookeeper)], use_numpy).feed()
+
+    assert state(zoo) == state(expected)
+
+
+def test_shared_enclosure_loses_one_level_per_zookeeper():
+    enclosure = Enclosure(10, "savannah")
+    lion = Mammal("Simba", "Lion", 5, "Meat", "savannah", True)
+    enclosure.add_animal(lion)
+    keepers = [Zookeeper(f"Keeper {k}") for k in range(3)]
+    for keeper in keepers:
+        keeper.assign_enclosure(enclosure)
+
+    day = BatchDay(keepers, use_numpy=False)
+    assert day.enclosures == [enclosure]
+    assert day.feed() == 1
+    assert enclosure.clean_level == 2
+    assert lion.is_healthy is False
+
+    day.clean()
+    assert enclosure.clean_level == 5
+
+
+def test_batch_day_raises_before_changing_anything():
+    enclosure = Enclosure(10, "savannah")
+    busy, idle = Zookeeper("Alice"), Zookeeper("Bob")
+    busy.assign_enclosure(enclosure)
+
+    with pytest.raises(RuntimeError):
+        BatchDay([busy, idle])
+    assert enclosure.clean_level == 5
+
+
+def test_zoo_run_batch_daily_schedule_reports_summary(build_zoo):
+    sink = BufferedSink()
+    zoo = build_zoo(3)
+    zoo.sink = sink
+
+    sick = zoo.run_batch_daily_schedule()
+
+    names = [e.name for e in sink.events]
+    assert "batch_feeding_done" in names and "batch_cleaning_done" in names
+    assert "animal_fed" not in names
+    assert sick >= 0
+    assert all(e.clean_level == 5 for s in zoo.staff for e in s.assigned_enclosure_view)
+
+
+def test_zoo_batch_plan_follows_assignment_changes():
+    zoo = Zoo("Batch Zoo", sink=NullSink())
+    first, second = Enclosure(100, "savannah"), Enclosure(100, "savannah")
+    keeper = Zookeeper("Alice")
+    keeper.assign_enclosure(first)
+    zoo.add_staff(keeper)
+    zoo.add_enclosures([first, second])
+
+    second.decrease_cleanliness()
+    zoo.run_batch_daily_schedule()
+    assert (first.clean_level, second.clean_level) == (5, 4)
+
+    keeper.assign_enclosure(second)
+    zoo.run_batch_daily_schedule()
+    assert (first.clean_level, second.clean_level) == (5, 5)
+
+
+# Concurrent schedule
+
+@pytest.fixture
+def tiny_switch_interval():
+    """Make threads switch very often so races show up quickly."""
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(previous)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_concurrent_day_matches_sequential_schedule(seed, build_zoo):
+    expected = build_zoo(seed)
+    expected.schedule_daily_feeding()
+    expected.schedule_daily_cleaning()
+
+    zoo = build_zoo(seed)
+    zoo.run_concurrent_daily_schedule(max_workers=4)
+
+    assert state(zoo) == state(expected)
+
+
+def test_concurrent_feeding_loses_no_clean_level_updates(tiny_switch_interval):
+    enclosures = [Enclosure(500, "savannah") for _ in range(4)]
+    keepers = [Zookeeper(f"Keeper {k}") for k in range(8)]
+    for keeper in keepers:
+        keeper._sink = NullSink()
+        keeper.assign_enclosures(enclosures)
+    for enclosure in enclosures:
+        enclosure._sink = NullSink()
+
+    rounds = 50
+    run_concurrently([[(k, "feed") for k in keepers] * rounds], max_workers=8)
+
+    assert [e.clean_level for e in enclosures] == [5 - len(keepers) * rounds] * 4
+
+
+def test_concurrent_health_updates_keep_table_in_step(tiny_switch_interval):
+    pytest.importorskip("numpy")
+    zoo = Zoo("Thread Zoo", sink=NullSink())
+    lions = [Mammal(f"Lion {i}", "Lion", 5, "Meat", "savannah", True) for i in range(20)]
+    zoo.add_animals(lions)
+    zoo.enable_animal_table()
+
+    def flip(seed):
+        rng = random.Random(seed)
+        for _ in range(5000):
+            rng.choice(lions).is_healthy = rng.random() < 0.5
+
+    threads = [threading.Thread(target=flip, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The table's health column must agree with every animal's own flag
+    assert zoo.count_animals(healthy=True) == sum(a.is_healthy for a in lions)
+    assert set(zoo.find_animals(healthy=False)) == {a for a in lions if not a.is_healthy}
+
+
+def test_concurrent_sickness_and_healing_lose_no_updates(tiny_switch_interval):
+    # Shared enclosures go dirty while healers work on the same animals.
+    # After the barrier only the keepers' last visits run, so every animal
+    # in a dirty enclosure must end sick and every other animal healthy.
+    zoo = Zoo("Thread Zoo", sink=NullSink())
+    dirty = [Enclosure(2000, "savannah") for _ in range(3)]
+    clean = Enclosure(2000, "savannah")
+    for enclosure in dirty + [clean]:
+        enclosure._sink = NullSink()
+        for i in range(8):
+            assert enclosure.add_animal(Mammal(f"Lion {i}", "Lion", 5, "Meat", "savannah", True))
+    zoo.add_enclosures(dirty + [clean])
+    zoo.add_animals(a for e in dirty + [clean] for a in e.animals)
+    for animal in clean.animals:
+        animal.is_healthy = False
+    animals = list(zoo.animals)
+
+    keepers, healers, rounds = 4, 4, 1000
+    barrier = threading.Barrier(keepers + healers)
+
+    def keep(seed):
+        rng = random.Random(seed)
+        for _ in range(rounds - 1):
+            rng.choice(dirty).decrease_cleanliness()
+        barrier.wait()
+        for enclosure in dirty:
+            enclosure.decrease_cleanliness()
+
+    def heal(seed):
+        rng = random.Random(seed)
+        for _ in range(rounds * 5):
+            rng.choice(animals).heal()
+        barrier.wait()
+
+    threads = [threading.Thread(target=keep, args=(seed,)) for seed in range(keepers)]
+    threads += [threading.Thread(target=heal, args=(seed,)) for seed in range(healers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(5 - e.clean_level for e in dirty) == keepers * (rounds - 1) + keepers * len(dirty)
+    assert all(e.clean_level <= 2 for e in dirty)
+    assert [a.is_healthy for e in dirty for a in e.animals] == [False] * 24
+    assert [a.is_healthy for a in clean.animals] == [True] * 8
+    assert zoo.count_animals(healthy=False) == 24
+
+
+def test_concurrent_health_checks_ask_one_question_at_a_time(monkeypatch, capsys):
+    zoo = Zoo("Thread Zoo", sink=NullSink())
+    vets = [Veterinarian(f"Dr. {k}") for k in range(4)]
+    for k, vet in enumerate(vets):
+        lions = [Mammal(f"Lion {k}-{i}", "Lion", 5, "Meat", "savannah", False) for i in range(3)]
+        vet.assign_animals(lions)
+        zoo.add_animals(lions)
+    zoo.add_staff_many(vets)
+    answers = {"Enter issue": "injuries", "Enter severity": "high", "Enter date": "01/01/2025"}
+    asked = []
+
+    def fake_input(prompt=""):
+        asked.append(threading.get_ident())
+        time.sleep(0.001)  # give other threads every chance to cut in
+        if not prompt:
+            return "y"
+        return next((a for start, a in answers.items() if prompt.startswith(start)), "Treated.")
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    zoo.run_concurrent_daily_schedule(max_workers=4)
+
+    # Every question (the y/n answer plus four fields) came from one thread uninterrupted
+    assert len(asked) == 5 * 12
+    assert all(len(set(asked[i:i + 5])) == 1 for i in range(0, len(asked), 5))
+    assert len(zoo.get_animals_under_treatment()) == 12
+    capsys.readouterr()
+
+
+def test_run_concurrently_raises_first_error_and_stops():
+    busy, idle = Zookeeper("Alice"), Zookeeper("Bob")
+    enclosure = Enclosure(100, "savannah")
+    enclosure._sink = NullSink()
+    busy._sink = NullSink()
+    busy.assign_enclosure(enclosure)
+
+    with pytest.raises(RuntimeError):
+        run_concurrently([[(busy, "feed"), (idle, "feed")], [(busy, "clean")]])
+
+    # The feeding phase finished; the cleaning phase never ran
+    assert enclosure.clean_level == 4
@@ -0,0 +1,132 @@
+'''
+File: test_simulation.py
+Description: Unit tests for the multi-day simulation.
+Author: Le Tuan Mai
+ID: 110439345
+Username: maily015
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+from datetime import date
+
+import pytest
+
+from enclosure import Enclosure
+from events import NullSink
+from mammal import Mammal
+from simulation import Simulation, SICK_LEVEL
+from veterinarian import Veterinarian
+from zoo import Zoo
+from zookeeper import Zookeeper
+
+
+def shared_enclosure_zoo(keepers: int = 3) -> tuple[Zoo, Enclosure, Veterinarian]:
+    """One enclosure of healthy lions visited by several zookeepers, with a vet for them."""
+    zoo = Zoo("Simulation Zoo", sink=NullSink())
+    enclosure = Enclosure(1000, "savannah")
+    enclosure._sink = NullSink()
+    lions = [Mammal(f"Lion {i}", "Lion", 5, "Meat", "savannah", True) for i in range(4)]
+    for lion in lions:
+        enclosure.add_animal(lion)
+    zoo.add_enclosure(enclosure)
+    zoo.add_animals(lions)
+    for k in range(keepers):
+        keeper = Zookeeper(f"Keeper {k}")
+        keeper.assign_enclosure(enclosure)
+        zoo.add_staff(keeper)
+    vet = Veterinarian("Dr. A")
+    vet.assign_animals(lions)
+    zoo.add_staff(vet)
+    return zoo, enclosure, vet
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_simulation_matches_daily_schedule_loop(seed, build_zoo):
+    expected = build_zoo(seed)
+    levels, sick = [], []
+    for _ in range(15):
+        expected.schedule_daily_feeding()
+        enclosures = expected.enclosures
+        levels.append(sum(e.clean_level for e in enclosures) / len(enclosures))
+        sick.append(expected.count_animals(healthy=False))
+        expected.schedule_daily_cleaning()
+
+    series = Simulation(build_zoo(seed), policy=None).run(15)
+
+    assert series.column("mean_clean_level") == pytest.approx(levels)
+    assert series.column("sick_animals") == sick
+    assert series.column("day") == list(range(1, 16))
+
+
+def test_settled_zoo_is_fast_forwarded():
+    zoo, enclosure, _ = shared_enclosure_zoo(keepers=1)
+    simulation = Simulation(zoo)
+
+    series = simulation.run(10_000)
+
+    assert len(series) == simulation.day == 10_000
+    assert series.skipped_days >= 9_990
+    assert series[-1].day == 10_000
+    assert set(series.column("mean_clean_level")) == {4.0}
+    assert enclosure.clean_level == 5
+
+
+def test_treatment_heals_and_animals_fall_sick_again():
+    zoo, enclosure, vet = shared_enclosure_zoo(keepers=3)
+
+    series = Simulation(zoo, treatment_days=2).run(7)
+
+    # Three visits leave the enclosure at level 2, so its lions fall sick
+    # every day they are healthy; a treatment takes two days
+    assert series.column("dirty_enclosures") == [1] * 7
+    assert series.column("new_cases") == [4, 0, 4, 0, 4, 0, 4]
+    assert series.column("in_treatment") == [4] * 7
+    assert vet.records == []
+
+
+def test_scheduled_action_changes_the_forecast():
+    zoo, enclosure, vet = shared_enclosure_zoo(keepers=1)
+    simulation = Simulation(zoo, policy=None)
+    extra = [Zookeeper("Extra 1"), Zookeeper("Extra 2")]
+
+    def hire(z):
+        for keeper in extra:
+            keeper.assign_enclosure(enclosure)
+            z.add_staff(keeper)
+
+    simulation.schedule(50, hire)
+    series = simulation.run(100)
+
+    assert series[48].sick_animals == 0
+    assert series[49].sick_animals == 4 and series[49].new_cases == 4
+    assert series[49].mean_clean_level == SICK_LEVEL
+    assert series[-1].sick_animals == 4
+    assert series.skipped_days > 90
+    with pytest.raises(ValueError):
+        simulation.schedule(100, hire)
+
+
+def test_keep_records_opens_dated_records_and_closes_them():
+    zoo, enclosure, vet = shared_enclosure_zoo(keepers=3)
+    simulation = Simulation(zoo, treatment_days=1, keep_records=True, start=date(2025, 3, 1))
+
+    simulation.run(3)
+
+    # Healed each morning, sick again by the evening: a new record every day
+    records = zoo.records_between("01/03/2025", "31/03/2025")
+    assert len(records) == 12
+    assert {r.date_reported for r in records} == {"01/03/2025", "02/03/2025", "03/03/2025"}
+    assert [r.active for r in records] == [False] * 8 + [True] * 4
+    assert simulation.series.date_of(3) == date(2025, 3, 3)
+
+
+def test_simulation_rejects_bad_settings():
+    zoo = Zoo("Simulation Zoo", sink=NullSink())
+    with pytest.raises(ValueError):
+        Simulation(zoo, treatment_days=0)
+    with pytest.raises(TypeError):
+        Simulation(zoo, policy="treat")
+    with pytest.raises(ValueError):
+        Simulation(zoo).run(-1)
+    with pytest.raises(KeyError):
+        Simulation(zoo).series.column("weather")
@@ -188,6 +188,50 @@ def test_assigned_animal_returns_copy():
     assert len(vet.assigned_animal) == 1
 
 
+def test_assign_and_unassign_animals_in_bulk():
+    vet = DummyVeterinarian("Dr. Bob")
+    lions = [make_lion(name) for name in ("Simba", "Nala", "Scar")]
+
+    assert vet.assign_animals(lions + lions[:1]) == 3
+    assert vet.assigned_animal == lions
+    assert vet.assign_animals(lions) == 0
+
+    assert vet.unassign_animals([lions[0], lions[2]]) == 2
+    assert vet.assigned_animal == [lions[1]]
+    assert vet.unassign_animal(lions[0]) is False
+    assert vet.unassign_animal(lions[1]) is True
+
+
+def test_bulk_assign_is_all_or_nothing():
+    vet = DummyVeterinarian("Dr. Bob")
+
+    with pytest.raises(TypeError):
+        vet.assign_animals([make_lion(), "not an animal"])
+    assert vet.assigned_animal == []
+
+
+def test_assign_and_unassign_enclosures_in_bulk():
+    zk = DummyZookeeper("Alice")
+    enclosures = [make_enclosure(), make_enclosure()]
+
+    assert zk.assign_enclosures(enclosures) == 2
+    assert zk.unassign_enclosure(enclosures[0]) is True
+    assert zk.assigned_enclosure == [enclosures[1]]
+    assert zk.unassign_enclosures(enclosures) == 1
+
+
+def test_assigned_views_are_live_without_copying():
+    vet = DummyVeterinarian("Dr. Bob")
+    view = vet.assigned_animal_view
+    lion = make_lion()
+
+    vet.assign_animal(lion)
+
+    assert vet.assigned_animal_view is view
+    assert view == [lion] and lion in view
+    assert not hasattr(view, "clear")
+
+
 # Display helpers & __str__
 
 def test_display_enclosure_prints_environment(capsys):
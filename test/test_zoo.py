@@ -7,14 +7,26 @@ Username: maily015
 This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
+import asyncio
+import gc
+import os
+import subprocess
+import sys
+import tracemalloc
+import weakref
+from datetime import date
+
 import pytest
 
+import ids
 from zoo import Zoo
 from zookeeper import Zookeeper
 from veterinarian import Veterinarian
 from enclosure import Enclosure
 from mammal import Mammal
 from health_record import HealthRecord
+from events import BufferedSink, NullSink
+from archive import MemoryArchive, RecordArchive
 
 
 def make_zoo():
@@ -115,6 +127,49 @@ def test_add_and_remove_animal(capsys):
     assert lion not in enc.animals
 
 
+def test_enclosure_of_tracks_enclosure_changes():
+    zoo = make_zoo()
+    lion = make_lion()
+    zoo.add_animal(lion)
+    enc = make_savannah_enclosure()
+    zoo.add_enclosure(enc)
+
+    assert zoo.enclosure_of(lion) is None
+
+    enc.add_animal(lion)
+    assert zoo.enclosure_of(lion) is enc
+
+    enc.remove_animal(lion)
+    assert zoo.enclosure_of(lion) is None
+
+    # Animals already inside an enclosure are picked up when it joins the zoo
+    other = make_savannah_enclosure()
+    other.add_animal(lion)
+    zoo.add_enclosure(other)
+    assert zoo.enclosure_of(lion) is other
+
+    zoo.remove_animal(lion)
+    assert zoo.enclosure_of(lion) is None
+    assert other.animals == []
+
+
+def test_remove_animal_takes_it_out_of_every_enclosure():
+    zoo = make_zoo()
+    lion = make_lion()
+    zoo.add_animal(lion)
+    first, second = make_savannah_enclosure(), make_savannah_enclosure()
+    first.add_animal(lion)
+    zoo.add_enclosures([first, second])
+    second.add_animal(lion)
+    assert zoo.enclosure_of(lion) is first
+
+    zoo.remove_animal(lion)
+
+    assert lion not in first.animals
+    assert lion not in second.animals
+    assert zoo.enclosure_of(lion) is None
+
+
 def test_remove_animal_not_in_zoo_raises():
     zoo = make_zoo()
     lion = make_lion()
@@ -156,6 +211,70 @@ def test_remove_enclosure_not_in_zoo_raises():
         zoo.remove_enclosure(enc)
 
 
+# --- Bulk ingestion ---------------------------------------------------------
+
+
+def test_add_animals_reports_added_skipped_and_failed(capsys):
+    zoo = make_zoo()
+    simba = make_lion("Simba")
+    nala = make_lion("Nala")
+    zoo.add_animal(simba)
+    capsys.readouterr()
+
+    result = zoo.add_animals([simba, nala, "not an animal", nala])
+
+    assert result.added == [nala]
+    assert result.skipped == [simba, nala]
+    assert len(result.failed) == 1
+    assert result.failed[0][0] == "not an animal"
+    assert isinstance(result.failed[0][1], TypeError)
+    assert not result.ok
+
+    assert zoo.animals == [simba, nala]
+    assert zoo.find_animal_by_name("nala") == [nala]
+
+    # One summary line instead of one line per animal
+    out = capsys.readouterr().out
+    assert out.count("\n") == 2
+    assert "1 added, 2 skipped, 1 failed" in out
+
+
+def test_add_animals_reports_an_id_clash_as_failed():
+    zoo = make_zoo()
+    with ids.use_generator(ids.SequentialIdGenerator()):
+        simba = make_lion("Simba")
+    with ids.use_generator(ids.SequentialIdGenerator()):
+        impostor = make_lion("Nala")
+    zoo.add_animal(simba)
+
+    result = zoo.add_animals([simba, impostor])
+
+    assert result.skipped == [simba]
+    assert [item for item, _ in result.failed] == [impostor]
+    assert isinstance(result.failed[0][1], ValueError)
+    assert zoo.animals == [simba]
+    assert zoo.find_animal_by_name("Nala") == []
+
+    with pytest.raises(ValueError):
+        zoo.add_animal(impostor)
+
+
+def test_add_staff_many_and_add_enclosures():
+    zoo = make_zoo()
+    zk = Zookeeper("Alice")
+    vet = Veterinarian("Dr. A")
+    enc = make_savannah_enclosure()
+
+    staff_result = zoo.add_staff_many([zk, vet, object()])
+    enc_result = zoo.add_enclosures(iter([enc]))
+
+    assert staff_result.added == [zk, vet]
+    assert len(staff_result.failed) == 1
+    assert enc_result.ok
+    assert zoo.staff == [zk, vet]
+    assert zoo.find_enclosure_by_environment("savannah") == [enc]
+
+
 # --- Search helpers ---------------------------------------------------------
 
 
@@ -184,6 +303,27 @@ def test_find_staff_by_id():
     assert zoo.find_staff_by_id(random_id) is None
 
 
+@pytest.mark.parametrize(
+    "generator", [ids.SequentialIdGenerator(), ids.UUID7Generator(), ids.UUID4Generator()]
+)
+def test_find_staff_by_id_with_zoo_generator(generator):
+    zoo = Zoo("Timmy Zoo", id_generator=generator)
+    with zoo.id_scope():
+        zk = Zookeeper("Alice")
+        vet = Veterinarian("Dr. A")
+    zoo.add_staff_many([zk, vet])
+
+    assert zoo.id_generator is generator
+    assert zoo.find_staff_by_id(zk.id) is zk
+    assert zoo.find_staff_by_id(vet.id) is vet
+    assert zk.id != vet.id
+
+
+def test_zoo_rejects_non_callable_id_generator():
+    with pytest.raises(TypeError):
+        Zoo("Timmy Zoo", id_generator=42)
+
+
 def test_find_animal_by_name():
     zoo = make_zoo()
     lion1 = make_lion("Simba")
@@ -196,6 +336,24 @@ def test_find_animal_by_name():
     assert lion1 in result and lion2 in result
 
 
+def test_find_by_prefix_and_index_follows_removal():
+    zoo = make_zoo()
+    simba = make_lion("Simba")
+    scar = make_lion("Scar")
+    nala = make_lion("Nala")
+    for lion in (simba, scar, nala):
+        zoo.add_animal(lion)
+    zoo.add_staff(Zookeeper("Sam"))
+
+    assert zoo.find_animal_by_prefix("s") == [scar, simba]
+    assert zoo.find_animal_by_prefix("s", limit=1) == [scar]
+    assert [s.name for s in zoo.find_staff_by_prefix("SA")] == ["Sam"]
+
+    zoo.remove_animal(scar)
+    assert zoo.find_animal_by_prefix("s") == [simba]
+    assert zoo.find_animal_by_name("scar") == []
+
+
 def test_find_enclosure_by_environment():
     zoo = make_zoo()
     e1 = make_savannah_enclosure()
@@ -210,6 +368,165 @@ def test_find_enclosure_by_environment():
     assert aquatic_encs == [e2]
 
 
+def test_find_enclosure_by_environment_after_removal():
+    zoo = make_zoo()
+    e1 = make_savannah_enclosure()
+    e2 = make_savannah_enclosure()
+    zoo.add_enclosure(e1)
+    zoo.add_enclosure(e2)
+
+    zoo.remove_enclosure(e1)
+    assert zoo.find_enclosure_by_environment("savannah") == [e2]
+    assert zoo.find_enclosure_by_environment("arctic") == []
+
+
+def test_place_animal_fills_compatible_enclosures():
+    zoo = make_zoo()
+    small = Enclosure(size=100, environment="savannah")
+    large = Enclosure(size=300, environment="savannah")
+    zoo.add_enclosure(Enclosure(size=300, environment="aquatic"))
+    zoo.add_enclosure(small)
+    zoo.add_enclosure(large)
+
+    lions = [make_lion(f"Lion {i}") for i in range(5)]
+    for lion in lions:
+        zoo.add_animal(lion)
+
+    placed = [zoo.place_animal(lion) for lion in lions]
+
+    # The first lion takes the smallest enclosure, the rest go together
+    assert placed[0] is small
+    assert placed[1:4] == [large, large, large]
+    assert placed[4] is None
+    assert large.animals == lions[1:4]
+
+
+def test_place_animal_follows_manual_enclosure_changes():
+    zoo = make_zoo()
+    enc = Enclosure(size=100, environment="savannah")
+    zoo.add_enclosure(enc)
+    simba = make_lion("Simba")
+    nala = make_lion("Nala")
+    zoo.add_animal(simba)
+    zoo.add_animal(nala)
+
+    enc.add_animal(simba)
+    assert zoo.place_animal(nala) is None
+
+    enc.remove_animal(simba)
+    assert zoo.place_animal(nala) is enc
+
+
+def test_place_animal_rejects_housed_animal():
+    zoo = make_zoo()
+    enc = make_savannah_enclosure()
+    zoo.add_enclosure(enc)
+    lion = make_lion()
+    zoo.add_animal(lion)
+    enc.add_animal(lion)
+
+    with pytest.raises(ValueError):
+        zoo.place_animal(lion)
+
+
+def test_place_animal_requires_zoo_animal():
+    zoo = make_zoo()
+    with pytest.raises(ValueError):
+        zoo.place_animal(make_lion())
+    with pytest.raises(TypeError):
+        zoo.place_animal("Simba")
+
+
+# --- Census queries ------------------------------------------------------------
+
+
+@pytest.fixture(params=[False, True], ids=["loop", "table"])
+def census_zoo(request):
+    zoo = make_zoo()
+    zoo.add_animals([
+        Mammal("Simba", "Lion", 12, "Meat", "savannah", False),
+        Mammal("Nala", "Lion", 4, "Meat", "savannah", True),
+        Mammal("Kala", "Gorilla", 20, "Fruit", "jungle", False),
+    ])
+    if request.param:
+        pytest.importorskip("numpy")
+        zoo.enable_animal_table()
+        assert zoo.has_animal_table
+    return zoo
+
+
+def test_census_queries(census_zoo):
+    zoo = census_zoo
+    simba, nala, kala = zoo.animals
+
+    assert zoo.find_animals(environment="Savannah", healthy=False, min_age=10) == [simba]
+    assert zoo.count_animals(species="lion") == 2
+    assert zoo.count_animals(max_age=3) == 0
+    assert zoo.mean_age_by_species() == {"lion": 8.0, "gorilla": 20.0}
+
+
+def test_census_queries_follow_zoo_changes(census_zoo):
+    zoo = census_zoo
+    simba, nala, kala = zoo.animals
+
+    zoo.remove_animal(kala)
+    simba.heal()
+    cub = Mammal("Kiara", "Lion", 1, "Milk", "savannah", True)
+    zoo.add_animal(cub)
+
+    assert sorted(a.name for a in zoo.find_animals(healthy=True)) == ["Kiara", "Nala", "Simba"]
+    assert zoo.mean_age_by_species() == {"lion": 17 / 3}
+
+    zoo.disable_animal_table()
+    assert not zoo.has_animal_table
+    assert zoo.count_animals(species="lion") == 3
+
+
+class FakeTable:
+    """Stands in for AnimalTable so the zoo's bookkeeping is tested without NumPy."""
+
+    def __init__(self, animals=(), capacity=0):
+        self.rows = []
+        for animal in animals:
+            self.add(animal)
+
+    def add(self, animal):
+        if animal._table is not None and animal._table is not self:
+            raise ValueError(f"{animal.name} already belongs to another AnimalTable.")
+        self.rows.append(animal)
+        animal._table = self
+
+    def discard(self, animal):
+        if animal in self.rows:
+            self.rows.remove(animal)
+            animal._table = None
+
+
+def test_add_animal_bound_to_another_table_leaves_zoo_unchanged(monkeypatch):
+    monkeypatch.setattr("animal_table.AnimalTable", FakeTable)
+    lion = make_lion()
+    other = make_zoo()
+    other.add_animal(lion)
+    other.enable_animal_table()
+    zoo = make_zoo()
+    zoo.enable_animal_table()
+
+    with pytest.raises(ValueError):
+        zoo.add_animal(lion)
+    assert zoo.animals == []
+    assert zoo.find_animal_by_name("Simba") == []
+
+    result = zoo.add_animals([lion])
+    assert [item for item, _ in result.failed] == [lion]
+    assert zoo.animals == []
+
+    # Once free of the other table it can be added normally
+    other.disable_animal_table()
+    zoo.add_animal(lion)
+    assert zoo.animals == [lion]
+    assert lion._table is not None
+
+
 # --- Health records & treatment --------------------------------------------
 
 
@@ -238,8 +555,8 @@ def test_get_health_records_for_animal_collects_from_all_vets(capsys):
     rec1 = HealthRecord(lion, "injuries", "low", "01/01/2025", "Note 1", True)
     rec2 = HealthRecord(lion, "illness", "medium", "02/01/2025", "Note 2", False)
 
-    vet1.get_records(lion).append(rec1)
-    vet2.get_records(lion).append(rec2)
+    vet1.add_record(rec1)
+    vet2.add_record(rec2)
 
     records = zoo.get_health_records_for_animal(lion)
     out = capsys.readouterr().out
@@ -250,6 +567,140 @@ def test_get_health_records_for_animal_collects_from_all_vets(capsys):
     assert "HEALTH RECORD" in out
 
 
+def test_health_record_index_follows_generate_record_and_staff_changes():
+    zoo = make_zoo()
+    lion = make_lion(healthy=False)
+    zoo.add_animal(lion)
+
+    vet = Veterinarian("Dr. A")
+    vet.assign_animal(lion)
+    early = vet.generate_record(lion, auto=True)
+
+    # Records created before the vet joined are picked up on add_staff
+    zoo.add_staff(vet)
+    later = vet.generate_record(lion, auto=True)
+    assert zoo.get_health_records_for_animal(lion) == [early, later]
+
+    zoo.remove_staff(vet)
+    assert zoo.get_health_records_for_animal(lion) == []
+
+
+def test_records_between_and_latest_record_for():
+    zoo = make_zoo()
+    lion = make_lion()
+    nala = make_lion("Nala")
+    zoo.add_animals([lion, nala])
+    vet = Veterinarian("Dr. A")
+    zoo.add_staff(vet)
+    vet.assign_animal(lion)
+    vet.assign_animal(nala)
+
+    # Added out of date order on purpose
+    march = HealthRecord(lion, "injuries", "low", "15/03/2025", "Limp", True)
+    january = HealthRecord(lion, "illness", "low", "10/01/2025", "Cough", False)
+    february = HealthRecord(nala, "illness", "medium", "01/02/2025", "Fever", True)
+    for record in (march, january, february):
+        vet.add_record(record)
+
+    assert zoo.records_between("01/01/2025", "31/12/2025") == [january, february, march]
+    assert zoo.records_between("01/02/2025", "15/03/2025") == [february, march]
+    assert zoo.records_between(date(2025, 4, 1), date(2025, 5, 1)) == []
+    assert zoo.get_health_records_for_animal(lion) == [january, march]
+
+    assert zoo.latest_record_for(lion) is march
+    assert zoo.latest_record_for(nala) is february
+
+    zoo.remove_staff(vet)
+    assert zoo.records_between("01/01/2025", "31/12/2025") == []
+    assert zoo.latest_record_for(lion) is None
+
+
+def test_records_index_merges_late_records_in_date_order():
+    zoo = make_zoo()
+    lion = make_lion()
+    zoo.add_animal(lion)
+    vet = Veterinarian("Dr. A")
+    vet.assign_animal(lion)
+    days = [5, 3, 9, 3, 1, 7, 9, 2]
+    records = [
+        HealthRecord(lion, "illness", "low", f"{d:02d}/01/2025", f"Note {i}", True)
+        for i, d in enumerate(days)
+    ]
+    # Records held before joining are indexed in one go
+    for record in records[:4]:
+        vet.add_record(record)
+    zoo.add_staff(vet)
+    assert zoo.records_between("01/01/2025", "31/01/2025") == [records[i] for i in (1, 3, 0, 2)]
+
+    # Later ones arrive between queries; same-day records keep their arrival order
+    for record in records[4:]:
+        vet.add_record(record)
+    expected = [records[i] for i in (4, 7, 1, 3, 0, 5, 2, 6)]
+    assert zoo.get_health_records_for_animal(lion) == expected
+    assert zoo.records_between("01/01/2025", "31/01/2025") == expected
+    assert zoo.latest_record_for(lion) is records[6]
+
+    vet.release_animal(lion)
+    assert zoo.records_between("01/01/2025", "31/01/2025") == []
+
+
+def test_records_between_rejects_bad_dates():
+    zoo = make_zoo()
+
+    with pytest.raises(ValueError):
+        zoo.records_between("2025-01-01", "31/12/2025")
+
+
+def test_vets_for_follows_assignments():
+    zoo = make_zoo()
+    lion = make_lion()
+    zoo.add_animal(lion)
+    vet_a, vet_b = Veterinarian("Dr. A"), Veterinarian("Dr. B")
+
+    vet_c = Veterinarian("Dr. C")
+
+    vet_a.assign_animal(lion)  # before joining the zoo
+    zoo.add_staff_many([vet_a, vet_b, vet_c])
+    assert zoo.vets_for(lion) == [vet_a]
+    vet_b.assign_animals([lion])
+    vet_c.assign_animal(lion)
+    assert zoo.vets_for(lion) == [vet_a, vet_b, vet_c]
+
+    vet_c.unassign_animal(lion)
+    vet_a.unassign_animal(lion)
+    assert zoo.vets_for(lion) == [vet_b]
+
+    zoo.remove_staff(vet_b)
+    assert zoo.vets_for(lion) == []
+
+
+def test_remove_animal_unassigns_it_from_its_vets():
+    zoo = make_zoo()
+    lion = make_lion()
+    zoo.add_animal(lion)
+    vet = Veterinarian("Dr. A")
+    zoo.add_staff(vet)
+    vet.assign_animal(lion)
+
+    zoo.remove_animal(lion)
+
+    assert vet.assigned_animal == []
+    assert zoo.vets_for(lion) == []
+
+
+def test_get_health_records_does_not_grow_vet_storage():
+    zoo = make_zoo()
+    lion = make_lion()
+    zoo.add_animal(lion)
+    vet = Veterinarian("Dr. A")
+    zoo.add_staff(vet)
+    vet.assign_animal(lion)
+
+    assert zoo.get_health_records_for_animal(lion) == []
+    assert vet.get_records(lion) == []
+    assert vet.records == []
+
+
 def test_animal_under_treatment_detects_active_records(capsys):
     zoo = make_zoo()
     lion = make_lion(healthy=False)
@@ -266,8 +717,8 @@ def test_animal_under_treatment_detects_active_records(capsys):
     rec_active = HealthRecord(lion, "injuries", "high", "01/01/2025", "Critical", True)
     rec_closed = HealthRecord(zebra, "illness", "low", "02/01/2025", "Mild", False)
 
-    vet.get_records(lion).append(rec_active)
-    vet.get_records(zebra).append(rec_closed)
+    vet.add_record(rec_active)
+    vet.add_record(rec_closed)
 
     under_treatment = zoo.animal_under_treatment()
     out = capsys.readouterr().out
@@ -277,6 +728,107 @@ def test_animal_under_treatment_detects_active_records(capsys):
     assert "No animal is under treatment." not in out
 
 
+def test_under_treatment_updates_when_records_close():
+    zoo = make_zoo()
+    lion = make_lion(healthy=False)
+    zoo.add_animal(lion)
+    vet = Veterinarian("Dr. A")
+    zoo.add_staff(vet)
+    vet.assign_animal(lion)
+
+    first = vet.generate_record(lion, auto=True)
+    second = vet.generate_record(lion, auto=True)
+    assert zoo.get_animals_under_treatment() == [lion]
+
+    first.close_record()
+    assert zoo.get_animals_under_treatment() == [lion]
+
+    second.close_record()
+    assert zoo.get_animals_under_treatment() == []
+
+    # Removed animals are never reported
+    vet.generate_record(lion, auto=True)
+    zoo.remove_animal(lion)
+    assert zoo.get_animals_under_treatment() == []
+
+
+def test_record_archive_base_needs_store():
+    with pytest.raises(TypeError):
+        RecordArchive()
+
+
+def test_remove_animal_archives_and_releases_records():
+    archive = MemoryArchive()
+    zoo = Zoo("Timmy Zoo", archive=archive)
+    lion = make_lion(healthy=False)
+    zoo.add_animal(lion)
+    vet = Veterinarian("Dr. A")
+    zoo.add_staff(vet)
+    vet.assign_animal(lion)
+    record = vet.generate_record(lion, auto=True)
+    record.add_notes("Second visit.")
+    lion_id = lion.id
+
+    zoo.remove_animal(lion)
+
+    assert lion not in vet.assigned_animal
+    assert vet.records == []
+    assert zoo.records_between("01/01/2000", "31/12/2030") == []
+    archived = archive.records_for(lion_id)
+    assert [(a.animal_name, a.issue, a.date_reported) for a in archived] == [
+        ("Simba", "illness", "01/01/2002")
+    ]
+    assert [text for _, text in archived[0].notes] == ["Auto Input for demo testing", "Second visit."]
+
+
+def test_animal_churn_does_not_leak_memory():
+    zoo = Zoo("Timmy Zoo", sink=NullSink())
+    vet = Veterinarian("Dr. A")
+    zoo.add_staff(vet)
+
+    def churn(n):
+        refs = []
+        for i in range(n):
+            lion = make_lion(f"Lion {i}", healthy=False)
+            zoo.add_animal(lion)
+            vet.assign_animal(lion)
+            vet.generate_record(lion, auto=True)
+            zoo.remove_animal(lion)
+            refs.append(weakref.ref(lion))
+        return refs
+
+    churn(200)  # warm up caches before measuring
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        refs = churn(2000)
+        gc.collect()
+        grown = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    # Every removed animal (and so every record pointing at it) was freed
+    assert all(ref() is None for ref in refs)
+    # What remains is the weakref list itself plus small interning tables,
+    # far below the ~1 KB per animal that leaking animals and records costs
+    assert grown < 2000 * 250
+
+
+def test_heal_animal_clears_under_treatment():
+    zoo = make_zoo()
+    lion = make_lion(healthy=False)
+    zoo.add_animal(lion)
+    vet = Veterinarian("Dr. A")
+    zoo.add_staff(vet)
+    vet.assign_animal(lion)
+    vet.generate_record(lion, auto=True)
+
+    vet.heal_animal(lion)
+
+    assert zoo.get_animals_under_treatment() == []
+
+
 def test_animal_under_treatment_none(capsys):
     zoo = make_zoo()
     lion = make_lion()
@@ -394,6 +946,50 @@ def test_run_full_daily_schedule_uses_all_schedulers(monkeypatch):
     assert any(call[0] == "health check" and call[1] == "Dr. A" for call in calls)
 
 
+# --- Event sinks -------------------------------------------------------------
+
+
+def test_zoo_sink_is_shared_with_staff_and_enclosures(capsys):
+    sink = BufferedSink()
+    zoo = Zoo("Timmy Zoo", sink=sink)
+    zk = Zookeeper("Alice")
+    enc = make_savannah_enclosure()
+    lion = make_lion()
+
+    zoo.add_staff(zk)
+    zoo.add_enclosure(enc)
+    zoo.add_animal(lion)
+    enc.add_animal(lion)
+    zk.assign_enclosure(enc)
+    zoo.schedule_daily_feeding()
+
+    assert capsys.readouterr().out == ""
+    names = [e.name for e in sink.events]
+    assert names[:4] == ["staff_added", "enclosure_added", "animal_added", "enclosure_animal_added"]
+    assert "animal_fed" in names and "enclosure_dirty" in names
+    assert "Feeding Simba..." in sink.messages()
+
+
+def test_zoo_sink_can_be_silenced_and_reset(capsys):
+    zoo = make_zoo()
+    enc = make_savannah_enclosure()
+    zoo.add_enclosure(enc)
+    capsys.readouterr()
+
+    zoo.sink = NullSink()
+    enc.clean_enclosure()
+    zoo.add_animal(make_lion())
+    assert capsys.readouterr().out == ""
+
+    # Leaving the zoo puts the enclosure back on the default sink
+    zoo.remove_enclosure(enc)
+    enc.clean_enclosure()
+    assert capsys.readouterr().out == "Enclosure cleaned.\n"
+
+    with pytest.raises(TypeError):
+        zoo.sink = "stdout"
+
+
 # --- __str__ -----------------------------------------------------------------
 
 
@@ -412,3 +1008,168 @@ def test_zoo_str_contains_summary():
     assert "Number of staff: 1" in summary
     assert "Number of animals: 1" in summary
     assert "Number of enclosures: 1" in summary
+
+
+# --- Imports -------------------------------------------------------------------
+
+
+def test_importing_modules_has_no_side_effects():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = "import zoo, main; print(hasattr(zoo, 'zoo'))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+    )
+
+    # Nothing printed by the imports and no module-level Zoo instance created
+    assert proc.stdout == "False\n"
+
+
+# --- Asynchronous schedule -------------------------------------------------------
+
+
+def test_arun_full_daily_schedule_overlaps_vets_and_uses_zoo_ids():
+    zoo = Zoo("Timmy Zoo", sink=NullSink(), id_generator=ids.SequentialIdGenerator(start=500))
+    vets = [Veterinarian(f"Dr. {i}") for i in range(5)]
+    lions = [Mammal(f"Lion {i}", "Lion", 5, "Meat", "savannah", False) for i in range(5)]
+    for vet, lion in zip(vets, lions):
+        vet.assign_animal(lion)
+    zoo.add_animals(lions)
+    zoo.add_staff_many(vets)
+
+    # Each answer waits until every vet has asked its question, which can
+    # only happen if the checks overlap; run one at a time, the first wait
+    # would never end and times out instead
+    entered = []
+    everyone_asked = asyncio.Event()
+
+    async def slow(vet, animal):
+        entered.append(vet)
+        if len(entered) == len(vets):
+            everyone_asked.set()
+        await asyncio.wait_for(everyone_asked.wait(), 5)
+        return {"issue": "illness", "severity": "low"}
+
+    records = asyncio.run(zoo.arun_full_daily_schedule(slow))
+
+    assert entered == vets
+    assert [r.animal.name for r in records] == [f"Lion {i}" for i in range(5)]
+    assert sorted(r.id for r in records) == list(range(500, 505))
+    assert len(zoo.get_animals_under_treatment()) == 5
+
+
+def test_arun_full_daily_schedule_finishes_every_check_before_raising():
+    zoo = Zoo("Timmy Zoo", sink=NullSink())
+    vets = [Veterinarian(f"Dr. {i}") for i in range(3)]
+    lions = [Mammal(f"Lion {i}", "Lion", 5, "Meat", "savannah", False) for i in range(3)]
+    for vet, lion in zip(vets, lions):
+        vet.assign_animal(lion)
+    zoo.add_animals(lions)
+    zoo.add_staff_many(vets)
+
+    async def source(vet, animal):
+        if animal is lions[0]:
+            raise RuntimeError("source failed")
+        await asyncio.sleep(0.01)
+        return {"issue": "illness", "severity": "low"}
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(zoo.arun_full_daily_schedule(source))
+    # The other checks ran to the end and kept their records
+    assert zoo.get_animals_under_treatment() == lions[1:]
+
+
+def test_run_full_daily_schedule_with_policy_needs_no_operator(monkeypatch):
+    zoo = Zoo("Timmy Zoo", sink=NullSink())
+    vet = Veterinarian("Dr. A")
+    lions = [Mammal(f"Lion {i}", "Lion", 5, "Meat", "savannah", i % 2 == 0) for i in range(6)]
+    vet.assign_animals(lions)
+    zoo.add_animals(lions)
+    zoo.add_staff(vet)
+    monkeypatch.setattr("builtins.input", lambda *args: pytest.fail("policy runs must not prompt"))
+
+    zoo.run_full_daily_schedule(policy=lambda v, animal: {"issue": "illness", "severity": "low"})
+
+    assert set(zoo.get_animals_under_treatment()) == {a for a in lions if not a.is_healthy}
+
+
+def test_run_concurrent_daily_schedule_with_policy_needs_no_operator(monkeypatch):
+    zoo = Zoo("Timmy Zoo", sink=NullSink())
+    vets = [Veterinarian(f"Dr. {k}") for k in range(3)]
+    lions = [Mammal(f"Lion {i}", "Lion", 5, "Meat", "savannah", i % 2 == 0) for i in range(9)]
+    for k, vet in enumerate(vets):
+        vet.assign_animals(lions[k * 3:k * 3 + 3])
+    enclosure = make_savannah_enclosure(size=2000)
+    keeper = Zookeeper("Alice")
+    keeper.assign_enclosure(enclosure)
+    zoo.add_animals(lions)
+    zoo.add_enclosure(enclosure)
+    zoo.add_staff_many([keeper, *vets])
+    monkeypatch.setattr("builtins.input", lambda *args: pytest.fail("policy runs must not prompt"))
+
+    zoo.run_concurrent_daily_schedule(
+        max_workers=4, policy=lambda v, animal: {"issue": "illness", "severity": "low"}
+    )
+
+    assert set(zoo.get_animals_under_treatment()) == {a for a in lions if not a.is_healthy}
+    assert len(zoo.get_animals_under_treatment()) == 4
+
+
+def test_events_to_redirects_and_restores_sink():
+    sink = BufferedSink()
+    zoo = Zoo("Timmy Zoo", sink=sink)
+    zk = Zookeeper("Alice")
+    enc = make_savannah_enclosure()
+    zk.assign_enclosure(enc)
+    zoo.add_staff(zk)
+    zoo.add_enclosure(enc)
+    sink.clear()
+
+    with zoo.events_to(NullSink()):
+        zoo.schedule_daily_cleaning()
+    assert not sink.events
+
+    zoo.schedule_daily_cleaning()
+    assert zoo.sink is sink and sink.events
+
+
+def test_record_shared_by_two_vets_is_indexed_once():
+    zoo = Zoo("Timmy Zoo", sink=NullSink())
+    lion = make_lion()
+    zoo.add_animal(lion)
+    vet1, vet2 = Veterinarian("Dr. A"), Veterinarian("Dr. B")
+    for vet in (vet1, vet2):
+        vet.assign_animal(lion)
+        zoo.add_staff(vet)
+    record = HealthRecord(lion, "injuries", "low", "01/01/2025", "Note 1", True)
+
+    vet1.add_record(record)
+    vet2.add_record(record)
+    vet2.add_record(record)  # repeat add is a no-op
+
+    assert zoo.get_health_records_for_animal(lion) == [record]
+    assert zoo.get_animals_under_treatment() == [lion]
+
+    record.close_record()
+    assert zoo.get_animals_under_treatment() == []
+
+    # Releasing from one vet keeps the record while the other still has it
+    vet1.release_animal(lion)
+    assert zoo.get_health_records_for_animal(lion) == [record]
+    vet2.release_animal(lion)
+    assert zoo.get_health_records_for_animal(lion) == []
+
+
+def test_shared_record_stays_indexed_when_one_vet_leaves():
+    zoo = Zoo("Timmy Zoo", sink=NullSink())
+    lion = make_lion()
+    zoo.add_animal(lion)
+    vet1, vet2 = Veterinarian("Dr. A"), Veterinarian("Dr. B")
+    record = HealthRecord(lion, "injuries", "low", "01/01/2025", "Note 1", True)
+    for vet in (vet1, vet2):
+        vet.assign_animal(lion)
+        vet.add_record(record)
+    zoo.add_staff_many([vet1, vet2])
+
+    zoo.remove_staff(vet1)
+    assert zoo.get_health_records_for_animal(lion) == [record]
+    assert zoo.get_animals_under_treatment() == [lion]
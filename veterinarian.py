@@ -6,7 +6,10 @@ ID: 110439345
 Username: maily015
 This is my own work as defined by the University's Academic Integrity Policy.
 '''
-from health_record import HealthRecord
+import decisions
+import helper
+from health_record import HealthRecord, HEALTH_RECORD_SCHEMA
+from locks import CONSOLE_LOCK
 from staff import Staff
 from animal import Animal
 
@@ -20,23 +23,90 @@ class Veterinarian(Staff):
         # Map each animal to a list of its health records
         self.__records: dict[Animal, list[HealthRecord]] = {}
 
+        # Callbacks told about changes, e.g. by the owning zoo's indexes.
+        # Each is called as callback(vet, item, change): item is a HealthRecord
+        # when change is "added", "closed" or "removed", and an Animal when
+        # change is "assigned" or "unassigned".
+        self._observers: list = []
+
+    def _subscribe(self, callback) -> None:
+        """Register a callback for changes to this veterinarian's records."""
+        if callback not in self._observers:
+            self._observers.append(callback)
+
+    def _unsubscribe(self, callback) -> None:
+        """Stop notifying a previously registered callback."""
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+    def _notify(self, item, change: str) -> None:
+        for callback in self._observers:
+            callback(self, item, change)
+
+    def _animals_changed(self, animals: list, assigned: bool) -> None:
+        change = "assigned" if assigned else "unassigned"
+        for animal in animals:
+            self._notify(animal, change)
+
+    @property
+    def records(self) -> list[HealthRecord]:
+        """All health records kept by this veterinarian."""
+        return [r for records in self.__records.values() for r in records]
+
     def get_records(self, animal) -> list[HealthRecord]:
-        """Return the list of health records for a given animal (create if absent)."""
+        """Return a copy of the health records for a given animal."""
         if not isinstance(animal, Animal):
             raise TypeError("'animal' must be an Animal class.")
-        if animal not in self.__records:
-            self.__records[animal] = []
-        return self.__records[animal]
+        records = self.__records.get(animal)
+        return list(records) if records else []
 
-    def generate_record(self, animal: Animal, auto = False) -> HealthRecord:
-        """Interactively create a new health record for an assigned animal."""
-        if animal not in self.assigned_animal:
+    def add_record(self, record: HealthRecord) -> None:
+        """Store an existing health record for one of this veterinarian's animals."""
+        if not isinstance(record, HealthRecord):
+            raise TypeError("'record' must be a HealthRecord instance.")
+        animal = record.animal
+        if animal not in self._assigned_animal:
             raise ValueError(f"{animal.name} is not assigned to {self.name}.")
+
+        # The record knows who stores it, so a repeat add is caught without a scan
+        if not record._add_owner(self):
+            return
+        self.__records.setdefault(animal, []).append(record)
+        self._notify(record, "added")
+
+    def release_animal(self, animal: Animal) -> list[HealthRecord]:
+        """
+        Forget an animal: unassign it and drop its records.
+
+        Returns the dropped records so the caller can archive them. Nothing
+        here keeps a reference to the animal afterwards.
+        """
+        self.unassign_animal(animal)
+        records = self.__records.pop(animal, [])
+        for record in records:
+            record._remove_owner(self)
+            self._notify(record, "removed")
+        return records
+
+    def generate_record(self, animal: Animal, auto = False, policy=None) -> HealthRecord | None:
+        """
+        Create a new health record for an assigned animal.
+
+        With a policy (see decisions.py) the record's fields come from
+        policy(vet, animal), and None is returned if it decides against a
+        record. Otherwise the fields are asked for interactively.
+        """
+        if animal not in self._assigned_animal:
+            raise ValueError(f"{animal.name} is not assigned to {self.name}.")
+        if policy is not None:
+            records = self.create_records([(animal, policy(self, animal))])
+            return records[0] if records else None
         if not auto:
-            issue = input("Enter issue (injuries/illness/behavioral concerns): ").strip()
-            severity = input("Enter severity (low/medium/high): ").strip()
-            date = input("Enter date (dd/mm/yyyy): ").strip()
-            notes = input("Enter treatment notes: ").strip()
+            with CONSOLE_LOCK:
+                issue = input("Enter issue (injuries/illness/behavioral concerns): ").strip()
+                severity = input("Enter severity (low/medium/high): ").strip()
+                date = input("Enter date (dd/mm/yyyy): ").strip()
+                notes = input("Enter treatment notes: ").strip()
         else: #Auto Input for easy testing
             issue = "illness"
             severity = "low"
@@ -51,33 +121,158 @@ class Veterinarian(Staff):
             treatment_notes=notes,
             active=True,
         )
-        self.get_records(animal).append(record)
+        self.add_record(record)
         return record
 
-    def health_check(self) -> None:
-        """Go through all assigned animals and optionally create health records."""
-        if not self.assigned_animal:
-            print("No animals assigned for health check.")
-            return
+    def create_records(self, pairs, skip_invalid: bool = False) -> list[HealthRecord]:
+        """
+        Open health records for many animals at once.
+
+        pairs are (animal, decision) with decisions as in decisions.py;
+        animals whose decision is None are skipped. Every row is validated
+        in one pass before any record is created: if any field is invalid
+        the errors are reported and ValueError is raised, leaving nothing
+        created. With skip_invalid=True a malformed or invalid decision is
+        reported and skipped instead, and the other rows still get their
+        records. Return the new records in the given order.
+        """
+        animals = []
+        rows = []
+        for animal, decision in pairs:
+            try:
+                fields = decisions.record_fields(decision)
+            except (TypeError, ValueError) as e:
+                if not skip_invalid:
+                    raise
+                self.__skip_decision(animal, e)
+                continue
+            if fields is None:
+                continue
+            if animal not in self._assigned_animal:
+                raise ValueError(f"{getattr(animal, 'name', animal)} is not assigned to {self.name}.")
+            animals.append(animal)
+            rows.append((
+                fields["issue"], fields["severity"], fields["date_reported"], fields["treatment_notes"], True,
+            ))
+
+        valid, errors = HEALTH_RECORD_SCHEMA.check_many(rows)
+        if errors:
+            helper.report_errors(errors)
+            bad = {e.row for e in errors}
+            if not skip_invalid:
+                raise ValueError(f"Invalid decisions for {len(bad)} animal(s); no records created.")
+            for index in sorted(bad):
+                self.__skip_decision(animals[index], "; ".join(e.message for e in errors if e.row == index))
+            kept = [i for i in range(len(rows)) if i not in bad]
+            animals = [animals[i] for i in kept]
+            rows = [rows[i] for i in kept]
+
+        records = [
+            HealthRecord._from_checked(animal, values, row[2])
+            for animal, values, row in zip(animals, valid, rows)
+        ]
+        for record in records:
+            self.add_record(record)
+        return records
+
+    def __skip_decision(self, animal: Animal, reason) -> None:
+        self._events().emit(
+            "decision_invalid", "Invalid decision for {}; no record created: {}", animal.name, reason
+        )
+
+    def health_check(self, policy=None) -> list[HealthRecord]:
+        """
+        Go through all assigned animals and optionally create health records.
+
+        Without a policy the operator is asked about each sick animal, one
+        animal at a time across all threads (see locks.CONSOLE_LOCK). With
+        one, policy(vet, animal) decides for every sick animal and the
+        records are created together by create_records. Return the new records.
+        """
+        if not self._assigned_animal:
+            self._events().emit("health_check_empty", "No animals assigned for health check.")
+            return []
 
-        for animal in self.assigned_animal:
+        if policy is not None:
+            sick = []
+            for animal in self._assigned_animal:
+                if animal.is_healthy:
+                    self._events().emit("animal_healthy", "{} ({}) is healthy.", animal.name, animal.species)
+                else:
+                    sick.append(animal)
+            return self.create_records([(animal, policy(self, animal)) for animal in sick])
+
+        records = []
+        for animal in self._assigned_animal:
             if animal.is_healthy:
-                print(f"{animal.name} ({animal.species}) is healthy.")
+                self._events().emit("animal_healthy", "{} ({}) is healthy.", animal.name, animal.species)
             else:
-                print(
-                    f"{animal.name} ({animal.species}) is not healthy. "
-                    "Do you want to create a record? (y/n)..."
-                )
-                choice = input().strip().lower()
-
-                # Keep asking until user types y or n
-                while choice not in ("y", "n"):
-                    print("'choice' must be 'y' or 'n'.")
+                # The whole question, follow-up prompts included, holds the console
+                with CONSOLE_LOCK:
+                    print(
+                        f"{animal.name} ({animal.species}) is not healthy. "
+                        "Do you want to create a record? (y/n)..."
+                    )
                     choice = input().strip().lower()
 
-                if choice == "y":
-                    self.generate_record(animal)
+                    # Keep asking until user types y or n
+                    while choice not in ("y", "n"):
+                        print("'choice' must be 'y' or 'n'.")
+                        choice = input().strip().lower()
+
+                    if choice == "y":
+                        records.append(self.generate_record(animal))
                 # if 'n', simply continue to the next animal
+        return records
+
+    async def ahealth_check(self, source, timeout: float | None = None, default=None) -> list[HealthRecord]:
+        """
+        Asynchronous health_check: ask a decision source about each sick animal.
+
+        source(vet, animal) returns a decision or an awaitable of one (see
+        decisions.py). All questions for this veterinarian are in flight at
+        once, so a slow answer does not hold up the others. A question not
+        answered within timeout seconds gets the default decision. Records
+        are created together by create_records once every answer is in,
+        skipping animals unassigned in the meantime. An invalid answer is
+        reported (a "decision_invalid" event) and skipped, so it does not
+        cost the other animals their records. Return the new records.
+        """
+        import asyncio
+
+        if not self._assigned_animal:
+            self._events().emit("health_check_empty", "No animals assigned for health check.")
+            return []
+
+        sick = []
+        for animal in self._assigned_animal:
+            if animal.is_healthy:
+                self._events().emit("animal_healthy", "{} ({}) is healthy.", animal.name, animal.species)
+            else:
+                sick.append(animal)
+
+        answers = await asyncio.gather(*(self.__decide(source, a, timeout, default) for a in sick))
+
+        return self.create_records(
+            ((animal, answer) for animal, answer in zip(sick, answers) if animal in self._assigned_animal),
+            skip_invalid=True,
+        )
+
+    async def __decide(self, source, animal: Animal, timeout: float | None, default):
+        """Get one decision, falling back to the default when it takes too long."""
+        import asyncio
+        import inspect
+
+        answer = source(self, animal)
+        if not inspect.isawaitable(answer):
+            return answer
+        try:
+            return await asyncio.wait_for(answer, timeout)
+        except asyncio.TimeoutError:
+            self._events().emit(
+                "decision_timed_out", "No decision for {} within {}s; using the default.", animal.name, timeout
+            )
+            return default
 
     def record_report(self, animal: Animal | None = None) -> None:
         """
@@ -87,11 +282,11 @@ class Veterinarian(Staff):
         """
         # Report for all assigned animals
         if animal is None:
-            if not self.assigned_animal:
+            if not self._assigned_animal:
                 print("No animals assigned to this veterinarian.")
                 return
 
-            for a in self.assigned_animal:
+            for a in self._assigned_animal:
                 print(f"\nAnimal: {a.name} ({a.species})")
                 records = self.get_records(a)
 
@@ -105,7 +300,7 @@ class Veterinarian(Staff):
             return
 
         # Report for a specific animal
-        if animal not in self.assigned_animal:
+        if animal not in self._assigned_animal:
             raise ValueError(f"{animal.name} is not assigned to {self.name}.")
 
         records = self.get_records(animal)
@@ -120,23 +315,26 @@ class Veterinarian(Staff):
     def heal_animal(self, animal: Animal) -> None:
         """Heal a specific assigned animal and close any active records."""
 
-        if animal not in self.assigned_animal:
+        if animal not in self._assigned_animal:
             raise ValueError(f"{animal.name} is not assigned to {self.name}.")
 
         if animal.is_healthy:
-            print(f"{animal.name} ({animal.species}) is healthy, no treatment needed.")
+            self._events().emit(
+                "treatment_not_needed", "{} ({}) is healthy, no treatment needed.", animal.name, animal.species
+            )
             return
 
+        sink = self._events()
         animal.heal()
-        print(f"Performed treatment for {animal.name}.")
+        sink.emit("animal_treated", "Performed treatment for {}.", animal.name)
 
         records = self.get_records(animal)
         for record in records:
             if record.active:
                 record.add_notes("Animal treated and condition resolved.")
                 record.close_record()
-                print(f"Record [{record.issue}] closed.")
-        print(f"All active records for {animal.name} have been closed.")
+                sink.emit("record_closed", "Record [{}] closed.", record.issue)
+        sink.emit("records_closed", "All active records for {} have been closed.", animal.name)
 
     def perform_task(self, value: str) -> None:
         """Perform a task: 'health check', 'report', or 'heal'."""
@@ -156,7 +354,7 @@ class Veterinarian(Staff):
 
         elif task == "heal":
             # Filter assigned animals that are currently sick
-            sick_animals = [a for a in self.assigned_animal if not a.is_healthy]
+            sick_animals = [a for a in self._assigned_animal if not a.is_healthy]
             if not sick_animals:
                 print("All assigned animals are healthy. Nothing to heal.")
                 return
@@ -7,29 +7,128 @@ Username: maily015
 This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
-import uuid
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from operator import attrgetter
+import threading
 
+import decisions
+import events
 import helper
+import ids
 from animal import Animal
 from staff import Staff
 from zookeeper import Zookeeper
 from veterinarian import Veterinarian
 from enclosure import Enclosure
 from health_record import HealthRecord
+from registry import Registry, NameIndex, SequenceView
+from placement import PlacementIndex
+from scheduler import BatchDay, run_concurrently
+from codes import Environment, SPECIES
+
+
+class BulkResult:
+    """Outcome of a bulk add: what was added, skipped as a duplicate, or rejected."""
+
+    def __init__(self):
+        self.added: list = []
+        self.skipped: list = []
+        # (item, exception) pairs for items that failed validation or whose
+        # id is already taken by a different object
+        self.failed: list[tuple] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def __str__(self):
+        return f"{len(self.added)} added, {len(self.skipped)} skipped, {len(self.failed)} failed"
 
 
 class Zoo:
     """Central class that manages staff, animals, enclosures and health records."""
 
-    def __init__(self, name: str):
+    def __init__(
+        self,
+        name: str,
+        sink: events.EventSink | None = None,
+        id_generator: ids.IdGenerator | None = None,
+        archive=None,
+    ):
         if not helper.validate_string(name, "Zoo name"):
             raise ValueError("Invalid zoo name.")
         self.__name = name.strip()
 
-        # Main collections
-        self.__staff: list[Staff] = []
-        self.__animals: list[Animal] = []
-        self.__enclosures: list[Enclosure] = []
+        # Main collections, keyed by id for O(1) membership and lookup
+        self.__staff: Registry = Registry()
+        self.__animals: Registry = Registry()
+        self.__enclosures: Registry = Registry()
+
+        # Read-only live views handed out by the properties below
+        self.__staff_view = SequenceView(self.__staff)
+        self.__animals_view = SequenceView(self.__animals)
+        self.__enclosures_view = SequenceView(self.__enclosures)
+
+        # Name indexes, kept in step with the collections above
+        self.__staff_names = NameIndex()
+        self.__animal_names = NameIndex()
+
+        # Enclosures grouped by environment, and by free room for placement
+        self.__enclosures_by_env: dict[Environment, Registry] = {}
+        self.__placement = PlacementIndex()
+
+        # Which enclosure each animal lives in, keyed by animal id. Nothing
+        # stops an animal being added to two enclosures, so an animal in
+        # several holds a tuple of them instead of a single enclosure.
+        self.__housing: dict = {}
+
+        # Health records from all veterinarians, keyed by animal id, each
+        # list sorted by date reported. A record reported before the last
+        # one in its list is appended anyway and the animal's id noted in
+        # __unsorted, so the list is sorted once, when next read.
+        self.__records: dict[object, list[HealthRecord]] = {}
+        self.__unsorted: set = set()
+
+        # Every record sorted by date reported, with the day numbers in a
+        # parallel list for bisect. Records indexed since the last query
+        # wait in __pending_records and are merged in by __sorted_records.
+        self.__record_days: list[int] = []
+        self.__records_by_day: list[HealthRecord] = []
+        self.__pending_records: list[HealthRecord] = []
+
+        # Veterinarians assigned to each animal, keyed by animal id. Most
+        # animals have one, stored directly; several are kept in a tuple.
+        self.__vets_by_animal: dict = {}
+
+        # Animals with at least one active record, with their active record count
+        self.__under_treatment: dict[object, Animal] = {}
+        self.__active_counts: dict[object, int] = {}
+
+        # Where ids come from for objects created inside id_scope().
+        # None means the process-wide default (random UUIDs).
+        if id_generator is not None and not callable(id_generator):
+            raise TypeError("id_generator must be callable.")
+        self.__id_generator = id_generator
+
+        # Where the records of removed animals go (see archive.py); None drops them
+        self.archive = archive
+
+        # Serialises index updates reported by staff and enclosures working on
+        # several threads (see run_concurrent_daily_schedule)
+        self.__index_lock = threading.RLock()
+
+        # Batch feeding/cleaning plan, reused while zookeeper assignments are unchanged
+        self.__batch_day: BatchDay | None = None
+
+        # Optional NumPy column store for census queries (see enable_animal_table)
+        self.__table = None
+
+        # Where this zoo, its staff and its enclosures report events.
+        # None means the process-wide default sink (printing to stdout).
+        self.__sink = None
+        if sink is not None:
+            self.sink = sink
 
     # Basic getters
     @property
@@ -37,64 +136,173 @@ class Zoo:
         return self.__name
 
     @property
-    def staff(self) -> list[Staff]:
-        return list(self.__staff)
+    def sink(self) -> events.EventSink:
+        return self.__sink if self.__sink is not None else events.default_sink()
+
+    @sink.setter
+    def sink(self, value: events.EventSink | None) -> None:
+        """Route events from this zoo, its staff and its enclosures to another sink."""
+        if value is not None and not isinstance(value, events.EventSink):
+            raise TypeError("sink must be an EventSink instance.")
+        self.__sink = value
+        for member in (*self.__staff, *self.__enclosures):
+            member._sink = value
+
+    @property
+    def id_generator(self) -> ids.IdGenerator:
+        return self.__id_generator if self.__id_generator is not None else ids.default_generator()
+
+    def id_scope(self):
+        """
+        Context manager: animals, staff, enclosures and records created inside
+        the block take their ids from this zoo's generator.
+
+            with zoo.id_scope():
+                zoo.add_animals(Mammal(...) for row in rows)
+        """
+        return ids.use_generator(self.id_generator)
+
+    @contextmanager
+    def events_to(self, sink: events.EventSink | None):
+        """
+        Context manager: send the events of this zoo, its staff and its
+        enclosures to another sink inside the block, e.g. events.NullSink()
+        to run quietly.
+        """
+        previous = self.__sink
+        self.sink = sink
+        try:
+            yield self
+        finally:
+            self.sink = previous
+
+    @property
+    def staff(self) -> SequenceView:
+        return self.__staff_view
 
     @property
-    def animals(self) -> list[Animal]:
-        return list(self.__animals)
+    def animals(self) -> SequenceView:
+        return self.__animals_view
 
     @property
-    def enclosures(self) -> list[Enclosure]:
-        return list(self.__enclosures)
+    def enclosures(self) -> SequenceView:
+        return self.__enclosures_view
 
     # Add / remove methods
-    def add_staff(self, staff_member: Staff) -> None:
-        """Add a staff member (must be a Zookeeper or Veterinarian)."""
-        from zookeeper import Zookeeper
-        from veterinarian import Veterinarian
-
+    def __register_staff(self, staff_member: Staff) -> bool:
+        """Add a staff member to the collections and indexes. Return False if already present."""
         if not isinstance(staff_member, (Zookeeper, Veterinarian)):
             raise TypeError("staff_member must be a Zookeeper or Veterinarian instance.")
 
-        if staff_member not in self.__staff:
-            self.__staff.append(staff_member)
-            print(f"Added staff member {staff_member.name} ({staff_member.role}) to {self.__name}.\n")
+        if not self.__staff.add(staff_member):
+            return False
+        self.__staff_names.add(staff_member)
+        staff_member._sink = self.__sink
+        if isinstance(staff_member, Veterinarian):
+            for record in staff_member.records:
+                if not self.__held_elsewhere(record, staff_member):
+                    self.__index_record(record)
+            for animal in staff_member.assigned_animal_view:
+                self.__index_vet(animal, staff_member)
+            staff_member._subscribe(self.__vet_changed)
+        return True
+
+    def add_staff(self, staff_member: Staff) -> None:
+        """Add a staff member (must be a Zookeeper or Veterinarian)."""
+        if self.__register_staff(staff_member):
+            self.sink.emit(
+                "staff_added", "Added staff member {} ({}) to {}.\n",
+                staff_member.name, staff_member.role, self.__name,
+            )
 
     def remove_staff(self, staff_member: Staff) -> None:
         """Remove a staff member from the zoo."""
         if staff_member not in self.__staff:
             raise ValueError("Staff member does not belong to this zoo.")
-        # Deactivate first to clear their assignments
+        # Deactivate first to clear their assignments (which also clears
+        # them from the animal -> vets index)
         staff_member.deactivate()
         self.__staff.remove(staff_member)
-        print(f"Removed staff member {staff_member.name} ({staff_member.role}) from {self.__name}.\n")
+        self.__staff_names.discard(staff_member)
+        staff_member._sink = None
+        if isinstance(staff_member, Veterinarian):
+            staff_member._unsubscribe(self.__vet_changed)
+            for record in staff_member.records:
+                if not self.__held_elsewhere(record, staff_member):
+                    self.__unindex_record(record)
+        self.sink.emit(
+            "staff_removed", "Removed staff member {} ({}) from {}.\n",
+            staff_member.name, staff_member.role, self.__name,
+        )
 
-    def add_animal(self, animal) -> None:
-        """Add an animal to the zoo."""
+    def __register_animal(self, animal: Animal) -> bool:
+        """Add an animal to the collections and indexes. Return False if already present."""
         if not isinstance(animal, Animal):
             raise TypeError("animal must be an Animal instance.")
-        if animal not in self.__animals:
-            self.__animals.append(animal)
-            print(f"Added animal {animal.name} to {self.__name}.\n")
+        # Checked before anything changes, so a rejected animal leaves no trace
+        table = self.__table
+        if table is not None and animal._table is not None and animal._table is not table:
+            raise ValueError(f"{animal.name} already belongs to another AnimalTable.")
+        if not self.__animals.add(animal):
+            return False
+        self.__animal_names.add(animal)
+        if table is not None:
+            table.add(animal)
+        return True
+
+    def add_animal(self, animal) -> None:
+        """Add an animal to the zoo."""
+        if self.__register_animal(animal):
+            self.sink.emit("animal_added", "Added animal {} to {}.\n", animal.name, self.__name)
 
     def remove_animal(self, animal: Animal) -> None:
-        """Remove an animal from the zoo and from all enclosures."""
+        """
+        Remove an animal from the zoo, its enclosure and its veterinarians.
+
+        The veterinarians' records for the animal are handed to the zoo's
+        archive, if it has one, and are no longer kept in memory.
+        """
         if animal not in self.__animals:
             raise ValueError("Animal does not belong to this zoo.")
-        # Remove from all enclosures that currently contain it
-        for enclosure in self.__enclosures:
+        # Remove from every enclosure that currently contains it
+        for enclosure in self.__homes(animal):
             enclosure.remove_animal(animal)
+        # Only the vets assigned the animal or holding its records are involved
+        vets = Registry(self.__vets(animal))
+        for record in self.__records.get(animal.id, ()):
+            for owner in record._owner_list():
+                vets.add(owner)
+        released = []
+        for vet in vets:
+            released.extend(vet.release_animal(animal))
+        if released and self.archive is not None:
+            self.archive.store(released)
         self.__animals.remove(animal)
-        print(f"Removed animal {animal.name} from {self.__name}.\n")
+        self.__animal_names.discard(animal)
+        if self.__table is not None:
+            self.__table.discard(animal)
+        self.sink.emit("animal_removed", "Removed animal {} from {}.\n", animal.name, self.__name)
 
-    def add_enclosure(self, enclosure) -> None:
-        """Add an enclosure to the zoo."""
+    def __register_enclosure(self, enclosure: Enclosure) -> bool:
+        """Add an enclosure to the collections and indexes. Return False if already present."""
         if not isinstance(enclosure, Enclosure):
             raise TypeError("enclosure must be an Enclosure instance.")
-        if enclosure not in self.__enclosures:
-            self.__enclosures.append(enclosure)
-            print(f"Added enclosure {enclosure.environment} to {self.__name}.\n")
+        if not self.__enclosures.add(enclosure):
+            return False
+        self.__enclosures_by_env.setdefault(enclosure.environment_code, Registry()).add(enclosure)
+        self.__placement.update(enclosure)
+        for animal in enclosure.animals:
+            self.__house(animal, enclosure)
+        enclosure._subscribe(self.__enclosure_changed)
+        enclosure._sink = self.__sink
+        return True
+
+    def add_enclosure(self, enclosure) -> None:
+        """Add an enclosure to the zoo."""
+        if self.__register_enclosure(enclosure):
+            self.sink.emit(
+                "enclosure_added", "Added enclosure {} to {}.\n", enclosure.environment, self.__name
+            )
 
     def remove_enclosure(self, enclosure: Enclosure) -> None:
         """Remove an enclosure if it is empty."""
@@ -104,61 +312,360 @@ class Zoo:
             raise RuntimeError("Cannot remove enclosure that still contains animals.")
 
         self.__enclosures.remove(enclosure)
+        self.__enclosures_by_env[enclosure.environment_code].discard(enclosure)
+        self.__placement.discard(enclosure)
+        enclosure._unsubscribe(self.__enclosure_changed)
+        enclosure._sink = None
+
+    def __enclosure_changed(self, enclosure: Enclosure, animal: Animal, added: bool) -> None:
+        """Keep the zoo's indexes in step when an enclosure gains or loses an animal."""
+        with self.__index_lock:
+            self.__placement.update(enclosure)
+            if added:
+                self.__house(animal, enclosure)
+            else:
+                self.__unhouse(animal, enclosure)
+
+    def __homes(self, animal: Animal) -> tuple:
+        """Every enclosure of this zoo the animal is in, oldest first."""
+        homes = self.__housing.get(animal.id)
+        if homes is None:
+            return ()
+        return homes if isinstance(homes, tuple) else (homes,)
+
+    def __house(self, animal: Animal, enclosure: Enclosure) -> None:
+        homes = self.__homes(animal)
+        if enclosure not in homes:
+            self.__housing[animal.id] = (*homes, enclosure) if homes else enclosure
+
+    def __unhouse(self, animal: Animal, enclosure: Enclosure) -> None:
+        homes = tuple(e for e in self.__homes(animal) if e is not enclosure)
+        if not homes:
+            self.__housing.pop(animal.id, None)
+        else:
+            self.__housing[animal.id] = homes if len(homes) > 1 else homes[0]
+
+    def enclosure_of(self, animal: Animal) -> Enclosure | None:
+        """Return the enclosure an animal currently lives in (the first, if several), or None."""
+        homes = self.__homes(animal)
+        return homes[0] if homes else None
+
+    def place_animal(self, animal: Animal) -> Enclosure | None:
+        """
+        Put an animal into a compatible enclosure that has room.
+
+        Enclosures already holding the same species are filled first.
+        Returns the chosen enclosure, or None if no enclosure can take it.
+        """
+        if not isinstance(animal, Animal):
+            raise TypeError("animal must be an Animal instance.")
+        if animal not in self.__animals:
+            raise ValueError("Animal does not belong to this zoo.")
+        if animal.id in self.__housing:
+            raise ValueError(f"{animal.name} already lives in an enclosure.")
+
+        enclosure = self.__placement.find(animal)
+        if enclosure is None or not enclosure.add_animal(animal):
+            return None
+        return enclosure
+
+    # Bulk ingestion
+    def __add_many(self, items, register, kind: str) -> "BulkResult":
+        """Register every item, collecting failures instead of stopping at the first one."""
+        result = BulkResult()
+        for item in items:
+            try:
+                if register(item):
+                    result.added.append(item)
+                else:
+                    result.skipped.append(item)
+            except (TypeError, ValueError) as e:
+                result.failed.append((item, e))
+
+        self.sink.emit("bulk_added", "Bulk added {} to {}: {}.\n", kind, self.__name, result)
+        return result
+
+    def add_staff_many(self, staff_members) -> "BulkResult":
+        """Add many staff members at once. See BulkResult for the outcome."""
+        return self.__add_many(staff_members, self.__register_staff, "staff")
+
+    def add_animals(self, animals) -> "BulkResult":
+        """Add many animals at once. See BulkResult for the outcome."""
+        return self.__add_many(animals, self.__register_animal, "animals")
+
+    def add_enclosures(self, enclosures) -> "BulkResult":
+        """Add many enclosures at once. See BulkResult for the outcome."""
+        return self.__add_many(enclosures, self.__register_enclosure, "enclosures")
 
 
     # Search helpers
     def find_staff_by_name(self, name: str) -> Staff | None:
-        """Return all staff whose name matches (case-insensitive)."""
-        name = (name or "").strip().lower()
-        for s in self.__staff:
-            if s.name.lower() == name:
-                return s
-        return None
-
-    def find_staff_by_id(self, staff_id: uuid.UUID) -> Staff | None:
-        """Return a staff member by UUID, or None if not found."""
-        for s in self.__staff:
-            if s.id == staff_id:
-                return s
-        return None
+        """Return the first staff member whose name matches (case-insensitive)."""
+        return self.__staff_names.first(name)
+
+    def find_staff_by_prefix(self, prefix: str, limit: int = 10) -> list[Staff]:
+        """Return up to 'limit' staff whose name starts with prefix (case-insensitive)."""
+        return self.__staff_names.prefix(prefix, limit)
+
+    def find_staff_by_id(self, staff_id) -> Staff | None:
+        """Return a staff member by id (of any generator's type), or None if not found."""
+        return self.__staff.get(staff_id)
 
     def find_animal_by_name(self, name: str) -> list[Animal]:
         """Return all animals whose name matches (case-insensitive)."""
-        name = (name or "").strip().lower()
-        return [a for a in self.__animals if a.name.lower() == name]
+        return self.__animal_names.find(name)
+
+    def find_animal_by_prefix(self, prefix: str, limit: int = 10) -> list[Animal]:
+        """Return up to 'limit' animals whose name starts with prefix (case-insensitive)."""
+        return self.__animal_names.prefix(prefix, limit)
 
     def find_enclosure_by_environment(self, environment: str) -> list[Enclosure]:
         """Return all enclosures with the given environment type."""
-        env = (environment or "").strip().lower()
-        return [e for e in self.__enclosures if e.environment.lower() == env]
+        enclosures = self.__enclosures_by_env.get(Environment.lookup(environment))
+        return list(enclosures) if enclosures else []
+
+
+    # Census queries
+    def enable_animal_table(self) -> None:
+        """
+        Keep a columnar NumPy copy of the animals so census queries run vectorised.
+
+        Raises ImportError if NumPy is not installed.
+        """
+        if self.__table is None:
+            from animal_table import AnimalTable
+            self.__table = AnimalTable(self.__animals, capacity=len(self.__animals))
+
+    def disable_animal_table(self) -> None:
+        """Drop the columnar copy; census queries fall back to plain loops."""
+        if self.__table is not None:
+            for animal in self.__animals:
+                self.__table.discard(animal)
+            self.__table = None
+
+    @property
+    def has_animal_table(self) -> bool:
+        return self.__table is not None
+
+    def __census(self, environment=None, species=None, healthy=None, min_age=None, max_age=None):
+        """Yield the animals matching every given filter, one object at a time."""
+        # Compare codes rather than strings; an unknown name matches nothing
+        if environment is not None:
+            environment = Environment.lookup(environment)
+            if environment is None:
+                return
+        if species is not None:
+            species = SPECIES.lookup(species)
+            if species is None:
+                return
+        for a in self.__animals:
+            if (
+                (environment is None or a.environment_code == environment)
+                and (species is None or a.species_code == species)
+                and (healthy is None or a.is_healthy == healthy)
+                and (min_age is None or a.age >= min_age)
+                and (max_age is None or a.age <= max_age)
+            ):
+                yield a
+
+    def find_animals(self, **filters) -> list[Animal]:
+        """
+        Return the animals matching all given filters.
+
+        Filters: environment, species (case-insensitive), healthy (bool),
+        min_age and max_age (inclusive). Uses the animal table when enabled,
+        in which case results come back in table order.
+        """
+        if self.__table is not None:
+            return self.__table.filter(**filters)
+        return list(self.__census(**filters))
+
+    def count_animals(self, **filters) -> int:
+        """Return how many animals match the filters (see find_animals)."""
+        if self.__table is not None:
+            return self.__table.count(**filters)
+        return sum(1 for _ in self.__census(**filters))
+
+    def mean_age_by_species(self, **filters) -> dict[str, float]:
+        """Return the mean age per (lower-case) species of the matching animals."""
+        if self.__table is not None:
+            return self.__table.mean_age_by_species(**filters)
+        totals: dict[str, list] = {}
+        for a in self.__census(**filters):
+            total = totals.setdefault(a.species.lower(), [0, 0])
+            total[0] += a.age
+            total[1] += 1
+        return {species: age / count for species, (age, count) in totals.items()}
 
 
     # Health record access
+    def __index_record(self, record: HealthRecord) -> None:
+        records = self.__records.setdefault(record.animal.id, [])
+        if records and record.reported_on < records[-1].reported_on:
+            self.__unsorted.add(record.animal.id)
+        records.append(record)
+        self.__pending_records.append(record)
+        if record.active:
+            self.__count_active(record.animal, 1)
+
+    def __unindex_record(self, record: HealthRecord) -> None:
+        records = self.__records.get(record.animal.id)
+        if records and record in records:
+            records.remove(record)
+            if not records:
+                del self.__records[record.animal.id]
+                self.__unsorted.discard(record.animal.id)
+            self.__sorted_records()
+            day = record.reported_on
+            lo = bisect_left(self.__record_days, day)
+            hi = bisect_right(self.__record_days, day)
+            for i in range(lo, hi):
+                if self.__records_by_day[i] is record:
+                    del self.__record_days[i]
+                    del self.__records_by_day[i]
+                    break
+            if record.active:
+                self.__count_active(record.animal, -1)
+
+    def __animal_records(self, animal: Animal) -> list[HealthRecord] | None:
+        """An animal's records sorted by date reported, sorting them first if needed."""
+        records = self.__records.get(animal.id)
+        if animal.id in self.__unsorted:
+            self.__unsorted.discard(animal.id)
+            # Stable, so records from the same day stay in the order they arrived
+            records.sort(key=attrgetter("reported_on"))
+        return records
+
+    def __sorted_records(self) -> list[HealthRecord]:
+        """Merge pending records into the date-sorted list if needed."""
+        pending = self.__pending_records
+        if pending:
+            by_day = self.__records_by_day
+            if by_day and pending[0].reported_on < by_day[-1].reported_on or any(
+                a.reported_on > b.reported_on for a, b in zip(pending, pending[1:])
+            ):
+                # One stable sort merges the two runs and keeps same-day
+                # records in the order they arrived
+                by_day.extend(pending)
+                by_day.sort(key=attrgetter("reported_on"))
+                self.__record_days = [r.reported_on for r in by_day]
+            else:
+                by_day.extend(pending)
+                self.__record_days.extend(r.reported_on for r in pending)
+            pending.clear()
+        return self.__records_by_day
+
+    def __count_active(self, animal: Animal, delta: int) -> None:
+        """Adjust an animal's active record count and its under-treatment entry."""
+        count = self.__active_counts.get(animal.id, 0) + delta
+        if count > 0:
+            self.__active_counts[animal.id] = count
+            self.__under_treatment[animal.id] = animal
+        else:
+            self.__active_counts.pop(animal.id, None)
+            self.__under_treatment.pop(animal.id, None)
+
+    def __vets(self, animal: Animal) -> tuple:
+        """The veterinarians of this zoo assigned to an animal, in assignment order."""
+        vets = self.__vets_by_animal.get(animal.id)
+        if vets is None:
+            return ()
+        return vets if isinstance(vets, tuple) else (vets,)
+
+    def __index_vet(self, animal: Animal, vet: Veterinarian) -> None:
+        vets = self.__vets(animal)
+        if not any(v is vet for v in vets):
+            self.__vets_by_animal[animal.id] = (*vets, vet) if vets else vet
+
+    def __unindex_vet(self, animal: Animal, vet: Veterinarian) -> None:
+        vets = tuple(v for v in self.__vets(animal) if v is not vet)
+        if not vets:
+            self.__vets_by_animal.pop(animal.id, None)
+        else:
+            self.__vets_by_animal[animal.id] = vets if len(vets) > 1 else vets[0]
+
+    def __held_elsewhere(self, record: HealthRecord, vet: Veterinarian) -> bool:
+        """True if another veterinarian of this zoo also stores the record (so it is indexed once)."""
+        return any(o is not vet and o in self.__staff for o in record._owner_list())
+
+    def __vet_changed(self, vet: Veterinarian, item, change: str) -> None:
+        """Keep the record and assignment indexes in step with a veterinarian."""
+        with self.__index_lock:
+            if change == "added":
+                if not self.__held_elsewhere(item, vet):
+                    self.__index_record(item)
+            elif change == "removed":
+                if not self.__held_elsewhere(item, vet):
+                    self.__unindex_record(item)
+            elif change == "closed":
+                # Every owner reports the close; count it once, from the first
+                holders = [o for o in item._owner_list() if o in self.__staff]
+                if holders and holders[0] is vet:
+                    self.__count_active(item.animal, -1)
+            elif change == "assigned":
+                self.__index_vet(item, vet)
+            elif change == "unassigned":
+                self.__unindex_vet(item, vet)
+
     def get_health_records_for_animal(self, animal: Animal) -> list[HealthRecord]:
         """
-        Collect all health records for a given animal across all veterinarians.
+        Collect all health records for a given animal across all veterinarians,
+        oldest first.
         """
         if animal not in self.__animals:
             raise ValueError("Animal does not belong to this zoo.")
 
-        all_records: list[HealthRecord] = []
-        for staff_member in self.__staff:
-            if isinstance(staff_member, Veterinarian):
-                records = staff_member.get_records(animal)
-                all_records.extend(records)
+        with self.__index_lock:
+            records = self.__animal_records(animal)
+        if not records:
+            self.sink.emit(
+                "records_missing", "No records found for {} ({}).\n", animal.name, animal.species
+            )
+            return []
 
-        if not all_records:
-            print(f"No records found for {animal.name} ({animal.species}).\n")
+        return list(records)
 
-        return all_records
+    def records_between(self, start, end) -> list[HealthRecord]:
+        """
+        Return the records reported from start to end (inclusive), oldest first.
+
+        start and end are DD/MM/YYYY strings or datetime.date objects.
+        """
+        first, last = self.__day_number(start, "start"), self.__day_number(end, "end")
+        with self.__index_lock:
+            records = self.__sorted_records()
+            lo = bisect_left(self.__record_days, first)
+            hi = bisect_right(self.__record_days, last)
+            return records[lo:hi]
+
+    def latest_record_for(self, animal: Animal) -> HealthRecord | None:
+        """Return the most recently reported record for an animal, or None."""
+        if animal not in self.__animals:
+            raise ValueError("Animal does not belong to this zoo.")
+        with self.__index_lock:
+            records = self.__animal_records(animal)
+        return records[-1] if records else None
+
+    @staticmethod
+    def __day_number(value, name: str) -> int:
+        day = helper.day_number(value)
+        if day is None:
+            raise ValueError(f"{name} must be a DD/MM/YYYY string or a date.")
+        return day
+
+    def vets_for(self, animal: Animal) -> list[Veterinarian]:
+        """Return the veterinarians in this zoo assigned to an animal."""
+        return list(self.__vets(animal))
+
+    def get_animals_under_treatment(self) -> list[Animal]:
+        """Return the animals in this zoo that have at least one active record."""
+        return [a for a in self.__under_treatment.values() if a in self.__animals]
 
     def animal_under_treatment(self):
-        under_treatment = []
-        for animal in self.__animals:
-            records = self.get_health_records_for_animal(animal)
-            if any(r.active for r in records):
-                under_treatment.append(animal)
-                print(f"{animal.name} ({animal.species}) is under treatment.")
+        """Print and return the animals that are currently under treatment."""
+        under_treatment = self.get_animals_under_treatment()
+        for animal in under_treatment:
+            print(f"{animal.name} ({animal.species}) is under treatment.")
 
         if not under_treatment:
             print("No animal is under treatment.")
@@ -171,28 +678,118 @@ class Zoo:
         """Ask all zookeepers to feed their assigned enclosures."""
         for staff_member in self.__staff:
             if isinstance(staff_member, Zookeeper):
-                print(f"Zookeeper {staff_member.name} is feeding assigned enclosures...")
+                self.sink.emit(
+                    "feeding_started", "Zookeeper {} is feeding assigned enclosures...", staff_member.name
+                )
                 staff_member.perform_task("feed")
 
     def schedule_daily_cleaning(self) -> None:
         """Ask all zookeepers to clean their assigned enclosures."""
         for staff_member in self.__staff:
             if isinstance(staff_member, Zookeeper):
-                print(f"Zookeeper {staff_member.name} is cleaning assigned enclosures...")
+                self.sink.emit(
+                    "cleaning_started", "Zookeeper {} is cleaning assigned enclosures...", staff_member.name
+                )
                 staff_member.perform_task("clean")
 
-    def schedule_daily_health_checks(self) -> None:
-        """Ask all veterinarians to perform health checks."""
-        for staff_member in self.__staff:
-            if isinstance(staff_member, Veterinarian):
-                print(f"Veterinarian {staff_member.name} is checking assigned animals...")
-                staff_member.perform_task("health check")
+    def schedule_daily_health_checks(self, policy=None) -> None:
+        """
+        Ask all veterinarians to perform health checks.
 
-    def run_full_daily_schedule(self) -> None:
+        With a policy (see decisions.py) the checks run unattended: it
+        decides which sick animals get a record, instead of the operator.
+        """
+        # New health records take their ids from this zoo's generator
+        with self.id_scope():
+            for staff_member in self.__staff:
+                if isinstance(staff_member, Veterinarian):
+                    self.sink.emit(
+                        "health_checks_started", "Veterinarian {} is checking assigned animals...", staff_member.name
+                    )
+                    if policy is None:
+                        staff_member.perform_task("health check")
+                    else:
+                        staff_member.health_check(policy)
+
+    def run_full_daily_schedule(self, policy=None) -> None:
         """Run a full daily routine in order."""
         self.schedule_daily_feeding()
         self.schedule_daily_cleaning()
-        self.schedule_daily_health_checks()
+        self.schedule_daily_health_checks(policy)
+
+    async def arun_full_daily_schedule(self, source=None, timeout: float | None = None, default=None) -> list[HealthRecord]:
+        """
+        Run a full daily routine with every veterinarian's ahealth_check running at once.
+        Return the new health records, in staff order.
+        """
+        import asyncio
+
+        # Without a source the operator is asked at the console
+        if source is None:
+            source = decisions.ConsoleDecisions()
+        self.schedule_daily_feeding()
+        self.schedule_daily_cleaning()
+
+        vets = [s for s in self.__staff if isinstance(s, Veterinarian)]
+        for vet in vets:
+            self.sink.emit("health_checks_started", "Veterinarian {} is checking assigned animals...", vet.name)
+        # New health records take their ids from this zoo's generator;
+        # each check's task copies the context while the scope is active
+        with self.id_scope():
+            results = await asyncio.gather(
+                *(v.ahealth_check(source, timeout, default) for v in vets), return_exceptions=True
+            )
+        # Invalid decisions were already skipped inside each check. Any other
+        # error waits until every check has finished, so the other checks
+        # keep their records, and the first in staff order is raised.
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return [record for records in results for record in records]
+
+    def run_concurrent_daily_schedule(self, max_workers: int | None = None, policy=None) -> None:
+        """
+        Run a full daily routine with each staff member's task on a thread pool.
+        Without a policy the operator is asked one question at a time.
+        """
+        keepers = [s for s in self.__staff if isinstance(s, Zookeeper)]
+        vets = [s for s in self.__staff if isinstance(s, Veterinarian)]
+        # Questions to the operator take locks.CONSOLE_LOCK, so they never interleave
+        check = "health check" if policy is None else (lambda vet: vet.health_check(policy))
+        # Each phase finishes before the next starts. Enclosures and animals
+        # lock their own state and a feeding visit only lowers the clean level
+        # by one, so the end state does not depend on thread timing. The first
+        # error of a phase (in staff order) is raised once that phase has
+        # finished, and later phases are not run.
+        # New health records take their ids from this zoo's generator
+        with self.id_scope():
+            run_concurrently(
+                [
+                    [(k, "feed") for k in keepers],
+                    [(k, "clean") for k in keepers],
+                    [(v, check) for v in vets],
+                ],
+                max_workers,
+            )
+
+    def run_batch_daily_schedule(self, use_numpy: bool | None = None, policy=None) -> int:
+        """
+        Run a full daily routine with feeding and cleaning applied in one batch (see scheduler.BatchDay).
+        Return how many animals became sick during feeding.
+        """
+        # Ends in the same state as run_full_daily_schedule, with one summary
+        # event per round instead of one per animal
+        keepers = [s for s in self.__staff if isinstance(s, Zookeeper)]
+        day = self.__batch_day
+        if (
+            day is None
+            or (use_numpy is not None and day.uses_numpy != use_numpy)
+            or not day.is_current(keepers)
+        ):
+            day = self.__batch_day = BatchDay(keepers, use_numpy)
+        sick = day.run(self.sink)
+        self.schedule_daily_health_checks(policy)
+        return sick
 
 
     def __str__(self):
@@ -203,6 +800,3 @@ class Zoo:
             f"Number of animals: {len(self.__animals)}\n"
             f"Number of enclosures: {len(self.__enclosures)}\n"
         )
-
-zoo = Zoo("Sydney Wildlife")
-zoo.run_full_daily_schedule()
\ No newline at end of file
@@ -27,18 +27,22 @@ class Zookeeper(Staff):
             raise ValueError(f"Cannot perform task '{value}'.")
 
         # Edge case: no enclosures assigned
-        if not self.assigned_enclosure:
+        if not self._assigned_enclosure:
             raise RuntimeError("No enclosures assigned to this zookeeper.")
 
+        sink = self._events()
+
         if task == "clean":
-            for enc in self.assigned_enclosure:
+            for enc in self._assigned_enclosure:
                 enc.clean_enclosure()
-                print(f"Cleaned {enc.environment} enclosure.")
+                if sink.enabled:
+                    sink.emit("enclosure_cleaned_by", "Cleaned {} enclosure.", enc.environment)
             return
 
         if task == "feed":
-            for enc in self.assigned_enclosure:
-                for animal in enc.animals:
-                    print(f"Feeding {animal.name}...")
+            for enc in self._assigned_enclosure:
+                if sink.enabled:
+                    for animal in enc.animals:
+                        sink.emit("animal_fed", "Feeding {}...", animal.name)
                 enc.decrease_cleanliness()
-            print("Fed all assigned enclosures.")
+            sink.emit("feeding_done", "Fed all assigned enclosures.")